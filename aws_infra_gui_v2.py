@@ -6,15 +6,17 @@ import os
 print("os imported")
 import logging
 print("logging imported")
+import threading
 from typing import Optional
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget,
     QVBoxLayout, QStatusBar, QMenuBar, QMenu, QAction, QLabel,
-    QListWidget, QFormLayout, QListWidgetItem, QPushButton, QHBoxLayout, QFileDialog, QInputDialog, QMessageBox, QTextEdit, QDialog, QDialogButtonBox, QLineEdit, QComboBox, QSpinBox, QGroupBox, QCheckBox, QPlainTextEdit
+    QListWidget, QListView, QFormLayout, QListWidgetItem, QPushButton, QHBoxLayout, QFileDialog, QInputDialog, QMessageBox, QTextEdit, QDialog, QDialogButtonBox, QLineEdit, QComboBox, QSpinBox, QGroupBox, QCheckBox, QPlainTextEdit, QProgressBar
 )
 print("PyQt5 imported")
-from PyQt5.QtCore import Qt, QTimer, QEvent, QThread, pyqtSignal, QObject
+from PyQt5.QtCore import Qt, QTimer, QEvent, QThread, QThreadPool, QRunnable, pyqtSignal, QObject, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QItemSelectionModel, QSignalBlocker
 from PyQt5.QtGui import QKeySequence, QPixmap
+from PyQt5 import sip
 from botocore.exceptions import ClientError
 from scripts.ec2_manager import EC2Manager
 print("EC2Manager imported")
@@ -28,14 +30,28 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 print("matplotlib FigureCanvas imported")
 import matplotlib.pyplot as plt
 print("matplotlib.pyplot imported")
+from matplotlib.figure import Figure
+import numpy as np
 import boto3
 from botocore.exceptions import ClientError as BotoClientError
-from scripts.utils import get_client, get_rds_metrics, get_cloudfront_metrics, get_cost_explorer_data
+from scripts.utils import get_client, get_rds_metrics_batch, get_cloudfront_metrics, get_cost_explorer_data, get_custom_cloudwatch_metrics_batch
 import json
+import hashlib
+try:
+    import orjson  # optional, speeds up list export/import
+except ImportError:
+    orjson = None
+import re
 from datetime import datetime, timedelta
 import importlib.util
 import glob
 import tempfile
+from contextlib import contextmanager
+from collections import OrderedDict
+from enum import Enum
+from types import GeneratorType
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from graphviz import Digraph
 from cryptography.fernet import Fernet
 
@@ -99,6 +115,155 @@ QTabBar::tab:selected {
 # Global error log for export
 ERROR_LOG = []
 
+# key=value pairs in custom metric dimensions, e.g. "Name=InstanceId,Value=i-xxxx"
+_DIM_RE = re.compile(r'([^=,;\s][^=,;]*?)\s*=\s*([^,;]*)')
+
+# Model data role holding case-folded text for list filtering
+FILTER_ROLE = Qt.UserRole + 1
+
+class CacheKey(str, Enum):
+    """Names of the BaseTab cache entries; per-resource entries are (CacheKey, id) tuples."""
+    EC2_INSTANCES = 'ec2_instances'
+    EC2_INSTANCE = 'ec2_instance'
+    VOLUMES_BY_INSTANCE = 'volumes_by_instance'
+    S3_BUCKETS = 's3_buckets'
+    S3_OBJECTS = 's3_objects'
+    LAMBDA_FUNCTIONS = 'lambda_functions'
+    LAMBDA_FUNCTION = 'lambda_function'
+    IAM_USER_COUNT = 'iam_user_count'
+    IAM_SNAPSHOT = 'iam_snapshot'
+    IAM_PROFILES = 'iam_profiles'
+    IAM_ROLE = 'iam_role'
+    IAM_PROFILE = 'iam_profile'
+    CUSTOM_METRICS_BATCH = 'custom_metrics_batch'
+    RDS_INSTANCES = 'rds_instances'
+
+ENCRYPTION_KEY_PATH = os.path.join(os.path.expanduser('~'), '.aws_infra_key')
+IDENTITY_CACHE_TTL = 60  # seconds a validated caller identity is reused
+PROFILES_PATH = os.path.join(os.path.expanduser('~'), '.aws_infra_profiles.json')
+
+@lru_cache(maxsize=1)
+def get_fernet():
+    """Return the Fernet cipher for locally stored secrets, reading or creating the key once."""
+    if os.path.exists(ENCRYPTION_KEY_PATH):
+        with open(ENCRYPTION_KEY_PATH, 'rb') as f:
+            key = f.read()
+    else:
+        key = Fernet.generate_key()
+        with open(ENCRYPTION_KEY_PATH, 'wb') as f:
+            f.write(key)
+    return Fernet(key)
+
+@lru_cache(maxsize=None)
+def shared_manager(manager_class):
+    """Return the one manager of manager_class shared by every tab.
+    
+    Clients already come from get_client's cache, but each EC2Manager and
+    S3Manager also builds a boto3 resource with its own client, connection
+    pool and parsed service model.
+    """
+    return manager_class()
+
+ABOUT_TEXT = "AWS Infrastructure Manager version 1.0.0. Built using Python and PyQt5"
+
+# Independent AWS round trips (dashboard counts, EC2 detail panes) run side by side
+FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='aws-fanout')
+FANOUT_TIMEOUT = 30  # seconds
+# EC2 detail panes get their own threads so a slow dashboard tick cannot queue them
+DETAIL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='aws-detail')
+# Background tab loads share a fixed set of pool threads instead of
+# starting a QThread per request
+WORKER_POOL_SIZE = 8
+
+CHART_LABELS = ('EC2', 'S3', 'Lambda', 'IAM')
+CHART_COLORS_LIGHT = ('#4e79a7', '#f28e2b', '#e15759', '#76b7b2')
+CHART_COLORS_DARK = ('#6baed6', '#fd8d3c', '#fc9272', '#9ecae1')
+
+VOLUME_DETAILS_TEMPLATE = (
+    "Volume ID: {VolumeId}\n"
+    "State: {State}\n"
+    "Size: {Size} GB\n"
+    "Type: {VolumeType}\n"
+    "IOPS: {Iops}\n"
+    "Encrypted: {Encrypted}\n"
+    "Attached to: {Attached}"
+)
+
+def format_function_details(config):
+    """Render a Lambda function configuration for the details pane."""
+    return (
+        f"Function Name: {config['FunctionName']}\n"
+        f"Runtime: {config['Runtime']}\n"
+        f"Handler: {config['Handler']}\n"
+        f"Memory Size: {config['MemorySize']} MB\n"
+        f"Timeout: {config['Timeout']} seconds\n"
+        f"Last Modified: {config['LastModified']}\n"
+        f"Role: {config['Role']}\n"
+        f"Description: {config.get('Description', 'N/A')}"
+    )
+
+@contextmanager
+def batched_updates(view):
+    """Suspend repaints and signals on a view while it is repopulated."""
+    view.setUpdatesEnabled(False)
+    was_blocked = view.blockSignals(True)
+    try:
+        yield
+    finally:
+        view.blockSignals(was_blocked)
+        view.setUpdatesEnabled(True)
+
+def _set_label_text(label, text):
+    """Set a label's text only when it changed, avoiding a relayout."""
+    if label.text() != text:
+        label.setText(text)
+
+def _visible_texts(view):
+    """Yield the text of each row of a QListWidget that is not filtered out."""
+    for i in range(view.count()):
+        item = view.item(i)
+        if not item.isHidden():
+            yield item.text()
+
+# List exports are JSON Lines: one JSON value per line, streamed both ways
+EXPORT_SAVE_FILTER = "JSON Lines (*.jsonl)"
+EXPORT_OPEN_FILTER = "Exports (*.jsonl *.json)"
+
+def _json_line(value):
+    """Encode value as one compact UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(value, separators=(',', ':')) + '\n').encode('utf-8')
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _write_jsonl(file_path, values):
+    """Write values to file_path one JSON value per line and return how many were written."""
+    count = 0
+    with open(file_path, 'wb', buffering=1 << 20) as f:
+        for value in values:
+            f.write(_json_line(value))
+            count += 1
+    return count
+
+def _read_jsonl(file_path):
+    """Load a JSON Lines export, also accepting the older single JSON array format."""
+    with open(file_path, 'rb') as f:
+        if f.read(1) == b'[':
+            f.seek(0)
+            return _json_loads(f.read())
+        f.seek(0)
+        return [_json_loads(line) for line in f if line.strip()]
+
+def _copy_exception(error):
+    """Return a new exception equivalent to error, without its traceback."""
+    if isinstance(error, ClientError):
+        return ClientError(error.response, error.operation_name)
+    try:
+        return type(error)(*error.args)
+    except Exception:
+        return RuntimeError(str(error))
+
 class StatusBar(QStatusBar):
     def __init__(self):
         super().__init__()
@@ -109,12 +274,49 @@ class StatusBar(QStatusBar):
 
 class BaseTab(QWidget):
     """Base class for all tabs to provide common functionality."""
+    # The cache is shared by every tab so a write in one tab (e.g. EC2Tab
+    # clearing CacheKey.EC2_INSTANCES) also invalidates what the dashboard shows.
+    # Entries are key -> (timestamp, generation, value) in LRU order.
+    _cache = OrderedDict()
+    _cache_max = 1024
+    _cache_generation = 0
+    _cache_timeout = 300  # 5 minutes
+    # Per-key overrides of _cache_timeout, in seconds
+    _cache_ttls = {
+        CacheKey.EC2_INSTANCES: 120,
+        CacheKey.S3_BUCKETS: 120,
+        CacheKey.LAMBDA_FUNCTIONS: 120,
+        CacheKey.IAM_USER_COUNT: 120,
+        CacheKey.VOLUMES_BY_INSTANCE: 60,
+        CacheKey.EC2_INSTANCE: 60,
+        CacheKey.S3_OBJECTS: 60,
+        CacheKey.LAMBDA_FUNCTION: 60,
+        CacheKey.RDS_INSTANCES: 60,
+    }
+    # Keys with a stale-while-revalidate refresh in flight, mapped to a token
+    # identifying that refresh
+    _revalidating = {}
+    # Fetches that came back empty (None) or failed are remembered briefly so
+    # repeated clicks on a missing or failing resource do not repeat the call
+    _negative_ttl = 5
+    _failures = {}  # key -> (timestamp, generation, exception)
+
     def __init__(self):
         super().__init__()
         self._status_bar = None
-        self._cache = {}
-        self._cache_timeout = 300  # 5 minutes
-        self._last_cache_update = {}
+        self._initialized = False
+        self._workers = set()
+
+    def showEvent(self, event):
+        """Run the tab's initial load the first time it becomes visible."""
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            self.initial_load()
+
+    def initial_load(self):
+        """Fetch the tab's first batch of data. Override in subclasses."""
+        pass
 
     def set_status_bar(self, status_bar):
         """Set the status bar reference."""
@@ -134,35 +336,189 @@ class BaseTab(QWidget):
             logger.error(message)
             ERROR_LOG.append(f"{datetime.now()}: {message}")
 
-    def get_cached_data(self, key, fetch_func, force_refresh=False):
-        """Get data from cache or fetch if not available or expired."""
-        current_time = time.time()
-        
-        if (not force_refresh and 
-            key in self._cache and 
-            key in self._last_cache_update and
-            current_time - self._last_cache_update[key] < self._cache_timeout):
-            return self._cache[key]
+    def _cache_ttl(self, key):
+        """Return the TTL for key; tuple keys use the override of their first element."""
+        name = key[0] if isinstance(key, tuple) else key
+        return self._cache_ttls.get(name, self._cache_timeout)
+
+    def _fresh_entry(self, key):
+        """Return the cache entry for key if it is from the current generation and within its TTL."""
+        entry = self._cache.get(key)
+        if entry is None or entry[1] != BaseTab._cache_generation:
+            return None
+        ttl = self._negative_ttl if entry[2] is None else self._cache_ttl(key)
+        if time.monotonic() - entry[0] < ttl:
+            self._cache.move_to_end(key)
+            return entry
+        return None
+
+    def get_cached_data(self, key, fetch_func, force_refresh=False, stale_while_revalidate=False):
+        """Get data from cache or fetch if not available or expired.
+        
+        With stale_while_revalidate, an entry less than twice its TTL old is
+        returned at once while a background fetch refreshes it.
+        """
+        if not force_refresh:
+            entry = self._fresh_entry(key)
+            if entry is not None:
+                return entry[2]
+            failure = BaseTab._failures.get(key)
+            if (failure is not None and failure[1] == BaseTab._cache_generation and
+                    time.monotonic() - failure[0] < self._negative_ttl):
+                # A fresh exception each time, so replays do not grow one traceback
+                raise _copy_exception(failure[2])
+            entry = self._cache.get(key)
+            if (stale_while_revalidate and entry is not None and
+                    entry[1] == BaseTab._cache_generation and
+                    time.monotonic() - entry[0] < 2 * self._cache_ttl(key)):
+                self._revalidate(key, fetch_func)
+                return entry[2]
             
         try:
             data = fetch_func()
-            self._cache[key] = data
-            self._last_cache_update[key] = current_time
+            self.set_cached_data(key, data)
             return data
         except Exception as e:
             self.log_message(f"Error fetching data for {key}: {str(e)}", error=True)
-            if key in self._cache:
-                return self._cache[key]  # Return stale data if available
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == BaseTab._cache_generation:
+                return entry[2]  # Return stale data if available
+            BaseTab._failures[key] = (time.monotonic(), BaseTab._cache_generation, e)
             raise
 
+    def _revalidate(self, key, fetch_func):
+        """Refresh a stale cache entry in the background, at most once per key at a time."""
+        if key in BaseTab._revalidating:
+            return
+        token = BaseTab._revalidating[key] = object()
+        
+        def store(data):
+            # Drop results for keys invalidated while the fetch was running
+            if BaseTab._revalidating.get(key) is token:
+                del BaseTab._revalidating[key]
+                self.set_cached_data(key, data)
+                
+        def failed(e):
+            if BaseTab._revalidating.get(key) is token:
+                del BaseTab._revalidating[key]
+            self.log_message(f"Error refreshing data for {key}: {str(e)}", error=True)
+            
+        self.run_in_background(fetch_func, store, failed)
+
+    def peek_cached_data(self, key):
+        """Return cached data if present and fresh, without fetching."""
+        entry = self._fresh_entry(key)
+        return entry[2] if entry is not None else None
+
+    def set_cached_data(self, key, data):
+        """Store already-fetched data in the cache, evicting the least recently used entry when full."""
+        self._cache[key] = (time.monotonic(), BaseTab._cache_generation, data)
+        self._cache.move_to_end(key)
+        BaseTab._failures.pop(key, None)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
     def clear_cache(self, key=None):
-        """Clear cached data for a specific key or all keys."""
+        """Clear cached data for a specific key, or invalidate every key.
+        
+        Invalidating everything only bumps the cache generation; entries
+        from older generations are treated as misses and overwritten lazily.
+        """
         if key:
             self._cache.pop(key, None)
-            self._last_cache_update.pop(key, None)
+            BaseTab._revalidating.pop(key, None)
+            BaseTab._failures.pop(key, None)
         else:
-            self._cache.clear()
-            self._last_cache_update.clear()
+            BaseTab._cache_generation += 1
+            BaseTab._revalidating.clear()
+            BaseTab._failures.clear()
+
+    def run_in_background(self, fn, on_result, on_error=None):
+        """Run fn on a worker thread and deliver its outcome on the GUI thread.
+        
+        Results that arrive after the tab has been destroyed are dropped.
+        """
+        worker = AsyncWorker(fn)
+        self._workers.add(worker)
+        
+        def deliver(callback, value):
+            worker.wait()
+            self._workers.discard(worker)
+            if sip.isdeleted(self):
+                return
+            callback(value)
+            
+        worker.finished.connect(lambda result: deliver(on_result, result))
+        worker.error.connect(lambda e: deliver(on_error or self._on_background_error, e))
+        worker.start()
+        return worker
+
+    def export_in_background(self, file_path, values, noun):
+        """Write a snapshot of values to file_path as JSON on a worker thread."""
+        values = list(values)
+        self.run_in_background(
+            lambda: _write_jsonl(file_path, values),
+            lambda count: self.show_info_dialog("Export", f"Exported {count} {noun} to {file_path}"),
+            lambda e: self.show_error_dialog("Export", f"Failed to export {noun}: {str(e)}"))
+
+    def import_in_background(self, file_path, noun):
+        """Read a JSON export on a worker thread and report how many entries it holds."""
+        self.run_in_background(
+            lambda: _read_jsonl(file_path),
+            lambda data: self.show_info_dialog("Import", f"Imported {len(data)} {noun} from {file_path}\n(Import does not create resources)"),
+            lambda e: self.show_error_dialog("Import", f"Failed to import {noun}: {str(e)}"))
+
+    def set_buttons_enabled(self, buttons, enabled):
+        """Toggle a group of buttons with a single repaint."""
+        self.setUpdatesEnabled(False)
+        try:
+            for button in buttons:
+                button.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def cancel_background_work(self, timeout=200):
+        """Cancel in-flight background calls, waiting briefly for each to stop."""
+        for worker in list(self._workers):
+            worker.cancel()
+            worker.wait(timeout)
+        self._workers.clear()
+
+    def closeEvent(self, event):
+        self.cancel_background_work()
+        super().closeEvent(event)
+
+    def create_debounce_timer(self, slot, interval=150, parent=None):
+        """Create a single-shot timer that coalesces bursts of calls into one slot call."""
+        timer = QTimer(parent or self)
+        timer.setSingleShot(True)
+        timer.setInterval(interval)
+        timer.timeout.connect(slot)
+        return timer
+
+    def _on_background_error(self, e):
+        self.show_error_dialog("Error", str(e))
+
+    def build_form_dialog(self, title, rows):
+        """Build an OK/Cancel form dialog from (label, widget) rows.
+        
+        Tabs keep the returned dialog and reuse it on every invocation,
+        resetting the field widgets before each exec_().
+        """
+        dialog = QDialog(self)
+        dialog.setWindowTitle(title)
+        layout = QFormLayout()
+        
+        for label, widget in rows:
+            layout.addRow(label, widget)
+            
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        
+        layout.addRow(buttons)
+        dialog.setLayout(layout)
+        return dialog
 
     def validate_input(self, value, field_name, custom_validator=None):
         """Validate user input with optional custom validation."""
@@ -202,16 +558,20 @@ class DashboardTab(BaseTab):
         super().__init__()
         self.setWindowTitle("Dashboard")
         self._is_loading = False
-        self.ec2_manager = EC2Manager()
-        self.s3_manager = S3Manager()
-        self.lambda_manager = LambdaManager()
-        self.iam_manager = IAMManager()
+        self.ec2_manager = shared_manager(EC2Manager)
+        self.s3_manager = shared_manager(S3Manager)
+        self.lambda_manager = shared_manager(LambdaManager)
+        self.iam_manager = shared_manager(IAMManager)
         self.custom_metrics = []  # Store user-defined custom metrics
+        self._custom_batch_loading = False
+        self._theme_cache = None
+        self._last_counts = None  # (ec2, s3, lambda, iam, theme) last drawn
+        # Charts are built on first show; see initial_load
+        self.canvas = self.bar_canvas = self.custom_canvas = None
         self.refresh_interval = 30  # seconds
         self.setup_ui()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.refresh_counts)
-        self.timer.start(self.refresh_interval * 1000)
 
     def setup_ui(self) -> None:
         layout = QVBoxLayout()
@@ -226,14 +586,12 @@ class DashboardTab(BaseTab):
         layout.addWidget(self.s3_label)
         layout.addWidget(self.lambda_label)
         layout.addWidget(self.iam_label)
-        # Add matplotlib pie chart
-        self.figure, self.ax = plt.subplots(figsize=(4, 3))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
-        # Add matplotlib bar chart
-        self.bar_figure, self.bar_ax = plt.subplots(figsize=(4, 3))
-        self.bar_canvas = FigureCanvas(self.bar_figure)
-        layout.addWidget(self.bar_canvas)
+        self.refresh_counts_button = QPushButton("Refresh")
+        self.refresh_counts_button.clicked.connect(lambda: self.refresh_counts(force_refresh=True))
+        layout.addWidget(self.refresh_counts_button)
+        # Pie and bar charts are added here on first show
+        self._charts_layout = QVBoxLayout()
+        layout.addLayout(self._charts_layout)
         self.start_all_ec2_button = QPushButton("Start All EC2 Instances")
         self.start_all_ec2_button.clicked.connect(self.start_all_ec2_instances)
         layout.addWidget(self.start_all_ec2_button)
@@ -258,13 +616,34 @@ class DashboardTab(BaseTab):
         self.custom_metrics_list = QListWidget()
         self.custom_metrics_list.itemSelectionChanged.connect(self.display_custom_metric)
         custom_layout.addWidget(self.custom_metrics_list)
-        self.custom_figure, self.custom_ax = plt.subplots(figsize=(4, 2))
-        self.custom_canvas = FigureCanvas(self.custom_figure)
-        custom_layout.addWidget(self.custom_canvas)
+        self._custom_chart_layout = QVBoxLayout()
+        custom_layout.addLayout(self._custom_chart_layout)
         custom_group.setLayout(custom_layout)
         layout.addWidget(custom_group)
         self.setLayout(layout)
-        self.refresh_counts()  # Now called after all widgets are created
+
+    def initial_load(self):
+        self._create_charts()
+        self.refresh_counts()
+        self.timer.start(self.refresh_interval * 1000)
+
+    def _create_charts(self):
+        """Build the matplotlib figures, deferred until the tab is first shown."""
+        self._last_counts = None
+        self._bar_artists = None  # (layout, bars, annotations) kept across redraws
+        self._custom_line = None
+        self.figure = Figure(figsize=(4, 3), layout='constrained')
+        self.ax = self.figure.add_subplot()
+        self.canvas = FigureCanvas(self.figure)
+        self._charts_layout.addWidget(self.canvas)
+        self.bar_figure = Figure(figsize=(4, 3), layout='constrained')
+        self.bar_ax = self.bar_figure.add_subplot()
+        self.bar_canvas = FigureCanvas(self.bar_figure)
+        self._charts_layout.addWidget(self.bar_canvas)
+        self.custom_figure = Figure(figsize=(4, 2), layout='constrained')
+        self.custom_ax = self.custom_figure.add_subplot()
+        self.custom_canvas = FigureCanvas(self.custom_figure)
+        self._custom_chart_layout.addWidget(self.custom_canvas)
 
     def on_interval_changed(self, val):
         self.refresh_interval = val
@@ -280,16 +659,14 @@ class DashboardTab(BaseTab):
             self.show_error_dialog("Validation Error", "Namespace, Metric Name, and Statistic are required.")
             return
         dims_list = []
-        if dims:
-            for d in dims.split(';'):
-                parts = d.split(',')
-                dim = {}
-                for p in parts:
-                    if '=' in p:
-                        k, v = p.split('=', 1)
-                        dim[k.strip()] = v.strip()
-                if dim:
-                    dims_list.append(dim)
+        for chunk in dims.split(';'):
+            if not chunk.strip():
+                continue
+            dim = {k: v.strip() for k, v in _DIM_RE.findall(chunk)}
+            if not dim or not all(dim.values()):
+                self.show_error_dialog("Validation Error", f"Invalid dimensions: {chunk.strip()}")
+                return
+            dims_list.append(dim)
         query = {
             'namespace': ns,
             'metric_name': metric,
@@ -298,115 +675,225 @@ class DashboardTab(BaseTab):
             'stat': stat
         }
         self.custom_metrics.append(query)
+        # The batch covers every query, so it is stale as soon as one is added
+        self.clear_cache(CacheKey.CUSTOM_METRICS_BATCH)
+        self._cache_ttls[CacheKey.CUSTOM_METRICS_BATCH] = min(q['period'] for q in self.custom_metrics)
         self.custom_metrics_list.addItem(f"{ns}/{metric} [{stat}]")
         self.log_message(f"Added custom metric: {ns}/{metric} [{stat}]")
         self.display_custom_metric()
 
     def display_custom_metric(self):
+        if self.custom_canvas is None:
+            return
         idx = self.custom_metrics_list.currentRow()
         if idx < 0 or idx >= len(self.custom_metrics):
             self.custom_ax.clear()
-            self.custom_canvas.draw()
+            self._custom_line = None
+            self.custom_canvas.draw_idle()
+            return
+        # One GetMetricData call serves every custom metric until the batch expires
+        results = self.peek_cached_data(CacheKey.CUSTOM_METRICS_BATCH)
+        if results is None:
+            self._load_custom_metrics_batch()
             return
         query = self.custom_metrics[idx]
-        from scripts.utils import get_custom_cloudwatch_metric
-        data = get_custom_cloudwatch_metric(
-            query['namespace'], query['metric_name'], query['dimensions'], query['period'], query['stat']
-        )
-        self.custom_ax.clear()
+        data = results[idx]
+        label = f"{query['metric_name']} [{query['stat']}]"
         if data:
-            data = sorted(data, key=lambda x: x['Timestamp'])
-            times = [d['Timestamp'] for d in data]
-            values = [d.get(query['stat'], 0) for d in data]
-            self.custom_ax.plot(times, values, label=f"{query['metric_name']} [{query['stat']}]")
+            # Build contiguous arrays in one pass; GetMetricData returns newest first
+            times = np.fromiter((int(d['Timestamp'].timestamp()) for d in data),
+                                dtype=np.int64, count=len(data)).astype('datetime64[s]')
+            values = np.fromiter((d.get(query['stat'], 0.0) for d in data),
+                                 dtype=np.float64, count=len(data))
+            order = np.argsort(times)
+            if self._custom_line is None:
+                # The first plot registers the date converter for later set_data calls
+                self._custom_line, = self.custom_ax.plot(times[order], values[order], label=label)
+            else:
+                self._custom_line.set_data(times[order], values[order])
+                self._custom_line.set_label(label)
+            self.custom_ax.relim()
+            self.custom_ax.autoscale_view()
             self.custom_ax.legend()
+        elif self._custom_line is not None:
+            self._custom_line.set_data([], [])
         self.custom_ax.set_title(f"Custom Metric: {query['namespace']}/{query['metric_name']}")
-        self.custom_figure.tight_layout()
-        self.custom_canvas.draw()
+        self.custom_canvas.draw_idle()
 
-    def refresh_counts(self) -> None:
-        """Refresh the resource counts on the dashboard."""
+    def _load_custom_metrics_batch(self):
+        """Fetch the custom metrics batch on a worker thread, then redraw the selection."""
+        if self._custom_batch_loading:
+            return
+        self._custom_batch_loading = True
+        queries = list(self.custom_metrics)
+        self.run_in_background(
+            lambda: get_custom_cloudwatch_metrics_batch(queries),
+            lambda results: self._on_custom_metrics_loaded(queries, results),
+            self._on_custom_metrics_error)
+
+    def _on_custom_metrics_loaded(self, queries, results):
+        self._custom_batch_loading = False
+        # A metric added meanwhile needs a batch that covers it
+        if len(queries) == len(self.custom_metrics):
+            self.set_cached_data(CacheKey.CUSTOM_METRICS_BATCH, results)
+        self.display_custom_metric()
+
+    def _on_custom_metrics_error(self, e):
+        self._custom_batch_loading = False
+        self.log_message(f"Error fetching custom metrics: {str(e)}", error=True)
+
+    def refresh_counts(self, force_refresh: bool = False) -> None:
+        """Refresh the resource counts on the dashboard.
+        
+        Cached listings are shown immediately; any misses are fetched on a
+        worker thread so the timer tick never blocks painting or input.
+        
+        Args:
+            force_refresh: Bypass cached counts and query AWS for all four
+        """
         if self._is_loading:
             return
+        fetchers = {
+            CacheKey.EC2_INSTANCES: self.ec2_manager.list_instances,
+            CacheKey.S3_BUCKETS: self.s3_manager.list_buckets,
+            CacheKey.LAMBDA_FUNCTIONS: self.lambda_manager.list_functions,
+            CacheKey.IAM_USER_COUNT: self.iam_manager.count_users,
+        }
+        values = {}
+        missing = {}
+        for key, fetch in fetchers.items():
+            cached = None if force_refresh else self.peek_cached_data(key)
+            if cached is None:
+                missing[key] = fetch
+            else:
+                values[key] = cached
+        if not missing:
+            self._apply_counts(values)
+            return
+            
         self._is_loading = True
         # Defensive: Only disable button if it exists
         if hasattr(self, 'start_all_ec2_button') and self.start_all_ec2_button:
             self.start_all_ec2_button.setEnabled(False)
-        try:
-            ec2_count = len(self.ec2_manager.list_instances())
-            s3_count = len(self.s3_manager.s3_client.list_buckets().get('Buckets', []))
-            lambda_count = len(self.lambda_manager.list_functions())
-            iam_count = len(self.iam_manager.iam_client.list_users().get('Users', []))
-            self.ec2_label.setText(f"Total EC2 Instances: {ec2_count}")
-            self.s3_label.setText(f"Total S3 Buckets: {s3_count}")
-            self.lambda_label.setText(f"Total Lambda Functions: {lambda_count}")
-            self.iam_label.setText(f"Total IAM Users: {iam_count}")
-            # Update pie and bar charts
-            self.update_pie_chart(ec2_count, s3_count, lambda_count, iam_count)
-            self.update_bar_chart(ec2_count, s3_count, lambda_count, iam_count)
-        except Exception as e:
-            self.log_message(f"Error refreshing counts: {str(e)}", error=True)
-            self.ec2_label.setText("Total EC2 Instances: Error")
-            self.s3_label.setText("Total S3 Buckets: Error")
-            self.lambda_label.setText("Total Lambda Functions: Error")
-            self.iam_label.setText("Total IAM Users: Error")
-            self.update_pie_chart(0, 0, 0, 0)
-            self.update_bar_chart(0, 0, 0, 0)
-        finally:
-            self._is_loading = False
-            if hasattr(self, 'start_all_ec2_button') and self.start_all_ec2_button:
-                self.start_all_ec2_button.setEnabled(True)
+        self.run_in_background(
+            lambda: self._fetch_counts(missing),
+            lambda fetched: self._on_counts_loaded(values, fetched),
+            self._on_counts_error
+        )
+
+    @staticmethod
+    def _fetch_counts(fetchers):
+        """Run the given listing calls concurrently; called on a worker thread.
+        
+        Throttled calls are retried by the shared client config, so the
+        wait is roughly the slowest call rather than the sum.
+        """
+        futures = {key: FANOUT_EXECUTOR.submit(fetch) for key, fetch in fetchers.items()}
+        return {key: future.result(timeout=FANOUT_TIMEOUT) for key, future in futures.items()}
+
+    def _finish_loading(self):
+        self._is_loading = False
+        if hasattr(self, 'start_all_ec2_button') and self.start_all_ec2_button:
+            self.start_all_ec2_button.setEnabled(True)
+
+    def _on_counts_loaded(self, values, fetched):
+        self._finish_loading()
+        for key, value in fetched.items():
+            self.set_cached_data(key, value)
+        values.update(fetched)
+        self._apply_counts(values)
+
+    def _on_counts_error(self, e):
+        self._finish_loading()
+        self.log_message(f"Error refreshing counts: {str(e)}", error=True)
+        self._last_counts = None
+        _set_label_text(self.ec2_label, "Total EC2 Instances: Error")
+        _set_label_text(self.s3_label, "Total S3 Buckets: Error")
+        _set_label_text(self.lambda_label, "Total Lambda Functions: Error")
+        _set_label_text(self.iam_label, "Total IAM Users: Error")
+        self.update_pie_chart(0, 0, 0, 0)
+        self.update_bar_chart(0, 0, 0, 0)
+
+    def _apply_counts(self, values):
+        ec2_count = len(values[CacheKey.EC2_INSTANCES])
+        s3_count = len(values[CacheKey.S3_BUCKETS])
+        lambda_count = len(values[CacheKey.LAMBDA_FUNCTIONS])
+        iam_count = values[CacheKey.IAM_USER_COUNT]
+        # Steady-state ticks usually return the same counts; skip the repaint
+        shown = (ec2_count, s3_count, lambda_count, iam_count, self._resolve_theme()[0])
+        if shown == self._last_counts:
+            return
+        self._last_counts = shown
+        _set_label_text(self.ec2_label, f"Total EC2 Instances: {ec2_count}")
+        _set_label_text(self.s3_label, f"Total S3 Buckets: {s3_count}")
+        _set_label_text(self.lambda_label, f"Total Lambda Functions: {lambda_count}")
+        _set_label_text(self.iam_label, f"Total IAM Users: {iam_count}")
+        # Update pie and bar charts
+        self.update_pie_chart(ec2_count, s3_count, lambda_count, iam_count)
+        self.update_bar_chart(ec2_count, s3_count, lambda_count, iam_count)
+
+    def _resolve_theme(self):
+        """Return (theme, colors, edge color) for the charts, memoized until the theme changes."""
+        if self._theme_cache is not None:
+            return self._theme_cache
+        win = self.window()
+        if getattr(win, 'current_theme', 'light') == 'dark':
+            resolved = ('dark', CHART_COLORS_DARK, '#f0f0f0')
+        else:
+            resolved = ('light', CHART_COLORS_LIGHT, '#232629')
+        # Only memoize once the tab is inside the main window
+        if hasattr(win, 'current_theme'):
+            self._theme_cache = resolved
+        return resolved
+
+    def apply_theme(self, theme):
+        """Drop the memoized palette and redraw the charts in the new theme."""
+        self._theme_cache = None
+        self._last_counts = None
+        self.refresh_counts()
 
     def update_pie_chart(self, ec2_count, s3_count, lambda_count, iam_count):
+        if self.canvas is None:
+            return
         self.ax.clear()
-        labels = ['EC2', 'S3', 'Lambda', 'IAM']
         sizes = [ec2_count, s3_count, lambda_count, iam_count]
-        colors_light = ['#4e79a7', '#f28e2b', '#e15759', '#76b7b2']
-        colors_dark = ['#6baed6', '#fd8d3c', '#fc9272', '#9ecae1']
-        parent = self.parentWidget()
-        theme = 'light'
-        if parent and hasattr(parent, 'window'):
-            win = parent.window()
-            if hasattr(win, 'current_theme'):
-                theme = win.current_theme
-        elif hasattr(self, 'window') and hasattr(self.window(), 'current_theme'):
-            theme = self.window().current_theme
-        colors = colors_dark if theme == 'dark' else colors_light
+        _, colors, edge_color = self._resolve_theme()
         if not any(sizes):
             self.ax.pie([1], labels=["No Data"], colors=['#cccccc'])
         else:
             self.ax.pie(
-                sizes, labels=labels, autopct='%1.0f', startangle=90, colors=colors, textprops={'color': '#f0f0f0' if theme == 'dark' else '#232629'}
+                sizes, labels=CHART_LABELS, autopct='%1.0f', startangle=90, colors=colors, textprops={'color': edge_color}
             )
         self.ax.axis('equal')
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def update_bar_chart(self, ec2_count, s3_count, lambda_count, iam_count):
-        self.bar_ax.clear()
-        labels = ['EC2', 'S3', 'Lambda', 'IAM']
+        if self.bar_canvas is None:
+            return
         counts = [ec2_count, s3_count, lambda_count, iam_count]
-        colors_light = ['#4e79a7', '#f28e2b', '#e15759', '#76b7b2']
-        colors_dark = ['#6baed6', '#fd8d3c', '#fc9272', '#9ecae1']
-        parent = self.parentWidget()
-        theme = 'light'
-        if parent and hasattr(parent, 'window'):
-            win = parent.window()
-            if hasattr(win, 'current_theme'):
-                theme = win.current_theme
-        elif hasattr(self, 'window') and hasattr(self.window(), 'current_theme'):
-            theme = self.window().current_theme
-        colors = colors_dark if theme == 'dark' else colors_light
-        bar_color = colors
-        edge_color = '#f0f0f0' if theme == 'dark' else '#232629'
+        _, bar_color, edge_color = self._resolve_theme()
+        layout = (bool(any(counts)), edge_color)
+        if self._bar_artists is not None and self._bar_artists[0] == layout:
+            # Same bars and colors as last time: move the existing artists
+            _, bars, notes = self._bar_artists
+            for bar, note, count in zip(bars, notes, counts):
+                bar.set_height(count)
+                note.xy = (bar.get_x() + bar.get_width() / 2, count)
+                note.set_text(f'{int(count)}')
+            self.bar_ax.relim()
+            self.bar_ax.autoscale_view()
+            self.bar_canvas.draw_idle()
+            return
+        self.bar_ax.clear()
+        notes = []
         if not any(counts):
-            self.bar_ax.bar(["No Data"], [1], color='#cccccc', edgecolor=edge_color)
+            bars = self.bar_ax.bar(["No Data"], [1], color='#cccccc', edgecolor=edge_color)
             self.bar_ax.set_ylabel('Resource Count', color=edge_color)
             self.bar_ax.set_title('Resource Counts', color=edge_color)
             self.bar_ax.tick_params(axis='x', colors=edge_color)
             self.bar_ax.tick_params(axis='y', colors=edge_color)
         else:
-            bars = self.bar_ax.bar(labels, counts, color=bar_color, edgecolor=edge_color)
+            bars = self.bar_ax.bar(CHART_LABELS, counts, color=bar_color, edgecolor=edge_color)
             self.bar_ax.set_ylabel('Resource Count', color=edge_color)
             self.bar_ax.set_title('Resource Counts', color=edge_color)
             self.bar_ax.tick_params(axis='x', colors=edge_color)
@@ -415,13 +902,13 @@ class DashboardTab(BaseTab):
                 spine.set_edgecolor(edge_color)
             for bar in bars:
                 height = bar.get_height()
-                self.bar_ax.annotate(f'{int(height)}',
+                notes.append(self.bar_ax.annotate(f'{int(height)}',
                     xy=(bar.get_x() + bar.get_width() / 2, height),
                     xytext=(0, 3),  # 3 points vertical offset
                     textcoords="offset points",
-                    ha='center', va='bottom', color=edge_color, fontsize=10)
-        self.bar_figure.tight_layout()
-        self.bar_canvas.draw()
+                    ha='center', va='bottom', color=edge_color, fontsize=10))
+        self._bar_artists = (layout, bars, notes)
+        self.bar_canvas.draw_idle()
 
     def start_all_ec2_instances(self) -> None:
         """Start all stopped EC2 instances."""
@@ -430,6 +917,7 @@ class DashboardTab(BaseTab):
 
         self._is_loading = True
         self.start_all_ec2_button.setEnabled(False)
+        started = False
         
         try:
             instances = self.ec2_manager.list_instances()
@@ -439,7 +927,8 @@ class DashboardTab(BaseTab):
                 success = self.ec2_manager.start_instance(stopped_instances)
                 if success:
                     self.log_message("All stopped EC2 instances started successfully.")
-                    self.refresh_counts()
+                    self.clear_cache(CacheKey.EC2_INSTANCES)
+                    started = True
                 else:
                     self.log_message("Failed to start some EC2 instances.", error=True)
             else:
@@ -449,22 +938,31 @@ class DashboardTab(BaseTab):
         finally:
             self._is_loading = False
             self.start_all_ec2_button.setEnabled(True)
-
-    def __del__(self) -> None:
-        """Cleanup resources when the tab is destroyed."""
-        try:
-            self.ec2_manager = None
-            self.s3_manager = None
-            self.lambda_manager = None
-            self.iam_manager = None
-        except Exception as e:
-            logger.error(f"Error during cleanup: {str(e)}")
+        if started:
+            self.refresh_counts()
+
+    def closeEvent(self, event):
+        """Stop polling and release the managers deterministically on close."""
+        self.timer.stop()
+        super().closeEvent(event)
+        self.ec2_manager = None
+        self.s3_manager = None
+        self.lambda_manager = None
+        self.iam_manager = None
 
 class EC2Tab(BaseTab):
     def __init__(self):
         super().__init__()
-        self.ec2_manager = EC2Manager()
+        self.ec2_manager = shared_manager(EC2Manager)
         self._is_loading = False
+        self._selected_instance_id = None
+        # Visible rows of instances_list keyed by id(), for filter diffing
+        self._shown_instances = {}
+        # DescribeInstances records from the last listing, kept out of the
+        # shared LRU so a large fleet cannot evict other tabs' entries
+        self._listed_details = {}
+        self._create_volume_dialog = None
+        self._create_instance_dialog = None
         self.worker = None
         self.setup_ui()
         
@@ -473,7 +971,9 @@ class EC2Tab(BaseTab):
         # Search bar
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search EC2 Instances...")
-        self.search_bar.textChanged.connect(self.filter_instances_list)
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = self.create_debounce_timer(self.filter_instances_list)
+        self.search_bar.textChanged.connect(lambda _: self._filter_timer.start())
         layout.addWidget(self.search_bar)
         # Export/Import buttons
         export_import_layout = QHBoxLayout()
@@ -491,19 +991,19 @@ class EC2Tab(BaseTab):
         layout.addWidget(self.instances_list)
         
         # Instance details
-        self.instance_details = QTextEdit()
+        self.instance_details = QPlainTextEdit()
         self.instance_details.setReadOnly(True)
         layout.addWidget(QLabel("Instance Details:"))
         layout.addWidget(self.instance_details)
         
         # CloudWatch metrics
-        self.metrics_display = QTextEdit()
+        self.metrics_display = QPlainTextEdit()
         self.metrics_display.setReadOnly(True)
         layout.addWidget(QLabel("CloudWatch Metrics:"))
         layout.addWidget(self.metrics_display)
         
         # Performance metrics
-        self.performance_display = QTextEdit()
+        self.performance_display = QPlainTextEdit()
         self.performance_display.setReadOnly(True)
         layout.addWidget(QLabel("Performance Metrics:"))
         layout.addWidget(self.performance_display)
@@ -517,7 +1017,7 @@ class EC2Tab(BaseTab):
         volume_layout.addWidget(QLabel("Attached Volumes:"))
         volume_layout.addWidget(self.volumes_list)
         
-        self.volume_details = QTextEdit()
+        self.volume_details = QPlainTextEdit()
         self.volume_details.setReadOnly(True)
         volume_layout.addWidget(QLabel("Volume Details:"))
         volume_layout.addWidget(self.volume_details)
@@ -565,14 +1065,25 @@ class EC2Tab(BaseTab):
         layout.addLayout(action_buttons)
         self.setLayout(layout)
         
-        # Initial refresh
+    def initial_load(self):
         self.refresh_instances_list()
         
     def filter_instances_list(self):
-        text = self.search_bar.text().lower()
-        for i in range(self.instances_list.count()):
-            item = self.instances_list.item(i)
-            item.setHidden(text not in item.text().lower())
+        """Show the instances whose label contains the search text.
+        
+        Matching runs in C++ through findItems (an empty search matches every
+        row), and only rows whose visibility changes are touched.
+        """
+        shown = {id(item): item for item in
+                 self.instances_list.findItems(self.search_bar.text(), Qt.MatchContains)}
+        with batched_updates(self.instances_list):
+            for key, item in self._shown_instances.items():
+                if key not in shown:
+                    item.setHidden(True)
+            for key, item in shown.items():
+                if key not in self._shown_instances:
+                    item.setHidden(False)
+        self._shown_instances = shown
         
     def refresh_instances_list(self) -> None:
         if self._is_loading:
@@ -580,6 +1091,7 @@ class EC2Tab(BaseTab):
         self._is_loading = True
         self._disable_buttons()
         self.instances_list.clear()
+        self._shown_instances = {}
         # Show progress dialog
         self.progress_dialog = QMessageBox(self)
         self.progress_dialog.setWindowTitle("Loading EC2 Instances")
@@ -594,14 +1106,36 @@ class EC2Tab(BaseTab):
 
     def _on_instances_loaded(self, instances):
         self.progress_dialog.hide()
-        self.instances_list.clear()
-        for instance in instances:
-            item = QListWidgetItem(f"{instance.id} - {instance.state['Name']}")
-            item.setData(Qt.UserRole, instance.id)
-            self.instances_list.addItem(item)
+        with batched_updates(self.instances_list):
+            self.instances_list.clear()
+            self._shown_instances = {}
+            self._listed_details = {}
+            for instance in instances:
+                item = QListWidgetItem(f"{instance.id} - {instance.state['Name']}")
+                item.setData(Qt.UserRole, instance.id)
+                self.instances_list.addItem(item)
+                self._shown_instances[id(item)] = item
+                # The listing already carries each DescribeInstances record
+                self._listed_details[instance.id] = instance.meta.data
+            if self.search_bar.text():
+                self.filter_instances_list()
+        # Signals were blocked while clearing, so drop the stale selection here
+        if self._selected_instance_id is not None:
+            self.display_instance_details()
         self._is_loading = False
+        self._prefetch_volumes([instance.id for instance in instances])
         self._enable_buttons()
 
+    def _prefetch_volumes(self, instance_ids):
+        """Fetch volumes for every listed instance in one batch so selections need no call."""
+        if not instance_ids:
+            return
+        self.run_in_background(
+            lambda: self.ec2_manager.describe_volumes_for_instances(instance_ids),
+            lambda volumes: self.set_cached_data(CacheKey.VOLUMES_BY_INSTANCE, volumes),
+            lambda e: self.log_message(f"Error prefetching volumes: {str(e)}", error=True)
+        )
+
     def _on_instances_error(self, e):
         self.progress_dialog.hide()
         self.log_message(f"Error refreshing instances list: {str(e)}", error=True)
@@ -632,74 +1166,110 @@ class EC2Tab(BaseTab):
         self.detach_volume_button.setEnabled(True)
         self.delete_volume_button.setEnabled(True)
         
-    def __del__(self) -> None:
-        """Cleanup resources when the tab is destroyed."""
-        try:
-            self.ec2_manager = None
-        except Exception as e:
-            logger.error(f"Error during cleanup: {str(e)}")
+    def closeEvent(self, event):
+        """Let an in-flight instance listing finish briefly, then release the manager."""
+        if self.worker and self.worker.isRunning():
+            self.worker.wait(200)
+        super().closeEvent(event)
+        self.ec2_manager = None
 
     def display_instance_details(self):
         """Display details of the selected EC2 instance."""
         selected_items = self.instances_list.selectedItems()
+        self._selected_instance_id = selected_items[0].data(Qt.UserRole) if selected_items else None
         if not selected_items:
             self.clear_instance_details()
             return
                 
-        instance_id = selected_items[0].data(Qt.UserRole)
-        try:
-            details = self.get_cached_data(
-                f'ec2_instance_{instance_id}',
-                lambda: self.ec2_manager.describe_instance(instance_id)
-            )
-            
-            if details:
-                # Display basic instance details
-                self.instance_details.setText(
-                    f"Instance ID: {details['InstanceId']}\n"
-                    f"State: {details['State']['Name']}\n"
-                    f"Type: {details['InstanceType']}\n"
-                    f"Public IP: {details.get('PublicIpAddress', 'N/A')}\n"
-                    f"Private IP: {details.get('PrivateIpAddress', 'N/A')}\n"
-                    f"Launch Time: {details['LaunchTime']}\n"
-                    f"VPC ID: {details.get('VpcId', 'N/A')}\n"
-                    f"Subnet ID: {details.get('SubnetId', 'N/A')}"
-                )
-                
-                # Display CloudWatch metrics
-                metrics = self.ec2_manager.get_cloudwatch_metrics(instance_id)
-                metrics_text = "CloudWatch Metrics:\n"
-                for metric in metrics:
-                    metrics_text += f"{metric['MetricName']}: {metric['Value']} {metric['Unit']}\n"
-                self.metrics_display.setText(metrics_text)
-                
-                # Display performance metrics
-                performance = self.ec2_manager.get_performance_metrics(instance_id)
-                performance_text = "Performance Metrics:\n"
-                for metric, value in performance.items():
-                    performance_text += f"{metric}: {value}\n"
-                self.performance_display.setText(performance_text)
-                
-                # Refresh volumes list
-                self.refresh_volumes_list(instance_id)
-            else:
-                self.clear_instance_details()
-                
-        except Exception as e:
-            self.show_error_dialog("Error", f"Failed to get instance details: {str(e)}")
+        instance_id = self._selected_instance_id
+        details = self._cached_instance(instance_id)
+        volumes_by_instance = self.peek_cached_data(CacheKey.VOLUMES_BY_INSTANCE) or {}
+        self.run_in_background(
+            lambda: self._fetch_instance_view(instance_id, details, volumes_by_instance.get(instance_id)),
+            lambda view: self._on_instance_view_loaded(instance_id, view),
+            self._on_instance_details_error
+        )
+
+    def _fetch_instance_view(self, instance_id, details, volumes):
+        """Fetch everything the detail panes show, issuing the calls concurrently.
+        
+        Runs on a worker thread; anything already cached is passed in and skipped.
+        """
+        futures = {
+            'metrics': DETAIL_EXECUTOR.submit(self.ec2_manager.get_cloudwatch_metrics, instance_id),
+            'performance': DETAIL_EXECUTOR.submit(self.ec2_manager.get_performance_metrics, instance_id),
+        }
+        if details is None:
+            futures['details'] = DETAIL_EXECUTOR.submit(self.ec2_manager.describe_instance, instance_id)
+        if volumes is None:
+            futures['volumes'] = DETAIL_EXECUTOR.submit(self.ec2_manager.list_volumes, instance_id)
+        view = {'details': details, 'volumes': volumes}
+        # No per-result timeout: each call is bounded by the botocore timeouts
+        for key, future in futures.items():
+            view[key] = future.result()
+        return view
+
+    def _on_instance_view_loaded(self, instance_id, view):
+        # Ignore results for an instance that is no longer selected
+        if self.get_selected_instance_id() != instance_id:
+            return
+        details = view['details']
+        if not details:
             self.clear_instance_details()
+            return
+        self.set_cached_data((CacheKey.EC2_INSTANCE, instance_id), details)
+        
+        # Display basic instance details
+        self.instance_details.setPlainText(
+            f"Instance ID: {details['InstanceId']}\n"
+            f"State: {details['State']['Name']}\n"
+            f"Type: {details['InstanceType']}\n"
+            f"Public IP: {details.get('PublicIpAddress', 'N/A')}\n"
+            f"Private IP: {details.get('PrivateIpAddress', 'N/A')}\n"
+            f"Launch Time: {details['LaunchTime']}\n"
+            f"VPC ID: {details.get('VpcId', 'N/A')}\n"
+            f"Subnet ID: {details.get('SubnetId', 'N/A')}"
+        )
+        
+        # Display CloudWatch metrics
+        self.metrics_display.setPlainText("\n".join(
+            ["CloudWatch Metrics:"] +
+            [f"{metric['MetricName']}: {metric['Value']} {metric['Unit']}" for metric in view['metrics']]
+        ))
+        
+        # Display performance metrics
+        self.performance_display.setPlainText("\n".join(
+            ["Performance Metrics:"] +
+            [f"{metric}: {value}" for metric, value in view['performance'].items()]
+        ))
+        
+        self._show_volumes(view['volumes'])
+
+    def _on_instance_details_error(self, e):
+        self.show_error_dialog("Error", f"Failed to get instance details: {type(e).__name__}: {e}")
+        self.clear_instance_details()
                 
     def refresh_volumes_list(self, instance_id: str):
         """Refresh the list of volumes attached to the instance."""
         try:
-            volumes = self.ec2_manager.list_volumes(instance_id)
+            # Served from the batch prefetched with the instance list when fresh
+            volumes_by_instance = self.peek_cached_data(CacheKey.VOLUMES_BY_INSTANCE)
+            if volumes_by_instance is not None and instance_id in volumes_by_instance:
+                volumes = volumes_by_instance[instance_id]
+            else:
+                volumes = self.ec2_manager.list_volumes(instance_id)
+            self._show_volumes(volumes)
+        except Exception as e:
+            self.show_error_dialog("Error", f"Failed to refresh volumes list: {str(e)}")
+
+    def _show_volumes(self, volumes):
+        with batched_updates(self.volumes_list):
             self.volumes_list.clear()
             for volume in volumes:
                 item = QListWidgetItem(f"{volume['VolumeId']} - {volume['State']}")
                 item.setData(Qt.UserRole, volume)
                 self.volumes_list.addItem(item)
-        except Exception as e:
-            self.show_error_dialog("Error", f"Failed to refresh volumes list: {str(e)}")
+        _clear_text(self.volume_details)
                 
     def display_volume_details(self):
         """Display details of the selected volume."""
@@ -712,15 +1282,12 @@ class EC2Tab(BaseTab):
         try:
             details = self.ec2_manager.describe_volume(volume['VolumeId'])
             if details:
-                self.volume_details.setText(
-                    f"Volume ID: {details['VolumeId']}\n"
-                    f"State: {details['State']}\n"
-                    f"Size: {details['Size']} GB\n"
-                    f"Type: {details['VolumeType']}\n"
-                    f"IOPS: {details.get('Iops', 'N/A')}\n"
-                    f"Encrypted: {details['Encrypted']}\n"
-                    f"Attached to: {details.get('Attachments', [{}])[0].get('InstanceId', 'N/A')}"
-                )
+                attachments = details.get('Attachments')
+                self.volume_details.setPlainText(VOLUME_DETAILS_TEMPLATE.format_map({
+                    'Iops': 'N/A',
+                    **details,
+                    'Attached': attachments[0]['InstanceId'] if attachments else 'N/A',
+                }))
             else:
                 self.volume_details.clear()
         except Exception as e:
@@ -729,41 +1296,32 @@ class EC2Tab(BaseTab):
                 
     def create_volume(self):
         """Create a new EBS volume."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create EBS Volume")
-        layout = QFormLayout()
-        
-        size = QSpinBox()
-        size.setRange(1, 16384)
-        size.setValue(8)
-        
-        volume_type = QComboBox()
-        volume_type.addItems(['gp2', 'gp3', 'io1', 'io2', 'st1', 'sc1'])
-        
-        iops = QSpinBox()
-        iops.setRange(100, 64000)
-        iops.setValue(3000)
-        
-        layout.addRow("Size (GB):", size)
-        layout.addRow("Volume Type:", volume_type)
-        layout.addRow("IOPS:", iops)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addRow(buttons)
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted:
+        if self._create_volume_dialog is None:
+            self._volume_size_input = QSpinBox()
+            self._volume_size_input.setRange(1, 16384)
+            self._volume_type_input = QComboBox()
+            self._volume_type_input.addItems(['gp2', 'gp3', 'io1', 'io2', 'st1', 'sc1'])
+            self._volume_iops_input = QSpinBox()
+            self._volume_iops_input.setRange(100, 64000)
+            self._create_volume_dialog = self.build_form_dialog("Create EBS Volume", [
+                ("Size (GB):", self._volume_size_input),
+                ("Volume Type:", self._volume_type_input),
+                ("IOPS:", self._volume_iops_input),
+            ])
+        self._volume_size_input.setValue(8)
+        self._volume_type_input.setCurrentIndex(0)
+        self._volume_iops_input.setValue(3000)
+        
+        if self._create_volume_dialog.exec_() == QDialog.Accepted:
             try:
                 volume = self.ec2_manager.create_volume(
-                    size=size.value(),
-                    volume_type=volume_type.currentText(),
-                    iops=iops.value()
+                    size=self._volume_size_input.value(),
+                    volume_type=self._volume_type_input.currentText(),
+                    iops=self._volume_iops_input.value()
                 )
                 if volume:
                     self.show_info_dialog("Success", f"Volume {volume.id} created successfully")
+                    self.clear_cache(CacheKey.VOLUMES_BY_INSTANCE)
                     self.refresh_volumes_list(self.get_selected_instance_id())
                 else:
                     self.show_error_dialog("Error", "Failed to create volume")
@@ -784,14 +1342,24 @@ class EC2Tab(BaseTab):
             self.show_error_dialog("Error", "Please select an instance first")
             return
                 
-        try:
-            if self.ec2_manager.attach_volume(volume['VolumeId'], instance_id):
-                self.show_info_dialog("Success", f"Volume {volume['VolumeId']} attached successfully")
-                self.refresh_volumes_list(instance_id)
-            else:
-                self.show_error_dialog("Error", f"Failed to attach volume {volume['VolumeId']}")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error attaching volume: {str(e)}")
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.ec2_manager.attach_volume(volume['VolumeId'], instance_id),
+            lambda ok: self._on_volume_attached(volume['VolumeId'], instance_id, ok),
+            self._on_volume_attach_error)
+
+    def _on_volume_attached(self, volume_id, instance_id, ok):
+        self._enable_buttons()
+        if ok:
+            self.show_info_dialog("Success", f"Volume {volume_id} attached successfully")
+            self.clear_cache(CacheKey.VOLUMES_BY_INSTANCE)
+            self.refresh_volumes_list(instance_id)
+        else:
+            self.show_error_dialog("Error", f"Failed to attach volume {volume_id}")
+
+    def _on_volume_attach_error(self, e):
+        self._enable_buttons()
+        self.show_error_dialog("Error", f"Error attaching volume: {str(e)}")
                 
     def detach_volume(self):
         """Detach a volume from the selected instance."""
@@ -810,6 +1378,7 @@ class EC2Tab(BaseTab):
         try:
             if self.ec2_manager.detach_volume(volume['VolumeId']):
                 self.show_info_dialog("Success", f"Volume {volume['VolumeId']} detached successfully")
+                self.clear_cache(CacheKey.VOLUMES_BY_INSTANCE)
                 self.refresh_volumes_list(instance_id)
             else:
                 self.show_error_dialog("Error", f"Failed to detach volume {volume['VolumeId']}")
@@ -832,6 +1401,7 @@ class EC2Tab(BaseTab):
         try:
             if self.ec2_manager.delete_volume(volume['VolumeId']):
                 self.show_info_dialog("Success", f"Volume {volume['VolumeId']} deleted successfully")
+                self.clear_cache(CacheKey.VOLUMES_BY_INSTANCE)
                 self.refresh_volumes_list(self.get_selected_instance_id())
             else:
                 self.show_error_dialog("Error", f"Failed to delete volume {volume['VolumeId']}")
@@ -840,36 +1410,32 @@ class EC2Tab(BaseTab):
                 
     def get_selected_instance_id(self) -> Optional[str]:
         """Get the ID of the currently selected instance."""
-        selected_items = self.instances_list.selectedItems()
-        if not selected_items:
-            return None
-        return selected_items[0].data(Qt.UserRole)
+        return self._selected_instance_id
             
     def create_ec2_instance(self):
         """Create a new EC2 instance."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create EC2 Instance")
-        layout = QFormLayout()
-        
-        ami_id = QLineEdit()
-        instance_type = QLineEdit()
-        key_name = QLineEdit()
-        
-        # Add instance type validation
-        instance_type.textChanged.connect(lambda: self.validate_instance_type(instance_type))
-        
-        layout.addRow("AMI ID:", ami_id)
-        layout.addRow("Instance Type:", instance_type)
-        layout.addRow("Key Name:", key_name)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addRow(buttons)
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted:
+        if self._create_instance_dialog is None:
+            self._ami_id_input = QLineEdit()
+            self._instance_type_input = QLineEdit()
+            self._key_name_input = QLineEdit()
+            self._create_instance_dialog = self.build_form_dialog("Create EC2 Instance", [
+                ("AMI ID:", self._ami_id_input),
+                ("Instance Type:", self._instance_type_input),
+                ("Key Name:", self._key_name_input),
+            ])
+            # Validate the instance type once typing pauses
+            self._validate_type_timer = self.create_debounce_timer(
+                lambda: self.validate_instance_type(self._instance_type_input), 200)
+            self._instance_type_input.textChanged.connect(self._validate_type_timer.start)
+        ami_id = self._ami_id_input
+        instance_type = self._instance_type_input
+        key_name = self._key_name_input
+        for field in (ami_id, instance_type, key_name):
+            field.clear()
+        self._validate_type_timer.stop()
+        instance_type.setStyleSheet("")
+        
+        if self._create_instance_dialog.exec_() == QDialog.Accepted:
             if not self.validate_input(ami_id.text(), "AMI ID"):
                 return
             if not self.validate_input(instance_type.text(), "Instance Type"):
@@ -885,7 +1451,7 @@ class EC2Tab(BaseTab):
                 )
                 
                 if instance:
-                    self.clear_cache('ec2_instances')
+                    self.clear_cache(CacheKey.EC2_INSTANCES)
                     self.refresh_instances_list()
                     self.show_info_dialog("Success", f"Instance {instance.id} created successfully.")
                 else:
@@ -915,13 +1481,12 @@ class EC2Tab(BaseTab):
         
     def start_selected_instance(self):
         """Start the selected EC2 instance."""
-        selected_items = self.instances_list.selectedItems()
-        if not selected_items:
+        instance_id = self._selected_instance_id
+        if not instance_id:
             self.show_error_dialog("Error", "Please select an instance to start.")
             return
                 
-        instance_id = selected_items[0].data(Qt.UserRole)
-        instance = self.ec2_manager.describe_instance(instance_id)
+        instance = self._describe_for_action(instance_id)
         if not instance:
             self.show_error_dialog("Error", f"Failed to get details for instance {instance_id}")
             return
@@ -933,26 +1498,16 @@ class EC2Tab(BaseTab):
         if not self.show_confirm_dialog("Confirm Start", f"Start instance {instance_id}?"):
             return
                 
-        try:
-            if self.ec2_manager.start_instance(instance_id):
-                self.clear_cache('ec2_instances')
-                self.clear_cache(f'ec2_instance_{instance_id}')
-                self.refresh_instances_list()
-                self.show_info_dialog("Success", f"Instance {instance_id} started successfully.")
-            else:
-                self.show_error_dialog("Error", f"Failed to start instance {instance_id}")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error starting instance: {str(e)}")
+        self._run_instance_action('start', self.ec2_manager.start_instance, instance_id)
                 
     def stop_selected_instance(self):
         """Stop the selected EC2 instance."""
-        selected_items = self.instances_list.selectedItems()
-        if not selected_items:
+        instance_id = self._selected_instance_id
+        if not instance_id:
             self.show_error_dialog("Error", "Please select an instance to stop.")
             return
                 
-        instance_id = selected_items[0].data(Qt.UserRole)
-        instance = self.ec2_manager.describe_instance(instance_id)
+        instance = self._describe_for_action(instance_id)
         if not instance:
             self.show_error_dialog("Error", f"Failed to get details for instance {instance_id}")
             return
@@ -964,26 +1519,16 @@ class EC2Tab(BaseTab):
         if not self.show_confirm_dialog("Confirm Stop", f"Stop instance {instance_id}?"):
             return
                 
-        try:
-            if self.ec2_manager.stop_instance(instance_id):
-                self.clear_cache('ec2_instances')
-                self.clear_cache(f'ec2_instance_{instance_id}')
-                self.refresh_instances_list()
-                self.show_info_dialog("Success", f"Instance {instance_id} stopped successfully.")
-            else:
-                self.show_error_dialog("Error", f"Failed to stop instance {instance_id}")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error stopping instance: {str(e)}")
+        self._run_instance_action('stop', self.ec2_manager.stop_instance, instance_id)
                 
     def reboot_selected_instance(self):
         """Reboot the selected EC2 instance."""
-        selected_items = self.instances_list.selectedItems()
-        if not selected_items:
+        instance_id = self._selected_instance_id
+        if not instance_id:
             self.show_error_dialog("Error", "Please select an instance to reboot.")
             return
                 
-        instance_id = selected_items[0].data(Qt.UserRole)
-        instance = self.ec2_manager.describe_instance(instance_id)
+        instance = self._describe_for_action(instance_id)
         if not instance:
             self.show_error_dialog("Error", f"Failed to get details for instance {instance_id}")
             return
@@ -995,26 +1540,16 @@ class EC2Tab(BaseTab):
         if not self.show_confirm_dialog("Confirm Reboot", f"Reboot instance {instance_id}?"):
             return
                 
-        try:
-            if self.ec2_manager.reboot_instance(instance_id):
-                self.clear_cache('ec2_instances')
-                self.clear_cache(f'ec2_instance_{instance_id}')
-                self.refresh_instances_list()
-                self.show_info_dialog("Success", f"Instance {instance_id} rebooted successfully.")
-            else:
-                self.show_error_dialog("Error", f"Failed to reboot instance {instance_id}")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error rebooting instance: {str(e)}")
+        self._run_instance_action('reboot', self.ec2_manager.reboot_instance, instance_id)
                 
     def terminate_selected_instance(self):
         """Terminate the selected EC2 instance."""
-        selected_items = self.instances_list.selectedItems()
-        if not selected_items:
+        instance_id = self._selected_instance_id
+        if not instance_id:
             self.show_error_dialog("Error", "Please select an instance to terminate.")
             return
                 
-        instance_id = selected_items[0].data(Qt.UserRole)
-        instance = self.ec2_manager.describe_instance(instance_id)
+        instance = self._describe_for_action(instance_id)
         if not instance:
             self.show_error_dialog("Error", f"Failed to get details for instance {instance_id}")
             return
@@ -1023,47 +1558,82 @@ class EC2Tab(BaseTab):
                                     f"WARNING: This will permanently delete instance {instance_id}. Continue?"):
             return
                 
-        try:
-            if self.ec2_manager.terminate_instance(instance_id):
-                self.clear_cache('ec2_instances')
-                self.clear_cache(f'ec2_instance_{instance_id}')
-                self.refresh_instances_list()
-                self.show_info_dialog("Success", f"Instance {instance_id} terminated successfully.")
-            else:
-                self.show_error_dialog("Error", f"Failed to terminate instance {instance_id}")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error terminating instance: {str(e)}")
+        self._run_instance_action('terminate', self.ec2_manager.terminate_instance, instance_id)
+
+    def _cached_instance(self, instance_id):
+        """Return a described instance if one is cached, else its record from the last listing."""
+        details = self.peek_cached_data((CacheKey.EC2_INSTANCE, instance_id))
+        if details is None:
+            details = self._listed_details.get(instance_id)
+        return details
+
+    def _describe_for_action(self, instance_id):
+        """Return the instance's details for a state check, reusing the batch fetched with the list."""
+        instance = self._cached_instance(instance_id)
+        if instance is None:
+            instance = self.ec2_manager.describe_instance(instance_id)
+            if instance:
+                self.set_cached_data((CacheKey.EC2_INSTANCE, instance_id), instance)
+        return instance
+
+    # Past tense and gerund for each instance action's messages
+    _INSTANCE_ACTION_WORDS = {
+        'start': ('started', 'starting'),
+        'stop': ('stopped', 'stopping'),
+        'reboot': ('rebooted', 'rebooting'),
+        'terminate': ('terminated', 'terminating'),
+    }
+
+    def _run_instance_action(self, verb, action, instance_id):
+        """Run an instance state change on a worker thread and report the outcome."""
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: action(instance_id),
+            lambda ok: self._on_instance_action_done(verb, instance_id, ok),
+            lambda e: self._on_instance_action_error(verb, e))
+
+    def _on_instance_action_done(self, verb, instance_id, ok):
+        self._enable_buttons()
+        if ok:
+            self.clear_cache(CacheKey.EC2_INSTANCES)
+            self.clear_cache((CacheKey.EC2_INSTANCE, instance_id))
+            self._listed_details.pop(instance_id, None)
+            self.refresh_instances_list()
+            past = self._INSTANCE_ACTION_WORDS[verb][0]
+            self.show_info_dialog("Success", f"Instance {instance_id} {past} successfully.")
+        else:
+            self.show_error_dialog("Error", f"Failed to {verb} instance {instance_id}")
+
+    def _on_instance_action_error(self, verb, e):
+        self._enable_buttons()
+        gerund = self._INSTANCE_ACTION_WORDS[verb][1]
+        self.show_error_dialog("Error", f"Error {gerund} instance: {str(e)}")
 
     def export_instances(self):
-        instances = []
-        for i in range(self.instances_list.count()):
-            item = self.instances_list.item(i)
-            if not item.isHidden():
-                instances.append(item.text())
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export EC2 Instances", "ec2_instances.json", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export EC2 Instances", "ec2_instances.jsonl", EXPORT_SAVE_FILTER)
         if file_path:
-            with open(file_path, 'w') as f:
-                json.dump(instances, f, indent=2)
-            self.show_info_dialog("Export", f"Exported {len(instances)} EC2 instances to {file_path}")
+            self.export_in_background(file_path, _visible_texts(self.instances_list), "EC2 instances")
     def import_instances(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Import EC2 Instances", "", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import EC2 Instances", "", EXPORT_OPEN_FILTER)
         if file_path:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            self.show_info_dialog("Import", f"Imported {len(data)} EC2 instances from {file_path}\n(Import does not create resources)")
+            self.import_in_background(file_path, "EC2 instances")
 
 class S3Tab(BaseTab):
     def __init__(self):
         super().__init__()
         self.worker = None  # Ensure worker is defined before any method uses it
-        self.s3_manager = S3Manager()
-        self._is_loading = False
+        self.s3_manager = shared_manager(S3Manager)
+        # Bumped per object listing; callbacks from superseded listings are dropped
+        self._objects_token = 0
         self._selected_bucket = None
         self._selected_object = None
+        self._create_bucket_dialog = None
         self.setup_ui()
-        self.refresh_buckets_list()
         self.setAcceptDrops(True)
 
+    def initial_load(self):
+        self.refresh_buckets_list()
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -1074,28 +1644,35 @@ class S3Tab(BaseTab):
         if not self._selected_bucket:
             self.show_error_dialog("Error", "Please select a bucket before uploading files.")
             return
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path:
-                try:
-                    if self.s3_manager.upload_file(
-                        bucket_name=self._selected_bucket,
-                        file_path=file_path
-                    ):
-                        self.refresh_object_list()
-                        self.show_info_dialog("Success", f"File uploaded successfully to '{self._selected_bucket}'")
-                    else:
-                        self.show_error_dialog("Error", f"Failed to upload file {file_path}")
-                except Exception as e:
-                    self.show_error_dialog("Error", f"Error uploading file: {str(e)}")
+        self._upload_paths([url.toLocalFile() for url in event.mimeData().urls() if url.toLocalFile()])
         event.acceptProposedAction()
 
+    def _upload_paths(self, paths):
+        """Upload local files to the selected bucket concurrently and report once for the batch."""
+        if not paths:
+            return
+        bucket = self._selected_bucket
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.s3_manager.upload_files(paths, bucket_name=bucket),
+            lambda failed: self._on_files_uploaded(bucket, len(paths), failed),
+            self._on_file_upload_error)
+
+    def _on_files_uploaded(self, bucket, total, failed):
+        self._enable_buttons()
+        self.clear_cache((CacheKey.S3_OBJECTS, bucket))
+        self.refresh_object_list()
+        summary = f"Uploaded {total - len(failed)}/{total} files to '{bucket}'"
+        if failed:
+            self.show_error_dialog("Error", f"{summary}. Failed:\n" + "\n".join(failed))
+        else:
+            self.show_info_dialog("Success", summary)
+
     def setup_ui(self) -> None:
         layout = QVBoxLayout()
         # Search bar for buckets
         self.bucket_search_bar = QLineEdit()
         self.bucket_search_bar.setPlaceholderText("Search Buckets...")
-        self.bucket_search_bar.textChanged.connect(self.filter_buckets_list)
         layout.addWidget(self.bucket_search_bar)
         # Export/Import buttons
         export_import_layout = QHBoxLayout()
@@ -1110,8 +1687,10 @@ class S3Tab(BaseTab):
         bucket_group = QGroupBox("Bucket Management")
         bucket_layout = QVBoxLayout()
         
-        self.buckets_list = QListWidget()
-        self.buckets_list.itemSelectionChanged.connect(self.on_bucket_selected)
+        # Filtering runs in the proxy's C++ loop instead of per-item Python checks
+        self.buckets_model = NameListModel(self)
+        self.buckets_list = _filtered_list_view(self.buckets_model, self.bucket_search_bar, self)
+        self.buckets_list.selectionModel().selectionChanged.connect(self.on_bucket_selected)
         bucket_layout.addWidget(QLabel("S3 Buckets:"))
         bucket_layout.addWidget(self.buckets_list)
         
@@ -1134,6 +1713,7 @@ class S3Tab(BaseTab):
         object_layout = QVBoxLayout()
         
         self.objects_list = QListWidget()
+        self.objects_list.setSelectionMode(QListWidget.ExtendedSelection)
         self.objects_list.itemSelectionChanged.connect(self.on_object_selected)
         object_layout.addWidget(QLabel("Bucket Objects:"))
         object_layout.addWidget(self.objects_list)
@@ -1157,12 +1737,6 @@ class S3Tab(BaseTab):
         
         self.setLayout(layout)
         
-    def filter_buckets_list(self):
-        text = self.bucket_search_bar.text().lower()
-        for i in range(self.buckets_list.count()):
-            item = self.buckets_list.item(i)
-            item.setHidden(text not in item.text().lower())
-        
     def refresh_buckets_list(self):
         self.log_message("Loading S3 buckets...")
         self._disable_buttons()
@@ -1176,13 +1750,12 @@ class S3Tab(BaseTab):
     def _on_buckets_loaded(self, buckets):
         self._enable_buttons()
         self.log_message(f"Loaded {len(buckets) if buckets else 0} S3 buckets.")
-        self.buckets_list.clear()
-        if not buckets or not isinstance(buckets, list):
-            return
-        for bucket in buckets:
-            item = QListWidgetItem(bucket['Name'])
-            item.setData(Qt.UserRole, bucket['Name'])
-            self.buckets_list.addItem(item)
+        if not isinstance(buckets, list):
+            buckets = []
+        self.buckets_model.set_names([bucket['Name'] for bucket in buckets])
+        # A model reset clears the selection without signalling, so drop it here
+        if self._selected_bucket is not None:
+            self.on_bucket_selected()
 
     def _on_buckets_error(self, e):
         self._enable_buttons()
@@ -1193,30 +1766,56 @@ class S3Tab(BaseTab):
             self.worker.cancel()
             self.log_message("Cancelled S3 bucket loading.")
             
-    def refresh_object_list(self) -> None:
+    def refresh_object_list(self, force_refresh=False) -> None:
         """Refresh the list of objects in the selected bucket."""
-        if self._is_loading or not self._selected_bucket:
+        if not self._selected_bucket:
             return
+        bucket = self._selected_bucket
+        self._objects_token += 1
+        token = self._objects_token
+        key = (CacheKey.S3_OBJECTS, bucket)
+        if not force_refresh:
+            keys = self.peek_cached_data(key)
+            if keys is not None:
+                self._enable_buttons()
+                self._show_objects(keys)
+                return
                 
-        self._is_loading = True
         self._disable_buttons()
-        
-        try:
-            objects = self.s3_manager.s3_client.list_objects_v2(
-                Bucket=self._selected_bucket
-            ).get('Contents', [])
-            
+        self.run_in_background(
+            lambda: self._list_objects(bucket),
+            lambda keys: self._on_objects_loaded(token, bucket, keys),
+            lambda e: self._on_objects_error(token, e))
+
+    def _list_objects(self, bucket):
+        """Return every object key in bucket, following list_objects_v2 pagination."""
+        paginator = self.s3_manager.s3_client.get_paginator('list_objects_v2')
+        return [obj['Key']
+                for page in paginator.paginate(Bucket=bucket, PaginationConfig={'PageSize': 1000})
+                for obj in page.get('Contents', [])]
+
+    def _on_objects_loaded(self, token, bucket, keys):
+        self.set_cached_data((CacheKey.S3_OBJECTS, bucket), keys)
+        if token != self._objects_token:
+            return
+        self._enable_buttons()
+        if bucket == self._selected_bucket:
+            self._show_objects(keys)
+        else:
+            # The selection moved on without a newer listing; fetch the current bucket
+            self.refresh_object_list()
+
+    def _on_objects_error(self, token, e):
+        if token != self._objects_token:
+            return
+        self._enable_buttons()
+        self.log_message(f"Error refreshing objects list: {str(e)}", error=True)
+
+    def _show_objects(self, keys):
+        with batched_updates(self.objects_list):
             self.objects_list.clear()
-            
-            for obj in objects:
-                item = QListWidgetItem(obj['Key'])
-                item.setData(Qt.UserRole, obj['Key'])
-                self.objects_list.addItem(item)
-        except Exception as e:
-            self.log_message(f"Error refreshing objects list: {str(e)}", error=True)
-        finally:
-            self._is_loading = False
-            self._enable_buttons()
+            self.objects_list.addItems(keys)
+        self._selected_object = None
                 
     def _disable_buttons(self) -> None:
         """Disable all action buttons."""
@@ -1243,13 +1842,16 @@ class S3Tab(BaseTab):
 
     def on_bucket_selected(self):
         """Handle bucket selection and update UI accordingly."""
-        selected_items = self.buckets_list.selectedItems()
-        if not selected_items:
+        indexes = self.buckets_list.selectionModel().selectedIndexes()
+        if not indexes:
             self._selected_bucket = None
             self.objects_list.clear()
             return
                 
-        self._selected_bucket = selected_items[0].text()
+        self._selected_bucket = indexes[0].data()
+        # Never leave the previous bucket's keys under the new selection
+        self.objects_list.clear()
+        self._selected_object = None
         self.refresh_object_list()
         
     def on_object_selected(self):
@@ -1262,38 +1864,32 @@ class S3Tab(BaseTab):
         
     def create_bucket(self):
         """Create a new S3 bucket."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create S3 Bucket")
-        layout = QFormLayout()
-        
-        bucket_name = QLineEdit()
-        region = QComboBox()
-        region.addItems(['us-east-1', 'us-west-2', 'ap-south-1', 'ap-southeast-1'])
-        
-        layout.addRow("Bucket Name:", bucket_name)
-        layout.addRow("Region:", region)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addRow(buttons)
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted:
-            if not self.validate_input(bucket_name.text(), "Bucket Name"):
+        if self._create_bucket_dialog is None:
+            self._bucket_name_input = QLineEdit()
+            self._bucket_region_input = QComboBox()
+            self._bucket_region_input.addItems(['us-east-1', 'us-west-2', 'ap-south-1', 'ap-southeast-1'])
+            self._create_bucket_dialog = self.build_form_dialog("Create S3 Bucket", [
+                ("Bucket Name:", self._bucket_name_input),
+                ("Region:", self._bucket_region_input),
+            ])
+        self._bucket_name_input.clear()
+        self._bucket_region_input.setCurrentIndex(0)
+        
+        if self._create_bucket_dialog.exec_() == QDialog.Accepted:
+            bucket_name = self._bucket_name_input.text()
+            if not self.validate_input(bucket_name, "Bucket Name"):
                 return
                     
             try:
                 if self.s3_manager.create_bucket(
-                    bucket_name=bucket_name.text(),
-                    region=region.currentText()
+                    bucket_name=bucket_name,
+                    region=self._bucket_region_input.currentText()
                 ):
-                    self.clear_cache('s3_buckets')
+                    self.clear_cache(CacheKey.S3_BUCKETS)
                     self.refresh_buckets_list()
-                    self.show_info_dialog("Success", f"Bucket '{bucket_name.text()}' created successfully")
+                    self.show_info_dialog("Success", f"Bucket '{bucket_name}' created successfully")
                 else:
-                    self.show_error_dialog("Error", f"Failed to create bucket '{bucket_name.text()}'")
+                    self.show_error_dialog("Error", f"Failed to create bucket '{bucket_name}'")
             except Exception as e:
                 self.show_error_dialog("Error", f"Error creating bucket: {str(e)}")
                     
@@ -1309,7 +1905,7 @@ class S3Tab(BaseTab):
                 
         try:
             if self.s3_manager.delete_bucket(self._selected_bucket):
-                self.clear_cache('s3_buckets')
+                self.clear_cache(CacheKey.S3_BUCKETS)
                 self.refresh_buckets_list()
                 self.show_info_dialog("Success", f"Bucket '{self._selected_bucket}' deleted successfully")
             else:
@@ -1318,30 +1914,22 @@ class S3Tab(BaseTab):
             self.show_error_dialog("Error", f"Error deleting bucket: {str(e)}")
                 
     def upload_selected_file(self):
-        """Upload a file to the selected bucket."""
+        """Upload one or more files to the selected bucket."""
         if not self._selected_bucket:
             self.show_error_dialog("Error", "Please select a bucket first")
             return
                 
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self, 
-            "Select File to Upload",
+            "Select Files to Upload",
             "",
             "All Files (*.*)"
         )
-        
-        if file_path:
-            try:
-                if self.s3_manager.upload_file(
-                    bucket_name=self._selected_bucket,
-                    file_path=file_path
-                ):
-                    self.refresh_object_list()
-                    self.show_info_dialog("Success", f"File uploaded successfully to '{self._selected_bucket}'")
-                else:
-                    self.show_error_dialog("Error", "Failed to upload file")
-            except Exception as e:
-                self.show_error_dialog("Error", f"Error uploading file: {str(e)}")
+        self._upload_paths(file_paths)
+
+    def _on_file_upload_error(self, e):
+        self._enable_buttons()
+        self.show_error_dialog("Error", f"Error uploading file: {str(e)}")
                     
     def download_selected_file(self):
         """Download the selected object from the bucket."""
@@ -1357,69 +1945,89 @@ class S3Tab(BaseTab):
         )
         
         if file_path:
-            try:
-                if self.s3_manager.download_file(
-                    bucket_name=self._selected_bucket,
-                    object_key=self._selected_object,
-                    file_path=file_path
-                ):
-                    self.show_info_dialog("Success", f"File downloaded successfully to {file_path}")
-                else:
-                    self.show_error_dialog("Error", "Failed to download file")
-            except Exception as e:
-                self.show_error_dialog("Error", f"Error downloading file: {str(e)}")
+            bucket, key = self._selected_bucket, self._selected_object
+            self._disable_buttons()
+            self.run_in_background(
+                lambda: self.s3_manager.download_file(
+                    bucket_name=bucket,
+                    key=key,
+                    download_path=file_path
+                ),
+                lambda ok: self._on_file_downloaded(file_path, ok),
+                self._on_file_download_error)
+
+    def _on_file_downloaded(self, file_path, ok):
+        self._enable_buttons()
+        if ok:
+            self.show_info_dialog("Success", f"File downloaded successfully to {file_path}")
+        else:
+            self.show_error_dialog("Error", "Failed to download file")
+
+    def _on_file_download_error(self, e):
+        self._enable_buttons()
+        self.show_error_dialog("Error", f"Error downloading file: {str(e)}")
                     
     def delete_selected_object(self):
-        """Delete the selected object from the bucket."""
-        if not self._selected_object:
+        """Delete the selected objects from the bucket."""
+        keys = [item.text() for item in self.objects_list.selectedItems()]
+        if not keys:
             self.show_error_dialog("Error", "Please select an object to delete")
             return
                 
-        if not self.show_confirm_dialog("Confirm Delete", 
-                                    f"Delete object '{self._selected_object}'?"):
+        target = f"object '{keys[0]}'" if len(keys) == 1 else f"{len(keys)} objects"
+        if not self.show_confirm_dialog("Confirm Delete", f"Delete {target}?"):
             return
                 
-        try:
-            if self.s3_manager.delete_object(
-                bucket_name=self._selected_bucket,
-                key=self._selected_object
-            ):
-                self.refresh_object_list()
-                self.show_info_dialog("Success", f"Object '{self._selected_object}' deleted successfully")
-            else:
-                self.show_error_dialog("Error", f"Failed to delete object '{self._selected_object}'")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error deleting object: {str(e)}")
+        bucket = self._selected_bucket
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.s3_manager.delete_objects(keys, bucket_name=bucket),
+            lambda deleted: self._on_objects_deleted(bucket, target, deleted),
+            self._on_objects_delete_error)
+
+    def _on_objects_deleted(self, bucket, target, deleted):
+        self._enable_buttons()
+        self.clear_cache((CacheKey.S3_OBJECTS, bucket))
+        self.refresh_object_list()
+        if deleted:
+            self.show_info_dialog("Success", f"Deleted {target} successfully")
+        else:
+            self.show_error_dialog("Error", f"Failed to delete {target}")
+
+    def _on_objects_delete_error(self, e):
+        self._enable_buttons()
+        self.show_error_dialog("Error", f"Error deleting object: {str(e)}")
 
     def export_buckets(self):
-        buckets = []
-        for i in range(self.buckets_list.count()):
-            item = self.buckets_list.item(i)
-            if not item.isHidden():
-                buckets.append(item.text())
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export S3 Buckets", "s3_buckets.json", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export S3 Buckets", "s3_buckets.jsonl", EXPORT_SAVE_FILTER)
         if file_path:
-            with open(file_path, 'w') as f:
-                json.dump(buckets, f, indent=2)
-            self.show_info_dialog("Export", f"Exported {len(buckets)} S3 buckets to {file_path}")
+            self.export_in_background(file_path, _proxy_texts(self.buckets_list), "S3 buckets")
     def import_buckets(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Import S3 Buckets", "", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import S3 Buckets", "", EXPORT_OPEN_FILTER)
         if file_path:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            self.show_info_dialog("Import", f"Imported {len(data)} S3 buckets from {file_path}\n(Import does not create resources)")
+            self.import_in_background(file_path, "S3 buckets")
 
 class LambdaTab(BaseTab):
     def __init__(self):
         super().__init__()
         self.worker = None  # Ensure worker is defined before any method uses it
-        self.lambda_manager = LambdaManager()
-        self._is_loading = False
+        self._deploy_worker = None
+        self._create_rule_dialog = None
+        self._deploy_dialog = None
+        self.lambda_manager = shared_manager(LambdaManager)
+        # Bumped per rules lookup; results for a superseded function are dropped
+        self._rules_token = 0
+        self._functions_reload_selection = None
+        self._functions_first_page = True
         self._selected_function = None
+        # Bumped per refresh; callbacks from superseded refreshes are dropped
+        self._refresh_token = 0
         self.setup_ui()
-        self.refresh_functions_list()
         self.setAcceptDrops(True)
 
+    def initial_load(self):
+        self.refresh_functions_list()
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -1427,11 +2035,10 @@ class LambdaTab(BaseTab):
             event.ignore()
 
     def dropEvent(self, event):
-        selected_items = self.functions_list.selectedItems()
-        if not selected_items:
+        function_name = self.get_selected_function_name()
+        if not function_name:
             self.show_error_dialog("Error", "Please select a Lambda function before deploying.")
             return
-        function_name = selected_items[0].data(Qt.UserRole)
         for url in event.mimeData().urls():
             file_path = url.toLocalFile()
             if file_path and (file_path.endswith('.zip') or file_path.endswith('.py')):
@@ -1440,8 +2047,8 @@ class LambdaTab(BaseTab):
                         function_name=function_name,
                         code_file=file_path
                     ):
-                        self.clear_cache('lambda_functions')
-                        self.clear_cache(f'lambda_function_{function_name}')
+                        self.clear_cache(CacheKey.LAMBDA_FUNCTIONS)
+                        self.clear_cache((CacheKey.LAMBDA_FUNCTION, function_name))
                         self.refresh_functions_list()
                         self.show_info_dialog("Success", f"Lambda function '{function_name}' updated successfully.")
                     else:
@@ -1455,7 +2062,6 @@ class LambdaTab(BaseTab):
         # Search bar for functions
         self.function_search_bar = QLineEdit()
         self.function_search_bar.setPlaceholderText("Search Lambda Functions...")
-        self.function_search_bar.textChanged.connect(self.filter_functions_list)
         layout.addWidget(self.function_search_bar)
         # Export/Import buttons
         export_import_layout = QHBoxLayout()
@@ -1470,8 +2076,11 @@ class LambdaTab(BaseTab):
         function_group = QGroupBox("Function Management")
         function_layout = QVBoxLayout()
         
-        self.functions_list = QListWidget()
-        self.functions_list.itemSelectionChanged.connect(self.display_function_details)
+        self.functions_model = NameListModel(self)
+        self.functions_list = _filtered_list_view(self.functions_model, self.function_search_bar, self)
+        # Arrow-key runs through the list only load the row they settle on
+        self._select_function_timer = self.create_debounce_timer(self.display_function_details, 100)
+        self.functions_list.selectionModel().selectionChanged.connect(self._select_function_timer.start)
         function_layout.addWidget(QLabel("Lambda Functions:"))
         function_layout.addWidget(self.functions_list)
         
@@ -1489,6 +2098,11 @@ class LambdaTab(BaseTab):
         function_buttons.addWidget(self.delete_function_button)
         
         function_layout.addLayout(function_buttons)
+        # Indeterminate busy bar shown while a deploy runs in the background
+        self.deploy_progress = QProgressBar()
+        self.deploy_progress.setRange(0, 0)
+        self.deploy_progress.setVisible(False)
+        function_layout.addWidget(self.deploy_progress)
         function_group.setLayout(function_layout)
         layout.addWidget(function_group)
         
@@ -1529,30 +2143,49 @@ class LambdaTab(BaseTab):
         
         self.setLayout(layout)
         
-    def filter_functions_list(self):
-        text = self.function_search_bar.text().lower()
-        for i in range(self.functions_list.count()):
-            item = self.functions_list.item(i)
-            item.setHidden(text not in item.text().lower())
-        
     def refresh_functions_list(self):
         self.log_message("Loading Lambda functions...")
         self._disable_buttons()
         if self.worker and self.worker.isRunning():
             self.worker.cancel()
-        self.worker = AsyncWorker(self.lambda_manager.list_functions)
-        self.worker.finished.connect(self._on_functions_loaded)
-        self.worker.error.connect(self._on_functions_error)
+        self._functions_reload_selection = self.get_selected_function_name()
+        self._functions_first_page = True
+        self._refresh_token += 1
+        token = self._refresh_token
+        # Pages are shown as they arrive instead of after the whole listing
+        self.worker = AsyncWorker(self.lambda_manager.iter_function_pages)
+        self.worker.partial.connect(
+            lambda names, t=token: self._on_functions_page(names) if t == self._refresh_token else None)
+        self.worker.finished.connect(
+            lambda functions, t=token: self._on_functions_loaded(functions) if t == self._refresh_token else None)
+        self.worker.error.connect(
+            lambda e, t=token: self._on_functions_error(e) if t == self._refresh_token else None)
         self.worker.start()
 
+    def _on_functions_page(self, names):
+        if self._functions_first_page:
+            self._functions_first_page = False
+            with QSignalBlocker(self.functions_list.selectionModel()):
+                self.functions_model.set_names(names)
+        else:
+            self.functions_model.append_names(names)
+
     def _on_functions_loaded(self, functions):
         self._enable_buttons()
         self.log_message(f"Loaded {len(functions)} Lambda functions.")
-        self.functions_list.clear()
-        for function_name in functions:
-            item = QListWidgetItem(function_name)
-            item.setData(Qt.UserRole, function_name)
-            self.functions_list.addItem(item)
+        selection = self.functions_list.selectionModel()
+        if self._functions_first_page:
+            with QSignalBlocker(selection):
+                self.functions_model.set_names(functions)
+        # Restore the selection the reset dropped, unless the user picked another meanwhile
+        selected = self._functions_reload_selection
+        if selected and self.get_selected_function_name() is None:
+            with QSignalBlocker(selection):
+                _reselect(self.functions_list, self.functions_model.index_of(selected))
+        # Selection signals were held back during the reload; show the result once,
+        # re-reading the details since the reload may follow a change to them
+        self._selected_function = None
+        self.display_function_details()
 
     def _on_functions_error(self, e):
         self._enable_buttons()
@@ -1564,26 +2197,27 @@ class LambdaTab(BaseTab):
             self.log_message("Cancelled Lambda function loading.")
             
     def refresh_rules_list(self, function_name: str) -> None:
-        """Refresh the list of event rules for a function."""
-        if self._is_loading or not function_name:
+        """Refresh the list of event rules for a function on a worker thread."""
+        if not function_name:
             return
                 
-        self._is_loading = True
-        self._disable_buttons()
-        
-        try:
-            rules = self.lambda_manager.list_event_rules(function_name)
+        self._rules_token += 1
+        token = self._rules_token
+        # Reuse the ARN from the cached details instead of another round trip
+        cached = self.peek_cached_data((CacheKey.LAMBDA_FUNCTION, function_name))
+        function_arn = cached['raw']['Configuration']['FunctionArn'] if cached else None
+        self.run_in_background(
+            lambda: self.lambda_manager.list_event_rules(function_name, function_arn),
+            lambda rules: self._on_rules_loaded(token, rules),
+            lambda e: self.log_message(f"Error refreshing rules list: {str(e)}", error=True)
+        )
+
+    def _on_rules_loaded(self, token, rules):
+        if token != self._rules_token:
+            return
+        with batched_updates(self.rules_list):
             self.rules_list.clear()
-            
-            for rule in rules:
-                item = QListWidgetItem(rule['Name'])
-                item.setData(Qt.UserRole, rule['Name'])
-                self.rules_list.addItem(item)
-        except Exception as e:
-            self.log_message(f"Error refreshing rules list: {str(e)}", error=True)
-        finally:
-            self._is_loading = False
-            self._enable_buttons()
+            self.rules_list.addItems([rule['Name'] for rule in rules])
                 
     def _disable_buttons(self) -> None:
         """Disable all action buttons."""
@@ -1610,30 +2244,24 @@ class LambdaTab(BaseTab):
 
     def display_function_details(self):
         """Display details of the selected Lambda function."""
-        selected_items = self.functions_list.selectedItems()
-        if not selected_items:
+        function_name = self.get_selected_function_name()
+        if not function_name:
             self.clear_function_details()
             return
+        # Re-selecting the shown function would only repeat the rules lookup
+        if function_name == self._selected_function:
+            return
                 
-        function_name = selected_items[0].data(Qt.UserRole)
         try:
-            details = self.get_cached_data(
-                f'lambda_function_{function_name}',
-                lambda: self.lambda_manager.get_function(function_name)
+            cached = self.get_cached_data(
+                (CacheKey.LAMBDA_FUNCTION, function_name),
+                lambda: self._load_function_details(function_name),
+                stale_while_revalidate=True
             )
             
-            if details and 'Configuration' in details:
-                config = details['Configuration']
-                self.function_details.setText(
-                    f"Function Name: {config['FunctionName']}\n"
-                    f"Runtime: {config['Runtime']}\n"
-                    f"Handler: {config['Handler']}\n"
-                    f"Memory Size: {config['MemorySize']} MB\n"
-                    f"Timeout: {config['Timeout']} seconds\n"
-                    f"Last Modified: {config['LastModified']}\n"
-                    f"Role: {config['Role']}\n"
-                    f"Description: {config.get('Description', 'N/A')}"
-                )
+            if cached:
+                self.function_details.setText(cached['text'])
+                self._selected_function = function_name
                 
                 # Refresh event rules
                 self.refresh_rules_list(function_name)
@@ -1644,6 +2272,13 @@ class LambdaTab(BaseTab):
             self.show_error_dialog("Error", f"Failed to get function details: {str(e)}")
             self.clear_function_details()
                 
+    def _load_function_details(self, function_name):
+        """Fetch a function and render its details text once for the cache."""
+        details = self.lambda_manager.get_function(function_name)
+        if not details or 'Configuration' not in details:
+            return None
+        return {'raw': details, 'text': format_function_details(details['Configuration'])}
+                
     def display_rule_details(self):
         """Display details of the selected event rule."""
         selected_items = self.rules_list.selectedItems()
@@ -1651,7 +2286,7 @@ class LambdaTab(BaseTab):
             self.function_details.clear()
             return
                 
-        rule_name = selected_items[0].data(Qt.UserRole)
+        rule_name = selected_items[0].text()
         try:
             details = self.lambda_manager.get_event_rule(rule_name)
             if details:
@@ -1670,37 +2305,28 @@ class LambdaTab(BaseTab):
                 
     def create_event_rule(self):
         """Create a new event rule for the selected function."""
-        selected_items = self.functions_list.selectedItems()
-        if not selected_items:
+        function_name = self.get_selected_function_name()
+        if not function_name:
             self.show_error_dialog("Error", "Please select a function first")
             return
                 
-        function_name = selected_items[0].data(Qt.UserRole)
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create Event Rule")
-        layout = QFormLayout()
-        
-        schedule = QLineEdit()
-        schedule.setText("rate(1 day)")
-        
-        layout.addRow("Schedule Expression:", schedule)
         
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
+        if self._create_rule_dialog is None:
+            self._rule_schedule_input = QLineEdit()
+            self._create_rule_dialog = self.build_form_dialog("Create Event Rule", [
+                ("Schedule Expression:", self._rule_schedule_input),
+            ])
+        self._rule_schedule_input.setText("rate(1 day)")
         
-        layout.addRow(buttons)
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted:
-            if not self.validate_input(schedule.text(), "Schedule Expression"):
+        if self._create_rule_dialog.exec_() == QDialog.Accepted:
+            schedule = self._rule_schedule_input.text()
+            if not self.validate_input(schedule, "Schedule Expression"):
                 return
                     
             try:
                 rule_arn = self.lambda_manager.create_event_rule(
                     function_name=function_name,
-                    schedule_expression=schedule.text()
+                    schedule_expression=schedule
                 )
                 if rule_arn:
                     self.show_info_dialog("Success", f"Event rule created successfully: {rule_arn}")
@@ -1717,7 +2343,7 @@ class LambdaTab(BaseTab):
             self.show_error_dialog("Error", "Please select a rule to delete")
             return
                 
-        rule_name = selected_items[0].data(Qt.UserRole)
+        rule_name = selected_items[0].text()
         
         if not self.show_confirm_dialog("Confirm Delete", 
                                     f"Delete event rule {rule_name}?"):
@@ -1734,83 +2360,132 @@ class LambdaTab(BaseTab):
                 
     def get_selected_function_name(self) -> Optional[str]:
         """Get the name of the currently selected function."""
-        selected_items = self.functions_list.selectedItems()
-        if not selected_items:
-            return None
-        return selected_items[0].data(Qt.UserRole)
+        return _selected_row(self.functions_list)
             
     def deploy_function(self):
         """Deploy a new Lambda function."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Deploy Lambda Function")
-        layout = QFormLayout()
-        
-        function_name = QLineEdit()
-        runtime = QComboBox()
-        runtime.addItems(['python3.9', 'python3.8', 'python3.7'])
-        handler = QLineEdit()
-        handler.setText('lambda_function.lambda_handler')
-        memory_size = QSpinBox()
-        memory_size.setRange(128, 10240)
-        memory_size.setSingleStep(64)
-        memory_size.setValue(128)
-        timeout = QSpinBox()
-        timeout.setRange(1, 900)
-        timeout.setValue(3)
-        
-        # Add function name validation
-        function_name.textChanged.connect(lambda: self.validate_function_name(function_name))
-        
-        layout.addRow("Function Name:", function_name)
-        layout.addRow("Runtime:", runtime)
-        layout.addRow("Handler:", handler)
-        layout.addRow("Memory Size (MB):", memory_size)
-        layout.addRow("Timeout (seconds):", timeout)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addRow(buttons)
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted:
-            if not self.validate_input(function_name.text(), "Function Name"):
-                return
-            if not self.validate_input(handler.text(), "Handler"):
-                return
-                    
-            try:
-                file_path, _ = QFileDialog.getOpenFileName(
-                    self, 
-                    "Select Python File",
-                    "",
-                    "Python Files (*.py)"
+        if self._deploy_dialog is None:
+            self._deploy_name_input = QLineEdit()
+            self._deploy_runtime_input = QComboBox()
+            self._deploy_runtime_input.addItems(['python3.9', 'python3.8', 'python3.7'])
+            self._deploy_handler_input = QLineEdit()
+            self._deploy_memory_input = QSpinBox()
+            self._deploy_memory_input.setRange(128, 10240)
+            self._deploy_memory_input.setSingleStep(64)
+            self._deploy_timeout_input = QSpinBox()
+            self._deploy_timeout_input.setRange(1, 900)
+            self._deploy_role_input = QComboBox()
+            
+            # Add function name validation
+            self._deploy_name_input.textChanged.connect(
+                lambda: self.validate_function_name(self._deploy_name_input)
+            )
+            
+            self._deploy_dialog = self.build_form_dialog("Deploy Lambda Function", [
+                ("Function Name:", self._deploy_name_input),
+                ("Runtime:", self._deploy_runtime_input),
+                ("Handler:", self._deploy_handler_input),
+                ("Memory Size (MB):", self._deploy_memory_input),
+                ("Timeout (seconds):", self._deploy_timeout_input),
+                ("Execution Role:", self._deploy_role_input),
+            ])
+            self._deploy_dialog.accepted.connect(self._on_deploy_accepted)
+        
+        self._deploy_name_input.clear()
+        self._deploy_name_input.setStyleSheet("")
+        self._deploy_runtime_input.setCurrentIndex(0)
+        self._deploy_handler_input.setText('lambda_function.lambda_handler')
+        self._deploy_memory_input.setValue(128)
+        self._deploy_timeout_input.setValue(3)
+        self._load_deploy_roles()
+        # Window-modal open() instead of exec_(): no nested event loop, and
+        # the deploy continues from the accepted signal
+        self._deploy_dialog.open()
+
+    def _load_deploy_roles(self):
+        """Fill the execution role picker, reusing the IAM tab's snapshot when cached."""
+        snapshot = self.peek_cached_data(CacheKey.IAM_SNAPSHOT)
+        if snapshot:
+            self._set_deploy_roles(snapshot.values())
+            return
+        self._deploy_role_input.clear()
+        self._deploy_role_input.addItem("Loading roles...")
+        self.run_in_background(
+            shared_manager(IAMManager).list_roles,
+            self._set_deploy_roles,
+            lambda e: self.log_message(f"Error loading IAM roles: {str(e)}", error=True)
+        )
+
+    def _set_deploy_roles(self, roles):
+        self._deploy_role_input.clear()
+        for role in sorted(roles, key=lambda role: role['RoleName']):
+            self._deploy_role_input.addItem(role['RoleName'], role['Arn'])
+
+    def _on_deploy_accepted(self):
+        name = self._deploy_name_input.text()
+        handler = self._deploy_handler_input.text()
+        role_arn = self._deploy_role_input.currentData()
+        if not self.validate_input(name, "Function Name"):
+            return
+        if not self.validate_input(handler, "Handler"):
+            return
+        if not role_arn:
+            self.show_error_dialog("Error", "Please select an execution role")
+            return
+                
+        try:
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, 
+                "Select Python File",
+                "",
+                "Python Files (*.py)"
+            )
+                
+            if file_path:
+                self._disable_buttons()
+                self.deploy_progress.setVisible(True)
+                self.log_message(f"Packaging and deploying Lambda function '{name}'...")
+                # Compression and upload run off the UI thread
+                self._deploy_worker = AsyncWorker(
+                    self._package_and_deploy,
+                    file_path,
+                    role_arn=role_arn,
+                    function_name=name,
+                    runtime=self._deploy_runtime_input.currentText(),
+                    handler=handler,
+                    memory_size=self._deploy_memory_input.value(),
+                    timeout=self._deploy_timeout_input.value()
                 )
-                    
-                if file_path:
-                    # Create ZIP package
-                    if not self.lambda_manager.create_lambda_zip(file_path):
-                        self.show_error_dialog("Error", "Failed to create ZIP package")
-                        return
-                            
-                    success = self.lambda_manager.deploy_lambda(
-                        function_name=function_name.text(),
-                        runtime=runtime.currentText(),
-                        handler=handler.text(),
-                        memory_size=memory_size.value(),
-                        timeout=timeout.value(),
-                        code_file=file_path
-                    )
-                        
-                    if success:
-                        self.clear_cache('lambda_functions')
-                        self.refresh_functions_list()
-                        self.show_info_dialog("Success", f"Lambda function '{function_name.text()}' deployed successfully.")
-                    else:
-                        self.show_error_dialog("Error", f"Failed to deploy Lambda function '{function_name.text()}'.")
-            except Exception as e:
-                self.show_error_dialog("Error", f"Error deploying Lambda function: {str(e)}")
+                self._deploy_worker.finished.connect(lambda arn: self._on_function_deployed(name, arn))
+                self._deploy_worker.error.connect(self._on_deploy_error)
+                self._deploy_worker.start()
+        except Exception as e:
+            self.show_error_dialog("Error", f"Error deploying Lambda function: {str(e)}")
+
+    def _package_and_deploy(self, file_path, **deploy_kwargs):
+        """Zip the handler to a temporary file and deploy it. Runs on a worker thread."""
+        package_path = self.lambda_manager.create_lambda_zip_file(file_path)
+        if package_path is None:
+            raise ValueError("Failed to create ZIP package")
+        try:
+            return self.lambda_manager.deploy_lambda(package_path=package_path, **deploy_kwargs)
+        finally:
+            os.remove(package_path)
+
+    def _on_function_deployed(self, function_name, function_arn):
+        self._enable_buttons()
+        self.deploy_progress.setVisible(False)
+        if function_arn:
+            self.clear_cache(CacheKey.LAMBDA_FUNCTIONS)
+            self.refresh_functions_list()
+            self.show_info_dialog("Success", f"Lambda function '{function_name}' deployed successfully.")
+        else:
+            self.show_error_dialog("Error", f"Failed to deploy Lambda function '{function_name}'.")
+
+    def _on_deploy_error(self, e):
+        self._enable_buttons()
+        self.deploy_progress.setVisible(False)
+        self.show_error_dialog("Error", f"Error deploying Lambda function: {str(e)}")
                     
     def validate_function_name(self, function_name_input: QLineEdit):
         """Validate the function name and provide feedback."""
@@ -1826,17 +2501,17 @@ class LambdaTab(BaseTab):
                 
     def clear_function_details(self):
         """Clear all function-related displays."""
+        self._selected_function = None
         self.function_details.clear()
         self.rules_list.clear()
         
     def update_function(self):
         """Update an existing Lambda function."""
-        selected_items = self.functions_list.selectedItems()
-        if not selected_items:
+        function_name = self.get_selected_function_name()
+        if not function_name:
             self.show_error_dialog("Error", "Please select a function to update.")
             return
                 
-        function_name = selected_items[0].data(Qt.UserRole)
         
         try:
             file_path, _ = QFileDialog.getOpenFileName(
@@ -1851,8 +2526,8 @@ class LambdaTab(BaseTab):
                     function_name=function_name,
                     code_file=file_path
                 ):
-                    self.clear_cache('lambda_functions')
-                    self.clear_cache(f'lambda_function_{function_name}')
+                    self.clear_cache(CacheKey.LAMBDA_FUNCTIONS)
+                    self.clear_cache((CacheKey.LAMBDA_FUNCTION, function_name))
                     self.refresh_functions_list()
                     self.show_info_dialog("Success", f"Lambda function '{function_name}' updated successfully.")
                 else:
@@ -1862,63 +2537,323 @@ class LambdaTab(BaseTab):
                 
     def delete_function(self):
         """Delete the selected Lambda function."""
-        selected_items = self.functions_list.selectedItems()
-        if not selected_items:
+        function_name = self.get_selected_function_name()
+        if not function_name:
             self.show_error_dialog("Error", "Please select a function to delete.")
             return
                 
-        function_name = selected_items[0].data(Qt.UserRole)
         
         if not self.show_confirm_dialog("Confirm Delete", 
                                     f"WARNING: This will permanently delete function '{function_name}'. Continue?"):
             return
                 
-        try:
-            if self.lambda_manager.delete_function(function_name):
-                self.clear_cache('lambda_functions')
-                self.clear_cache(f'lambda_function_{function_name}')
-                self.refresh_functions_list()
-                self.show_info_dialog("Success", f"Lambda function '{function_name}' deleted successfully.")
-            else:
-                self.show_error_dialog("Error", f"Failed to delete Lambda function '{function_name}'.")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error deleting Lambda function: {str(e)}")
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.lambda_manager.delete_function(function_name),
+            lambda deleted: self._on_function_deleted(function_name, deleted),
+            self._on_delete_function_error
+        )
+
+    def _on_function_deleted(self, function_name, deleted):
+        self._enable_buttons()
+        if deleted:
+            self.clear_cache(CacheKey.LAMBDA_FUNCTIONS)
+            self.clear_cache((CacheKey.LAMBDA_FUNCTION, function_name))
+            self.refresh_functions_list()
+            self.show_info_dialog("Success", f"Lambda function '{function_name}' deleted successfully.")
+        else:
+            self.show_error_dialog("Error", f"Failed to delete Lambda function '{function_name}'.")
+
+    def _on_delete_function_error(self, e):
+        self._enable_buttons()
+        self.show_error_dialog("Error", f"Error deleting Lambda function: {str(e)}")
 
     def export_functions(self):
-        functions = []
-        for i in range(self.functions_list.count()):
-            item = self.functions_list.item(i)
-            if not item.isHidden():
-                functions.append(item.text())
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export Lambda Functions", "lambda_functions.json", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Lambda Functions", "lambda_functions.jsonl", EXPORT_SAVE_FILTER)
         if file_path:
-            with open(file_path, 'w') as f:
-                json.dump(functions, f, indent=2)
-            self.show_info_dialog("Export", f"Exported {len(functions)} Lambda functions to {file_path}")
+            self.export_in_background(file_path, _proxy_texts(self.functions_list), "Lambda functions")
     def import_functions(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Import Lambda Functions", "", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import Lambda Functions", "", EXPORT_OPEN_FILTER)
         if file_path:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            self.show_info_dialog("Import", f"Imported {len(data)} Lambda functions from {file_path}\n(Import does not create resources)")
+            self.import_in_background(file_path, "Lambda functions")
+
+class NameListModel(QAbstractListModel):
+    """List model over plain resource names; UserRole also returns the name."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._lowered = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.UserRole):
+            return self._names[index.row()]
+        if role == FILTER_ROLE:
+            return self._lowered[index.row()]
+        return None
+
+    def names(self):
+        return list(self._names)
+
+    def folded_names(self):
+        return list(self._lowered)
+
+    def set_names(self, names):
+        """Replace the model contents with a single reset."""
+        self.beginResetModel()
+        self._names = list(names)
+        self._lowered = [name.casefold() for name in self._names]
+        self.endResetModel()
+
+    def append_names(self, names):
+        """Add names after the existing rows."""
+        if not names:
+            return
+        first = len(self._names)
+        self.beginInsertRows(QModelIndex(), first, first + len(names) - 1)
+        self._names.extend(names)
+        self._lowered.extend(name.casefold() for name in names)
+        self.endInsertRows()
+
+    def index_of(self, name):
+        """Return the row holding name, or -1."""
+        try:
+            return self._names.index(name)
+        except ValueError:
+            return -1
+
+class IamEntityModel(QAbstractListModel):
+    """List model over the raw dicts returned by the IAM APIs.
+    
+    Names and case-folded names are kept in lists parallel to the rows, so
+    display, filtering, export and lookup by name never index into the dicts.
+    """
+    def __init__(self, name_key, parent=None):
+        super().__init__(parent)
+        self._name_key = name_key
+        self._rows = []
+        self._names = []
+        self._lowered = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.UserRole:
+            return self._rows[index.row()]
+        if role == FILTER_ROLE:
+            return self._lowered[index.row()]
+        return None
+
+    def names(self):
+        return list(self._names)
+
+    def folded_names(self):
+        return list(self._lowered)
+
+    @staticmethod
+    def prepare_rows(rows, name_key):
+        """Return rows as a list with their names and case-folded names; safe off the GUI thread."""
+        rows = list(rows)
+        names = [entity[name_key] for entity in rows]
+        return rows, names, [name.casefold() for name in names]
+
+    def set_rows(self, rows, names=None, folded=None):
+        """Replace the model contents with a single reset.
+        
+        names and folded, when given, are the matching lists from prepare_rows.
+        """
+        if names is None or folded is None:
+            rows, names, folded = self.prepare_rows(rows, self._name_key)
+        self.beginResetModel()
+        self._rows = rows
+        self._names = names
+        self._lowered = folded
+        self.endResetModel()
+
+    def index_of(self, name):
+        """Return the row holding the named entity, or -1."""
+        try:
+            return self._names.index(name)
+        except ValueError:
+            return -1
+
+    def append_row(self, entity):
+        row = len(self._rows)
+        name = entity[self._name_key]
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(entity)
+        self._names.append(name)
+        self._lowered.append(name.casefold())
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        if 0 <= row < len(self._rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            del self._names[row]
+            del self._lowered[row]
+            self.endRemoveRows()
+
+def _configure_list_view(view):
+    """Tune a plain-text QListView for large row counts."""
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.Batched)
+    view.setBatchSize(100)
+    view.setResizeMode(QListView.Adjust)
+
+def _selected_row(view):
+    """Return the UserRole data of the first selected row in a QListView."""
+    indexes = view.selectionModel().selectedIndexes()
+    return indexes[0].data(Qt.UserRole) if indexes else None
+
+def _reselect(view, row):
+    """Select a source model row in a QListView, if it still exists and passes any filter proxy."""
+    if row < 0:
+        return
+    model = view.model()
+    if isinstance(model, QSortFilterProxyModel):
+        index = model.mapFromSource(model.sourceModel().index(row, 0))
+    else:
+        index = model.index(row, 0)
+    if index.isValid():
+        view.selectionModel().select(index, QItemSelectionModel.ClearAndSelect)
+
+def _filtered_list_view(model, search_bar, parent, delay=150):
+    """Build a QListView showing model through a case-insensitive proxy driven by search_bar.
+    
+    The model must serve case-folded text for FILTER_ROLE.
+    
+    The filter is applied once typing pauses for delay ms, so a burst of
+    keystrokes costs a single proxy re-filter.
+    """
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    # Match against the model's pre-folded FILTER_ROLE text case-sensitively
+    proxy.setFilterRole(FILTER_ROLE)
+    proxy.setFilterCaseSensitivity(Qt.CaseSensitive)
+    filter_timer = QTimer(proxy)
+    filter_timer.setSingleShot(True)
+    filter_timer.setInterval(delay)
+    filter_timer.timeout.connect(lambda: proxy.setFilterFixedString(search_bar.text().casefold()))
+    search_bar.textChanged.connect(filter_timer.start)
+    view = QListView()
+    view.setModel(proxy)
+    _configure_list_view(view)
+    return view
+
+def _proxy_texts(view):
+    """Return the display text of each row that passes a view's filter proxy.
+    
+    Matches the proxy's fixed-string filter against the source model's
+    case-folded names in Python rather than reading each proxy row through Qt.
+    """
+    proxy = view.model()
+    source = proxy.sourceModel()
+    needle = proxy.filterRegExp().pattern()
+    return [name for name, lowered in zip(source.names(), source.folded_names()) if needle in lowered]
+
+def _clear_text(view):
+    """Clear a text view, skipping the document reset when it is already empty."""
+    if not view.document().isEmpty():
+        view.clear()
+
+class EntityPickerDialog(QDialog):
+    """Reusable searchable picker over any single-column list model."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._prompt = QLabel()
+        self._filter = QLineEdit()
+        self._filter.setPlaceholderText("Filter...")
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self._filter.textChanged.connect(self._proxy.setFilterFixedString)
+        
+        self._view = QListView()
+        self._view.setModel(self._proxy)
+        _configure_list_view(self._view)
+        self._view.doubleClicked.connect(self.accept)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        
+        layout = QVBoxLayout()
+        layout.addWidget(self._prompt)
+        layout.addWidget(self._filter)
+        layout.addWidget(self._view)
+        layout.addWidget(buttons)
+        self.setLayout(layout)
+
+    def pick(self, title, model, prompt) -> Optional[str]:
+        """Show the picker over model and return the chosen display name, or None."""
+        self.setWindowTitle(title)
+        self._prompt.setText(prompt)
+        self._filter.clear()
+        self._proxy.setSourceModel(model)
+        if self._proxy.rowCount():
+            self._view.setCurrentIndex(self._proxy.index(0, 0))
+        try:
+            if self.exec_() != QDialog.Accepted:
+                return None
+            index = self._view.currentIndex()
+            return index.data() if index.isValid() else None
+        finally:
+            self._proxy.setSourceModel(None)
 
 class IAMTab(BaseTab):
+    _ROLE_TEMPLATE = (
+        "Role Name: {RoleName}\n"
+        "ARN: {Arn}\n"
+        "Create Date: {CreateDate}\n"
+        "Description: {Description}\n"
+        "Max Session Duration: {MaxSessionDuration}\n"
+        "Path: {Path}\n"
+        "Last Used: {LastUsed}\n"
+        "Attached Policies: {PolicyCount}"
+    )
+    _PROFILE_TEMPLATE = (
+        "Profile Name: {InstanceProfileName}\n"
+        "ARN: {Arn}\n"
+        "Create Date: {CreateDate}\n"
+        "Path: {Path}\n"
+        "Roles: {Roles}"
+    )
+
     def __init__(self):
         super().__init__()
         self.worker = None  # Ensure worker is defined before any method uses it
-        self.iam_manager = IAMManager()
+        self.iam_manager = shared_manager(IAMManager)
         self._is_loading = False
+        self._profiles_reload_pending = False
+        # Bumped per roles refresh; callbacks from superseded refreshes are dropped
+        self._refresh_token = 0
         self._selected_role = None
         self._selected_profile = None
+        self._rendered_role_cache = {}
+        self._rendered_profile_cache = {}
+        self._create_role_dialog = None
+        self._create_profile_dialog = None
+        self._entity_picker = None
         self.setup_ui()
+
+    def initial_load(self):
         self.refresh_roles_list()
+        self.refresh_profiles_list()
         
     def setup_ui(self) -> None:
         layout = QVBoxLayout()
         # Search bar for roles
         self.role_search_bar = QLineEdit()
         self.role_search_bar.setPlaceholderText("Search IAM Roles...")
-        self.role_search_bar.textChanged.connect(self.filter_roles_list)
         layout.addWidget(self.role_search_bar)
         # Export/Import buttons
         export_import_layout = QHBoxLayout()
@@ -1933,8 +2868,9 @@ class IAMTab(BaseTab):
         role_group = QGroupBox("Role Management")
         role_layout = QVBoxLayout()
         
-        self.roles_list = QListWidget()
-        self.roles_list.itemSelectionChanged.connect(self.display_role_details)
+        self.roles_model = IamEntityModel('RoleName', self)
+        self.roles_list = _filtered_list_view(self.roles_model, self.role_search_bar, self)
+        self.roles_list.selectionModel().selectionChanged.connect(self.display_role_details)
         role_layout.addWidget(QLabel("IAM Roles:"))
         role_layout.addWidget(self.roles_list)
         
@@ -1958,6 +2894,7 @@ class IAMTab(BaseTab):
         
         self.role_details = QTextEdit()
         self.role_details.setReadOnly(True)
+        self.role_details.document().setMaximumBlockCount(64)
         role_details_layout.addWidget(QLabel("Role Details:"))
         role_details_layout.addWidget(self.role_details)
         
@@ -1968,8 +2905,11 @@ class IAMTab(BaseTab):
         profile_group = QGroupBox("Instance Profile Management")
         profile_layout = QVBoxLayout()
         
-        self.profiles_list = QListWidget()
-        self.profiles_list.itemSelectionChanged.connect(self.display_profile_details)
+        self.profiles_list = QListView()
+        self.profiles_model = IamEntityModel('InstanceProfileName', self)
+        self.profiles_list.setModel(self.profiles_model)
+        _configure_list_view(self.profiles_list)
+        self.profiles_list.selectionModel().selectionChanged.connect(self.display_profile_details)
         profile_layout.addWidget(QLabel("Instance Profiles:"))
         profile_layout.addWidget(self.profiles_list)
         
@@ -1984,6 +2924,12 @@ class IAMTab(BaseTab):
         self.add_role_button.clicked.connect(self.add_role_to_profile)
         self.remove_role_button.clicked.connect(self.remove_role_from_profile)
         
+        self._mutating_buttons = (
+            self.create_role_button, self.delete_role_button,
+            self.create_profile_button, self.delete_profile_button,
+            self.add_role_button, self.remove_role_button,
+        )
+        
         profile_buttons.addWidget(self.create_profile_button)
         profile_buttons.addWidget(self.delete_profile_button)
         profile_buttons.addWidget(self.add_role_button)
@@ -1999,6 +2945,7 @@ class IAMTab(BaseTab):
         
         self.profile_details = QTextEdit()
         self.profile_details.setReadOnly(True)
+        self.profile_details.document().setMaximumBlockCount(64)
         profile_details_layout.addWidget(QLabel("Profile Details:"))
         profile_details_layout.addWidget(self.profile_details)
         
@@ -2007,30 +2954,38 @@ class IAMTab(BaseTab):
         
         self.setLayout(layout)
         
-    def filter_roles_list(self):
-        text = self.role_search_bar.text().lower()
-        for i in range(self.roles_list.count()):
-            item = self.roles_list.item(i)
-            item.setHidden(text not in item.text().lower())
-        
     def refresh_roles_list(self):
         self.log_message("Loading IAM roles...")
         self._disable_buttons()
         if self.worker and self.worker.isRunning():
             self.worker.cancel()
-        self.worker = AsyncWorker(self.iam_manager.list_roles)
-        self.worker.finished.connect(self._on_roles_loaded)
-        self.worker.error.connect(self._on_roles_error)
+        self._refresh_token += 1
+        token = self._refresh_token
+        self.worker = AsyncWorker(self._fetch_roles)
+        self.worker.finished.connect(
+            lambda result, t=token: self._on_roles_loaded(*result) if t == self._refresh_token else None)
+        self.worker.error.connect(
+            lambda e, t=token: self._on_roles_error(e) if t == self._refresh_token else None)
         self.worker.start()
 
-    def _on_roles_loaded(self, roles):
+    def _fetch_roles(self):
+        """Fetch the role snapshot and build the list model's rows on the worker thread."""
+        snapshot = self.iam_manager.snapshot()
+        return (snapshot,) + IamEntityModel.prepare_rows(snapshot.values(), 'RoleName')
+
+    def _on_roles_loaded(self, snapshot, rows, names, folded):
         self._enable_buttons()
-        self.log_message(f"Loaded {len(roles)} IAM roles.")
-        self.roles_list.clear()
-        for role in roles:
-            item = QListWidgetItem(role['RoleName'])
-            item.setData(Qt.UserRole, role['RoleName'])
-            self.roles_list.addItem(item)
+        # Role details are looked up in the snapshot, so selecting a role needs no get_role
+        self.set_cached_data(CacheKey.IAM_SNAPSHOT, snapshot)
+        self._rendered_role_cache.clear()
+        self.log_message(f"Loaded {len(snapshot)} IAM roles.")
+        selected = self.get_selected_role_name()
+        # Keep the reset from firing selection slots; restore the selection by name
+        with batched_updates(self.roles_list), QSignalBlocker(self.roles_list.selectionModel()):
+            self.roles_model.set_rows(rows, names, folded)
+            _reselect(self.roles_list, self.roles_model.index_of(selected))
+        if selected:
+            self.display_role_details()
 
     def _on_roles_error(self, e):
         self._enable_buttons()
@@ -2042,330 +2997,510 @@ class IAMTab(BaseTab):
             self.log_message("Cancelled IAM role loading.")
             
     def refresh_profiles_list(self) -> None:
-        """Refresh the list of instance profiles."""
+        """Refresh the list of instance profiles on a worker thread.
+        
+        A refresh requested while one is in flight is queued rather than
+        dropped, since the running fetch may predate the change that
+        prompted it.
+        """
         if self._is_loading:
+            self._profiles_reload_pending = True
             return
                 
         self._is_loading = True
         self._disable_buttons()
-        
-        try:
-            profiles = self.iam_manager.iam_client.list_instance_profiles().get('InstanceProfiles', [])
-            self.profiles_list.clear()
-            
-            for profile in profiles:
-                item = QListWidgetItem(profile['InstanceProfileName'])
-                item.setData(Qt.UserRole, profile['InstanceProfileName'])
-                self.profiles_list.addItem(item)
-        except Exception as e:
-            self.log_message(f"Error refreshing profiles list: {str(e)}", error=True)
-        finally:
-            self._is_loading = False
-            self._enable_buttons()
+        self.run_in_background(self._fetch_profiles, self._on_profiles_loaded, self._on_profiles_error)
+
+    def _finish_profiles_load(self):
+        self._is_loading = False
+        self._enable_buttons()
+        if self._profiles_reload_pending:
+            self._profiles_reload_pending = False
+            self.refresh_profiles_list()
+
+    def _on_profiles_loaded(self, result):
+        profiles, rows, names, folded = result
+        # List responses already include each profile's roles
+        self.set_cached_data(CacheKey.IAM_PROFILES, profiles)
+        self._rendered_profile_cache.clear()
+        selected = self.get_selected_profile_name()
+        with batched_updates(self.profiles_list), QSignalBlocker(self.profiles_list.selectionModel()):
+            self.profiles_model.set_rows(rows, names, folded)
+            _reselect(self.profiles_list, self.profiles_model.index_of(selected))
+        if selected:
+            self.display_profile_details()
+        self._finish_profiles_load()
+
+    def _on_profiles_error(self, e):
+        self.log_message(f"Error refreshing profiles list: {str(e)}", error=True)
+        self._finish_profiles_load()
+                
+    def _fetch_profiles(self):
+        """Fetch all instance profiles keyed by name, with the list model's rows."""
+        profiles = {
+            profile['InstanceProfileName']: profile
+            for profile in self.iam_manager.list_instance_profiles()
+        }
+        return (profiles,) + IamEntityModel.prepare_rows(profiles.values(), 'InstanceProfileName')
                 
     def _disable_buttons(self) -> None:
         """Disable all action buttons."""
-        self.create_role_button.setEnabled(False)
-        self.delete_role_button.setEnabled(False)
-        self.create_profile_button.setEnabled(False)
-        self.delete_profile_button.setEnabled(False)
-        self.add_role_button.setEnabled(False)
-        self.remove_role_button.setEnabled(False)
+        self.set_buttons_enabled(self._mutating_buttons, False)
         
     def _enable_buttons(self) -> None:
         """Enable all action buttons."""
-        self.create_role_button.setEnabled(True)
-        self.delete_role_button.setEnabled(True)
-        self.create_profile_button.setEnabled(True)
-        self.delete_profile_button.setEnabled(True)
-        self.add_role_button.setEnabled(True)
-        self.remove_role_button.setEnabled(True)
+        self.set_buttons_enabled(self._mutating_buttons, True)
         
-    def __del__(self) -> None:
-        """Cleanup resources when the tab is destroyed."""
-        try:
-            self.iam_manager = None
-        except Exception as e:
-            logger.error(f"Error during cleanup: {str(e)}")
+    def closeEvent(self, event):
+        """Stop IAM requests deterministically instead of relying on finalizers."""
+        if self.worker:
+            self.worker.cancel()
+            self.worker.wait(200)
+        super().closeEvent(event)
+        self.iam_manager = None
+
+    def get_selected_role_name(self) -> Optional[str]:
+        """Get the name of the currently selected role."""
+        role = _selected_row(self.roles_list)
+        return role['RoleName'] if role else None
+
+    def get_selected_profile_name(self) -> Optional[str]:
+        """Get the name of the currently selected instance profile."""
+        profile = _selected_row(self.profiles_list)
+        return profile['InstanceProfileName'] if profile else None
+
+    def _on_iam_error(self, message, e):
+        self._enable_buttons()
+        self.show_error_dialog("Error", f"{message}: {str(e)}")
 
     def display_role_details(self):
         """Display details of the selected IAM role."""
-        selected_items = self.roles_list.selectedItems()
-        if not selected_items:
-            self.role_details.clear()
+        role_name = self.get_selected_role_name()
+        if not role_name:
+            _clear_text(self.role_details)
             return
                 
-        role_name = selected_items[0].data(Qt.UserRole)
-        try:
-            details = self.get_cached_data(
-                f'iam_role_{role_name}',
-                lambda: self.iam_manager.get_role(role_name)
-            )
+        rendered = self._rendered_role_cache.get(role_name)
+        if rendered is not None:
+            self.role_details.setPlainText(rendered)
+            return
             
-            if details:
-                self.role_details.setText(
-                    f"Role Name: {details['RoleName']}\n"
-                    f"ARN: {details['Arn']}\n"
-                    f"Create Date: {details['CreateDate']}\n"
-                    f"Description: {details.get('Description', 'N/A')}\n"
-                    f"Max Session Duration: {details.get('MaxSessionDuration', 'N/A')}\n"
-                    f"Path: {details.get('Path', '/')}\n"
-                    f"Last Used: {details.get('RoleLastUsed', {}).get('LastUsedDate', 'Never')}\n"
-                    f"Attached Policies: {len(details.get('AttachedPolicies', []))}"
-                )
-            else:
-                self.role_details.clear()
-                    
-        except Exception as e:
-            self.show_error_dialog("Error", f"Failed to get role details: {str(e)}")
-            self.role_details.clear()
+        details = self._cached_role(role_name)
+        if details is not None:
+            self._show_role_details(details)
+            return
+            
+        _clear_text(self.role_details)
+        self.run_in_background(
+            lambda: self._fetch_role_details(role_name),
+            lambda details: self._on_role_details_loaded(role_name, details),
+            lambda e: self._on_details_error(self.role_details, "Failed to get role details", e)
+        )
+
+    def _fetch_role_details(self, role_name):
+        """Fetch a role outside the snapshot, matching the snapshot's shape."""
+        details = self.iam_manager.get_role(role_name)
+        if details and 'AttachedManagedPolicies' not in details:
+            details['AttachedManagedPolicies'] = self.iam_manager.list_attached_role_policies(role_name)
+        return details
+
+    def _cached_role(self, role_name):
+        """Look a role up in the cached snapshot, then in its own entry."""
+        snapshot = self.peek_cached_data(CacheKey.IAM_SNAPSHOT)
+        if snapshot and role_name in snapshot:
+            return snapshot[role_name]
+        return self.peek_cached_data((CacheKey.IAM_ROLE, role_name))
+
+    def _remember_role(self, role_name, details):
+        """Store a role in the cached snapshot, or in its own entry when there is none."""
+        snapshot = self.peek_cached_data(CacheKey.IAM_SNAPSHOT)
+        if snapshot is not None:
+            snapshot[role_name] = details
+        else:
+            self.set_cached_data((CacheKey.IAM_ROLE, role_name), details)
+
+    def _on_role_details_loaded(self, role_name, details):
+        if details:
+            self._remember_role(role_name, details)
+        # Ignore results for a role that is no longer selected
+        if self.get_selected_role_name() == role_name:
+            self._show_role_details(details)
+
+    def _show_role_details(self, details):
+        if not details:
+            _clear_text(self.role_details)
+            return
+            
+        role_name = details['RoleName']
+        rendered = self._rendered_role_cache.get(role_name)
+        if rendered is None:
+            rendered = self._ROLE_TEMPLATE.format_map({
+                'RoleName': role_name,
+                'Arn': details['Arn'],
+                'CreateDate': details['CreateDate'],
+                'Description': details.get('Description', 'N/A'),
+                'MaxSessionDuration': details.get('MaxSessionDuration', 'N/A'),
+                'Path': details.get('Path', '/'),
+                # ListRoles omits RoleLastUsed entirely; an empty dict means never used
+                'LastUsed': (details['RoleLastUsed'].get('LastUsedDate', 'Never')
+                             if 'RoleLastUsed' in details else 'Unknown'),
+                'PolicyCount': len(details.get('AttachedManagedPolicies',
+                                               details.get('AttachedPolicies', []))),
+            })
+            self._rendered_role_cache[role_name] = rendered
+        self.role_details.setPlainText(rendered)
+
+    def _on_details_error(self, view, message, e):
+        self.show_error_dialog("Error", f"{message}: {str(e)}")
+        _clear_text(view)
                 
     def display_profile_details(self):
         """Display details of the selected instance profile."""
-        selected_items = self.profiles_list.selectedItems()
-        if not selected_items:
-            self.profile_details.clear()
+        profile_name = self.get_selected_profile_name()
+        if not profile_name:
+            _clear_text(self.profile_details)
             return
                 
-        profile_name = selected_items[0].data(Qt.UserRole)
-        try:
-            details = self.get_cached_data(
-                f'iam_profile_{profile_name}',
-                lambda: self.iam_manager.get_instance_profile(profile_name)
-            )
+        rendered = self._rendered_profile_cache.get(profile_name)
+        if rendered is not None:
+            self.profile_details.setPlainText(rendered)
+            return
             
-            if details:
-                self.profile_details.setText(
-                    f"Profile Name: {details['InstanceProfileName']}\n"
-                    f"ARN: {details['Arn']}\n"
-                    f"Create Date: {details['CreateDate']}\n"
-                    f"Path: {details.get('Path', '/')}\n"
-                    f"Roles: {', '.join([role['RoleName'] for role in details.get('Roles', [])])}"
-                )
-            else:
-                self.profile_details.clear()
-                    
-        except Exception as e:
-            self.show_error_dialog("Error", f"Failed to get profile details: {str(e)}")
-            self.profile_details.clear()
+        details = self._cached_profile(profile_name)
+        if details is not None:
+            self._show_profile_details(details)
+            return
+            
+        _clear_text(self.profile_details)
+        self.run_in_background(
+            lambda: self.iam_manager.get_instance_profile(profile_name),
+            lambda details: self._on_profile_details_loaded(profile_name, details),
+            lambda e: self._on_details_error(self.profile_details, "Failed to get profile details", e)
+        )
+
+    def _cached_profile(self, profile_name):
+        """Look a profile up in the cached listing, then in its own entry."""
+        profiles = self.peek_cached_data(CacheKey.IAM_PROFILES)
+        if profiles and profile_name in profiles:
+            return profiles[profile_name]
+        return self.peek_cached_data((CacheKey.IAM_PROFILE, profile_name))
+
+    def _remember_profile(self, profile_name, details):
+        """Store a profile in the cached listing, or in its own entry when there is none."""
+        profiles = self.peek_cached_data(CacheKey.IAM_PROFILES)
+        if profiles is not None:
+            profiles[profile_name] = details
+        else:
+            self.set_cached_data((CacheKey.IAM_PROFILE, profile_name), details)
+
+    def _on_profile_details_loaded(self, profile_name, details):
+        if details:
+            self._remember_profile(profile_name, details)
+        if self.get_selected_profile_name() == profile_name:
+            self._show_profile_details(details)
+
+    def _show_profile_details(self, details):
+        if not details:
+            _clear_text(self.profile_details)
+            return
+            
+        profile_name = details['InstanceProfileName']
+        rendered = self._rendered_profile_cache.get(profile_name)
+        if rendered is None:
+            rendered = self._PROFILE_TEMPLATE.format_map({
+                'InstanceProfileName': profile_name,
+                'Arn': details['Arn'],
+                'CreateDate': details['CreateDate'],
+                'Path': details.get('Path', '/'),
+                'Roles': ', '.join(role['RoleName'] for role in details.get('Roles', [])),
+            })
+            self._rendered_profile_cache[profile_name] = rendered
+        self.profile_details.setPlainText(rendered)
                 
     def create_role(self):
         """Create a new IAM role."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create IAM Role")
-        layout = QFormLayout()
-        
-        role_name = QLineEdit()
-        description = QLineEdit()
-        role_type = QComboBox()
-        role_type.addItems(['EC2', 'Lambda'])
-        
-        # Add role name validation
-        role_name.textChanged.connect(lambda: self.validate_role_name(role_name))
-        
-        layout.addRow("Role Name:", role_name)
-        layout.addRow("Description:", description)
-        layout.addRow("Role Type:", role_type)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addRow(buttons)
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted:
-            if not self.validate_input(role_name.text(), "Role Name"):
+        if self._create_role_dialog is None:
+            self._create_role_name = QLineEdit()
+            self._create_role_desc = QLineEdit()
+            self._create_role_type = QComboBox()
+            self._create_role_type.addItems(['EC2', 'Lambda'])
+            self._create_role_dialog = self.build_form_dialog("Create IAM Role", [
+                ("Role Name:", self._create_role_name),
+                ("Description:", self._create_role_desc),
+                ("Role Type:", self._create_role_type),
+            ])
+            
+            # Add role name validation, debounced so typing does not revalidate per keystroke
+            self._validate_role_timer = self.create_debounce_timer(
+                lambda: self.validate_role_name(self._create_role_name),
+                parent=self._create_role_dialog
+            )
+            self._create_role_name.textChanged.connect(lambda _: self._validate_role_timer.start())
+            
+        self._create_role_name.clear()
+        self._create_role_name.setStyleSheet("")
+        self._create_role_name.setProperty('_last_validated', None)
+        self._create_role_name.setProperty('_last_valid', None)
+        self._create_role_desc.clear()
+        self._create_role_type.setCurrentIndex(0)
+        
+        if self._create_role_dialog.exec_() == QDialog.Accepted:
+            name = self._create_role_name.text()
+            if not self.validate_input(name, "Role Name"):
                 return
                     
-            try:
-                if self.iam_manager.create_role(
-                    role_name=role_name.text(),
-                    description=description.text(),
-                    role_type=role_type.currentText()
-                ):
-                    self.clear_cache('iam_roles')
-                    self.refresh_roles_list()
-                    self.show_info_dialog("Success", f"Role '{role_name.text()}' created successfully")
-                else:
-                    self.show_error_dialog("Error", f"Failed to create role '{role_name.text()}'")
-            except Exception as e:
-                self.show_error_dialog("Error", f"Error creating role: {str(e)}")
+            kwargs = {
+                'role_name': name,
+                'description': self._create_role_desc.text(),
+                'role_type': self._create_role_type.currentText()
+            }
+            self._disable_buttons()
+            self.run_in_background(
+                lambda: self.iam_manager.create_role(**kwargs),
+                lambda result: self._on_role_created(name, result),
+                lambda e: self._on_iam_error("Error creating role", e)
+            )
+
+    def _on_role_created(self, role_name, role):
+        self._enable_buttons()
+        if role:
+            # Patch the list locally instead of re-listing every role
+            self._remember_role(role_name, role)
+            self.roles_model.append_row(role)
+            self.show_info_dialog("Success", f"Role '{role_name}' created successfully")
+        else:
+            self.show_error_dialog("Error", f"Failed to create role '{role_name}'")
                     
     def validate_role_name(self, role_name_input: QLineEdit):
         """Validate the role name and provide feedback."""
         role_name = role_name_input.text()
-        if not role_name:
+        if not role_name or role_name == role_name_input.property('_last_validated'):
             return
+        role_name_input.setProperty('_last_validated', role_name)
                 
         is_valid = self.iam_manager._validate_role_name(role_name)
-        if is_valid:
-            role_name_input.setStyleSheet("color: green;")
-        else:
-            role_name_input.setStyleSheet("color: red;")
+        # Only restyle when validity flips; setStyleSheet forces a style recomputation
+        if is_valid != role_name_input.property('_last_valid'):
+            role_name_input.setProperty('_last_valid', is_valid)
+            role_name_input.setStyleSheet("color: green;" if is_valid else "color: red;")
                 
     def delete_role(self):
         """Delete the selected IAM role."""
-        selected_items = self.roles_list.selectedItems()
-        if not selected_items:
+        role_name = self.get_selected_role_name()
+        if not role_name:
             self.show_error_dialog("Error", "Please select a role to delete")
             return
-                
-        role_name = selected_items[0].data(Qt.UserRole)
         
         if not self.show_confirm_dialog("Confirm Delete", 
                                     f"Delete role '{role_name}'?"):
             return
                 
-        try:
-            if self.iam_manager.delete_role(role_name):
-                self.clear_cache('iam_roles')
-                self.clear_cache(f'iam_role_{role_name}')
-                self.refresh_roles_list()
-                self.show_info_dialog("Success", f"Role '{role_name}' deleted successfully")
-            else:
-                self.show_error_dialog("Error", f"Failed to delete role '{role_name}'")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error deleting role: {str(e)}")
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.iam_manager.delete_role(role_name),
+            lambda deleted: self._on_role_deleted(role_name, deleted),
+            lambda e: self._on_iam_error("Error deleting role", e)
+        )
+
+    def _on_role_deleted(self, role_name, deleted):
+        self._enable_buttons()
+        if deleted:
+            self.clear_cache((CacheKey.IAM_ROLE, role_name))
+            self._rendered_role_cache.pop(role_name, None)
+            (self.peek_cached_data(CacheKey.IAM_SNAPSHOT) or {}).pop(role_name, None)
+            self.roles_model.remove_row(self.roles_model.index_of(role_name))
+            self.show_info_dialog("Success", f"Role '{role_name}' deleted successfully")
+        else:
+            self.show_error_dialog("Error", f"Failed to delete role '{role_name}'")
                 
     def create_instance_profile(self):
         """Create a new instance profile."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Create Instance Profile")
-        layout = QFormLayout()
-        
-        profile_name = QLineEdit()
-        path = QLineEdit()
-        path.setText('/')
-        
-        layout.addRow("Profile Name:", profile_name)
-        layout.addRow("Path:", path)
-        
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        
-        layout.addRow(buttons)
-        dialog.setLayout(layout)
-        
-        if dialog.exec_() == QDialog.Accepted:
-            if not self.validate_input(profile_name.text(), "Profile Name"):
+        if self._create_profile_dialog is None:
+            self._create_profile_name = QLineEdit()
+            self._create_profile_path = QLineEdit()
+            self._create_profile_dialog = self.build_form_dialog("Create Instance Profile", [
+                ("Profile Name:", self._create_profile_name),
+                ("Path:", self._create_profile_path),
+            ])
+        self._create_profile_name.clear()
+        self._create_profile_path.setText('/')
+        
+        if self._create_profile_dialog.exec_() == QDialog.Accepted:
+            name = self._create_profile_name.text()
+            if not self.validate_input(name, "Profile Name"):
                 return
                     
-            try:
-                if self.iam_manager.create_instance_profile(
-                    profile_name=profile_name.text(),
-                    path=path.text()
-                ):
-                    self.clear_cache('iam_profiles')
-                    self.refresh_profiles_list()
-                    self.show_info_dialog("Success", f"Instance profile '{profile_name.text()}' created successfully")
-                else:
-                    self.show_error_dialog("Error", f"Failed to create instance profile '{profile_name.text()}'")
-            except Exception as e:
-                self.show_error_dialog("Error", f"Error creating instance profile: {str(e)}")
+            profile_path = self._create_profile_path.text()
+            self._disable_buttons()
+            self.run_in_background(
+                lambda: (self.iam_manager.create_instance_profile(profile_name=name, path=profile_path)
+                         and self.iam_manager.get_instance_profile(name)),
+                lambda profile: self._on_profile_created(name, profile),
+                lambda e: self._on_iam_error("Error creating instance profile", e)
+            )
+
+    def _on_profile_created(self, profile_name, profile):
+        self._enable_buttons()
+        if profile:
+            self._remember_profile(profile_name, profile)
+            self.profiles_model.append_row(profile)
+            self.show_info_dialog("Success", f"Instance profile '{profile_name}' created successfully")
+        else:
+            self.show_error_dialog("Error", f"Failed to create instance profile '{profile_name}'")
                     
     def delete_instance_profile(self):
         """Delete the selected instance profile."""
-        selected_items = self.profiles_list.selectedItems()
-        if not selected_items:
+        profile_name = self.get_selected_profile_name()
+        if not profile_name:
             self.show_error_dialog("Error", "Please select a profile to delete")
             return
-                
-        profile_name = selected_items[0].data(Qt.UserRole)
         
         if not self.show_confirm_dialog("Confirm Delete", 
                                     f"Delete instance profile '{profile_name}'?"):
             return
                 
-        try:
-            if self.iam_manager.delete_instance_profile(profile_name):
-                self.clear_cache('iam_profiles')
-                self.clear_cache(f'iam_profile_{profile_name}')
-                self.refresh_profiles_list()
-                self.show_info_dialog("Success", f"Instance profile '{profile_name}' deleted successfully")
-            else:
-                self.show_error_dialog("Error", f"Failed to delete instance profile '{profile_name}'")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error deleting instance profile: {str(e)}")
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.iam_manager.delete_instance_profile(profile_name),
+            lambda deleted: self._on_profile_deleted(profile_name, deleted),
+            lambda e: self._on_iam_error("Error deleting instance profile", e)
+        )
+
+    def _on_profile_deleted(self, profile_name, deleted):
+        self._enable_buttons()
+        if deleted:
+            self.clear_cache((CacheKey.IAM_PROFILE, profile_name))
+            self._rendered_profile_cache.pop(profile_name, None)
+            (self.peek_cached_data(CacheKey.IAM_PROFILES) or {}).pop(profile_name, None)
+            self.profiles_model.remove_row(self.profiles_model.index_of(profile_name))
+            self.show_info_dialog("Success", f"Instance profile '{profile_name}' deleted successfully")
+        else:
+            self.show_error_dialog("Error", f"Failed to delete instance profile '{profile_name}'")
                 
     def add_role_to_profile(self):
         """Add a role to the selected instance profile."""
-        selected_items = self.profiles_list.selectedItems()
-        if not selected_items:
+        profile_name = self.get_selected_profile_name()
+        if not profile_name:
             self.show_error_dialog("Error", "Please select a profile first")
             return
-                
-        profile_name = selected_items[0].data(Qt.UserRole)
         
-        try:
-            roles = self.iam_manager.list_roles()
-            if not roles:
-                self.show_error_dialog("Error", "No roles available")
-                return
-                    
-            role_name, ok = QInputDialog.getItem(
-                self,
-                "Add Role to Profile",
-                "Select role to add:",
-                [role['RoleName'] for role in roles],
-                0,
-                False
-            )
+        if self.roles_model.rowCount():
+            self._pick_role_to_add(profile_name, self.roles_model)
+            return
+        # The roles list may still be loading while a snapshot is cached
+        snapshot = self.peek_cached_data(CacheKey.IAM_SNAPSHOT)
+        if snapshot:
+            self._pick_role_to_add(profile_name, self._entity_model('RoleName', snapshot.values()))
+            return
+            
+        self.run_in_background(
+            self.iam_manager.list_roles,
+            lambda roles: self._pick_role_to_add(profile_name, self._entity_model('RoleName', roles)),
+            lambda e: self._on_iam_error("Error adding role to profile", e)
+        )
+
+    def _entity_model(self, name_key, rows):
+        """Build a transient, unparented model for the picker."""
+        model = IamEntityModel(name_key)
+        model.set_rows(rows)
+        return model
+
+    def _pick_entity(self, title, model, prompt):
+        if self._entity_picker is None:
+            self._entity_picker = EntityPickerDialog(self)
+        return self._entity_picker.pick(title, model, prompt)
+
+    def _pick_role_to_add(self, profile_name, roles_model):
+        if not roles_model.rowCount():
+            self.show_error_dialog("Error", "No roles available")
+            return
                 
-            if not ok or not role_name:
-                return
-                    
-            if self.iam_manager.add_role_to_instance_profile(
+        role_name = self._pick_entity("Add Role to Profile", roles_model, "Select role to add:")
+        if not role_name:
+            return
+                
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.iam_manager.add_role_to_instance_profile(
                 profile_name=profile_name,
                 role_name=role_name
-            ):
-                self.clear_cache(f'iam_profile_{profile_name}')
-                self.display_profile_details()
-                self.show_info_dialog("Success", f"Role '{role_name}' added to profile successfully")
-            else:
+            ),
+            lambda added: self._on_profile_roles_changed(profile_name, role_name, True, added),
+            lambda e: self._on_iam_error("Error adding role to profile", e)
+        )
+
+    def _on_profile_roles_changed(self, profile_name, role_name, added, changed):
+        self._enable_buttons()
+        if not changed:
+            if added:
                 self.show_error_dialog("Error", f"Failed to add role '{role_name}' to profile")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error adding role to profile: {str(e)}")
+            else:
+                self.show_error_dialog("Error", f"Failed to remove role '{role_name}' from profile")
+            return
+            
+        # Patch the cached profile in place; fall back to a refetch if it is gone
+        profile = self._cached_profile(profile_name)
+        if profile is None:
+            self.clear_cache((CacheKey.IAM_PROFILE, profile_name))
+        else:
+            roles = [role for role in profile.get('Roles', []) if role['RoleName'] != role_name]
+            if added:
+                roles.append(self._cached_role(role_name) or {'RoleName': role_name})
+            profile['Roles'] = roles
+        self._rendered_profile_cache.pop(profile_name, None)
+        self.display_profile_details()
+        
+        if added:
+            self.show_info_dialog("Success", f"Role '{role_name}' added to profile successfully")
+        else:
+            self.show_info_dialog("Success", f"Role '{role_name}' removed from profile successfully")
                 
     def remove_role_from_profile(self):
         """Remove a role from the selected instance profile."""
-        selected_items = self.profiles_list.selectedItems()
-        if not selected_items:
+        profile_name = self.get_selected_profile_name()
+        if not profile_name:
             self.show_error_dialog("Error", "Please select a profile first")
             return
-                
-        profile_name = selected_items[0].data(Qt.UserRole)
         
-        try:
-            profile_details = self.iam_manager.get_instance_profile(profile_name)
-            if not profile_details or not profile_details.get('Roles'):
-                self.show_error_dialog("Error", "No roles attached to this profile")
-                return
-                    
-            role_name, ok = QInputDialog.getItem(
-                self,
-                "Remove Role from Profile",
-                "Select role to remove:",
-                [role['RoleName'] for role in profile_details['Roles']],
-                0,
-                False
-            )
+        profile_details = self._cached_profile(profile_name)
+        if profile_details is not None:
+            self._pick_role_to_remove(profile_details)
+            return
+            
+        self.run_in_background(
+            lambda: self.iam_manager.get_instance_profile(profile_name),
+            lambda details: self._on_profile_fetched_for_remove(profile_name, details),
+            lambda e: self._on_iam_error("Error removing role from profile", e)
+        )
+
+    def _on_profile_fetched_for_remove(self, profile_name, profile_details):
+        if profile_details:
+            self._remember_profile(profile_name, profile_details)
+        self._pick_role_to_remove(profile_details)
+
+    def _pick_role_to_remove(self, profile_details):
+        if not profile_details or not profile_details.get('Roles'):
+            self.show_error_dialog("Error", "No roles attached to this profile")
+            return
                 
-            if not ok or not role_name:
-                return
-                    
-            if self.iam_manager.remove_role_from_instance_profile(
-                profile_name=profile_details['InstanceProfileName'],
+        role_name = self._pick_entity(
+            "Remove Role from Profile",
+            self._entity_model('RoleName', profile_details['Roles']),
+            "Select role to remove:"
+        )
+        if not role_name:
+            return
+                
+        profile_name = profile_details['InstanceProfileName']
+        self._disable_buttons()
+        self.run_in_background(
+            lambda: self.iam_manager.remove_role_from_instance_profile(
+                profile_name=profile_name,
                 role_name=role_name
-            ):
-                self.clear_cache(f'iam_profile_{profile_details["InstanceProfileName"]}')
-                self.display_profile_details()
-                self.show_info_dialog("Success", f"Role '{role_name}' removed from profile successfully")
-            else:
-                self.show_error_dialog("Error", f"Failed to remove role '{role_name}' from profile")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error removing role from profile: {str(e)}")
+            ),
+            lambda removed: self._on_profile_roles_changed(profile_name, role_name, False, removed),
+            lambda e: self._on_iam_error("Error removing role from profile", e)
+        )
                 
     def cleanup_resources(self):
         """Clean up unused IAM resources."""
@@ -2373,47 +3508,45 @@ class IAMTab(BaseTab):
                                     "This will remove all unused IAM resources. Continue?"):
             return
                 
-        try:
-            cleanup_results = self.iam_manager.cleanup_resources()
-            if cleanup_results:
-                self.clear_cache('iam_roles')
-                self.clear_cache('iam_profiles')
-                self.refresh_roles_list()
-                self.refresh_profiles_list()
-                
-                result_text = "Cleanup Results:\n"
-                for resource_type, count in cleanup_results.items():
-                    result_text += f"{resource_type}: {count} removed\n"
-                        
-                self.show_info_dialog("Success", result_text)
-            else:
-                self.show_error_dialog("Error", "Failed to cleanup resources")
-        except Exception as e:
-            self.show_error_dialog("Error", f"Error during cleanup: {str(e)}")
+        self._disable_buttons()
+        self.run_in_background(
+            self.iam_manager.cleanup_resources,
+            self._on_cleanup_finished,
+            lambda e: self._on_iam_error("Error during cleanup", e)
+        )
+
+    def _on_cleanup_finished(self, cleanup_results):
+        self._enable_buttons()
+        if cleanup_results:
+            self.clear_cache()
+            self.refresh_roles_list()
+            self.refresh_profiles_list()
+            
+            lines = ["Cleanup Results:"]
+            lines.extend(f"{resource_type}: {count} removed"
+                         for resource_type, count in cleanup_results.items() if count)
+            if len(lines) == 1:
+                lines.append("Nothing to clean up.")
+            self.show_info_dialog("Success", "\n".join(lines))
+        else:
+            self.show_error_dialog("Error", "Failed to cleanup resources")
 
     def export_roles(self):
-        roles = []
-        for i in range(self.roles_list.count()):
-            item = self.roles_list.item(i)
-            if not item.isHidden():
-                roles.append(item.text())
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export IAM Roles", "iam_roles.json", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export IAM Roles", "iam_roles.jsonl", EXPORT_SAVE_FILTER)
         if file_path:
-            with open(file_path, 'w') as f:
-                json.dump(roles, f, indent=2)
-            self.show_info_dialog("Export", f"Exported {len(roles)} IAM roles to {file_path}")
+            self.export_in_background(file_path, _proxy_texts(self.roles_list), "IAM roles")
     def import_roles(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Import IAM Roles", "", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import IAM Roles", "", EXPORT_OPEN_FILTER)
         if file_path:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            self.show_info_dialog("Import", f"Imported {len(data)} IAM roles from {file_path}\n(Import does not create resources)")
+            self.import_in_background(file_path, "IAM roles")
 
 class SettingsTab(BaseTab):
     def __init__(self, main_window=None):
         super().__init__()
         self.main_window = main_window
         self.current_profile = None
+        self._profiles_digest = None  # digest of the profiles file as last read or written
+        self._identity_cache = {}  # access key -> (timestamp, caller ARN)
         self.profiles = self.load_profiles()
         self.setup_ui()
 
@@ -2498,18 +3631,34 @@ class SettingsTab(BaseTab):
 
     def load_profiles(self):
         # For now, load from a config file or in-memory dict
-        import os, json
-        profiles_path = os.path.join(os.path.expanduser('~'), '.aws_infra_profiles.json')
-        if os.path.exists(profiles_path):
-            with open(profiles_path, 'r') as f:
-                return json.load(f)
+        if os.path.exists(PROFILES_PATH):
+            with open(PROFILES_PATH, 'rb') as f:
+                data = f.read()
+            self._profiles_digest = hashlib.blake2b(data).digest()
+            return _json_loads(data)
         return {"default": {"aws_access_key_id": "", "aws_secret_access_key": "", "region": "us-east-1"}}
 
     def save_profiles(self):
-        import os, json
-        profiles_path = os.path.join(os.path.expanduser('~'), '.aws_infra_profiles.json')
-        with open(profiles_path, 'w') as f:
-            json.dump(self.profiles, f, indent=2)
+        """Write the profiles atomically, skipping the write when nothing changed."""
+        data = _json_line(self.profiles)
+        digest = hashlib.blake2b(data).digest()
+        if digest == self._profiles_digest:
+            return
+        tmp_path = PROFILES_PATH + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, PROFILES_PATH)
+        except OSError as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            self.show_error_dialog("Error", f"Failed to save profiles: {str(e)}")
+            return
+        self._profiles_digest = digest
 
     def on_theme_changed(self, idx):
         if self.main_window:
@@ -2518,20 +3667,39 @@ class SettingsTab(BaseTab):
 
     def validate_aws_credentials(self):
         self.cred_status_label.setText("Status: Checking...")
-        self.cred_status_label.repaint()
-        try:
-            session = boto3.Session()
-            sts = session.client('sts')
-            identity = sts.get_caller_identity()
-            arn = identity.get('Arn', 'Unknown')
-            self.cred_status_label.setText(f"Status: Valid (ARN: {arn})")
-            self.cred_status_label.setStyleSheet("color: green;")
-        except BotoClientError as e:
+        self.cred_status_label.setStyleSheet("")
+        self.validate_btn.setEnabled(False)
+        self.run_in_background(self._fetch_caller_arn, self._on_credentials_valid, self._on_credentials_invalid)
+
+    def _fetch_caller_arn(self):
+        """Return the caller ARN for the current credentials. Runs on a worker thread.
+        
+        Identities are reused for IDENTITY_CACHE_TTL seconds per access key,
+        so repeated checks skip the STS round trip.
+        """
+        session = boto3.Session()
+        credentials = session.get_credentials()
+        fingerprint = credentials.access_key if credentials else None
+        cached = self._identity_cache.get(fingerprint)
+        if cached is not None and time.monotonic() - cached[0] < IDENTITY_CACHE_TTL:
+            return cached[1]
+        identity = session.client('sts').get_caller_identity()
+        arn = identity.get('Arn', 'Unknown')
+        self._identity_cache[fingerprint] = (time.monotonic(), arn)
+        return arn
+
+    def _on_credentials_valid(self, arn):
+        self.validate_btn.setEnabled(True)
+        self.cred_status_label.setText(f"Status: Valid (ARN: {arn})")
+        self.cred_status_label.setStyleSheet("color: green;")
+
+    def _on_credentials_invalid(self, e):
+        self.validate_btn.setEnabled(True)
+        if isinstance(e, BotoClientError):
             self.cred_status_label.setText(f"Status: Invalid ({e.response['Error']['Code']})")
-            self.cred_status_label.setStyleSheet("color: red;")
-        except Exception as e:
+        else:
             self.cred_status_label.setText(f"Status: Invalid ({str(e)})")
-            self.cred_status_label.setStyleSheet("color: red;")
+        self.cred_status_label.setStyleSheet("color: red;")
 
     def on_log_level_changed(self, idx):
         level = self.log_level_combo.currentText()
@@ -2559,18 +3727,8 @@ class SettingsTab(BaseTab):
     def on_profile_changed(self, profile_name):
         self.current_profile = profile_name
         # Switch boto3 session/profile globally
-        import boto3
         profile = self.profiles[profile_name]
-        secret = profile.get('aws_secret_access_key')
-        if profile.get('encrypted'):
-            enc_key = self.get_encryption_key()
-            f = Fernet(enc_key)
-            secret = f.decrypt(secret.encode()).decode()
-        elif profile.get('secrets_manager'):
-            import boto3
-            secrets = boto3.client('secretsmanager')
-            resp = secrets.get_secret_value(SecretId=secret)
-            secret = resp['SecretString']
+        secret = self._resolve_secret(profile)
         session = boto3.Session(
             aws_access_key_id=profile.get('aws_access_key_id'),
             aws_secret_access_key=secret,
@@ -2580,6 +3738,20 @@ class SettingsTab(BaseTab):
         # boto3.setup_default_session(...)
         self.log_message(f"Switched to profile: {profile_name}")
 
+    def _resolve_secret(self, profile):
+        """Return a profile's plaintext secret key.
+        
+        Nothing is memoized: Secrets Manager values can rotate under the same
+        SecretId, and plaintext should not outlive the session it builds.
+        Decryption reuses the cipher cached by get_fernet.
+        """
+        stored = profile.get('aws_secret_access_key')
+        if profile.get('encrypted'):
+            return get_fernet().decrypt(stored.encode()).decode()
+        if profile.get('secrets_manager'):
+            return get_client('secretsmanager').get_secret_value(SecretId=stored)['SecretString']
+        return stored
+
     def add_profile(self):
         name, ok = QInputDialog.getText(self, "Add Profile", "Profile name:")
         if ok and name:
@@ -2592,9 +3764,7 @@ class SettingsTab(BaseTab):
             # Secure storage
             storage = self.storage_combo.currentText()
             if storage == "Local Encrypted":
-                enc_key = self.get_encryption_key()
-                f = Fernet(enc_key)
-                enc_secret = f.encrypt(secret.encode()).decode()
+                enc_secret = get_fernet().encrypt(secret.encode()).decode()
                 self.profiles[name] = {
                     "aws_access_key_id": key,
                     "aws_secret_access_key": enc_secret,
@@ -2603,8 +3773,7 @@ class SettingsTab(BaseTab):
                 }
             elif storage == "AWS Secrets Manager":
                 # Store in AWS Secrets Manager
-                import boto3
-                secrets = boto3.client('secretsmanager')
+                secrets = get_client('secretsmanager')
                 secret_name = f"aws_infra_{name}"
                 secrets.create_secret(Name=secret_name, SecretString=secret)
                 self.profiles[name] = {
@@ -2653,17 +3822,6 @@ class SettingsTab(BaseTab):
         self.profile_combo.removeItem(idx)
         self.log_message(f"Profile '{name}' deleted.")
 
-    def get_encryption_key(self):
-        import os
-        key_path = os.path.join(os.path.expanduser('~'), '.aws_infra_key')
-        if os.path.exists(key_path):
-            with open(key_path, 'rb') as f:
-                return f.read()
-        key = Fernet.generate_key()
-        with open(key_path, 'wb') as f:
-            f.write(key)
-        return key
-
 class MenuBar(QMenuBar):
     def __init__(self, main_window):
         super().__init__()
@@ -2672,10 +3830,8 @@ class MenuBar(QMenuBar):
 
     def init_ui(self):
         file_menu = QMenu("File", self)
-        operations_menu = QMenu("Operations", self)
         settings_menu = QMenu("Settings", self)
         help_menu = QMenu("Help", self)
-        about_menu = QMenu("About", self)
 
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.main_window.close)
@@ -2691,17 +3847,17 @@ class MenuBar(QMenuBar):
         self.theme_action.triggered.connect(self.toggle_theme)
         settings_menu.addAction(self.theme_action)
 
-        self.addMenu(file_menu)
-        self.addMenu(operations_menu)
-        self.addMenu(settings_menu)
-        self.addMenu(help_menu)
+        # Only show menus that have something in them
+        for menu in (file_menu, settings_menu, help_menu):
+            if not menu.isEmpty():
+                self.addMenu(menu)
 
     def show_about(self):
         # Use the status bar's log_message method for About
         if hasattr(self.main_window, 'status_bar') and self.main_window.status_bar:
-            self.main_window.status_bar.log_message("AWS Infrastructure Manager version 1.0.0. Built using Python and PyQt5")
+            self.main_window.status_bar.log_message(ABOUT_TEXT)
         else:
-            print("AWS Infrastructure Manager version 1.0.0. Built using Python and PyQt5")
+            print(ABOUT_TEXT)
 
     def toggle_theme(self):
         if self.theme_action.isChecked():
@@ -2715,8 +3871,11 @@ class RDSTab(BaseTab):
     def __init__(self):
         super().__init__()
         self.rds_client = get_client('rds')
+        self._db_items = {}  # DBInstanceIdentifier -> list item
         self.setup_ui()
-        self.refresh_instances()
+
+    def initial_load(self):
+        self.refresh_instances(force_refresh=False)
 
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -2729,13 +3888,13 @@ class RDSTab(BaseTab):
         layout.addWidget(QLabel("Instance Details:"))
         layout.addWidget(self.details)
         # Metrics chart
-        self.figure, self.ax = plt.subplots(figsize=(4, 2))
+        self.figure, self.ax = plt.subplots(figsize=(4, 2), layout='constrained')
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(QLabel("Monitoring (CPU, Storage, Connections):"))
         layout.addWidget(self.canvas)
         btns = QHBoxLayout()
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.clicked.connect(self.refresh_instances)
+        self.refresh_btn.clicked.connect(lambda: self.refresh_instances())
         self.create_btn = QPushButton("Create")
         self.create_btn.clicked.connect(self.create_instance)
         self.update_btn = QPushButton("Update")
@@ -2761,24 +3920,48 @@ class RDSTab(BaseTab):
         layout.addLayout(btns)
         self.setLayout(layout)
 
-    def refresh_instances(self):
-        self.instances_list.clear()
+    def refresh_instances(self, force_refresh=True):
+        """Reload DB instances, touching only the list rows that changed."""
         try:
-            resp = self.rds_client.describe_db_instances()
-            self.db_instances = resp.get('DBInstances', [])
-            for db in self.db_instances:
-                item = QListWidgetItem(f"{db['DBInstanceIdentifier']} ({db['DBInstanceStatus']})")
-                item.setData(Qt.UserRole, db)
-                self.instances_list.addItem(item)
+            self.db_instances = self.get_cached_data(
+                CacheKey.RDS_INSTANCES, self._fetch_db_instances, force_refresh=force_refresh)
         except Exception as e:
             self.log_message(f"Error: {e}", error=True)
+            return
+        selected = self.instances_list.selectedItems()
+        selected_id = selected[0].data(Qt.UserRole)['DBInstanceIdentifier'] if selected else None
+        selected_changed = False
+        current = {db['DBInstanceIdentifier']: db for db in self.db_instances}
+        with batched_updates(self.instances_list):
+            for db_id in set(self._db_items) - set(current):
+                item = self._db_items.pop(db_id)
+                self.instances_list.takeItem(self.instances_list.row(item))
+                selected_changed |= db_id == selected_id
+            for db_id, db in current.items():
+                item = self._db_items.get(db_id)
+                if item is None:
+                    item = self._db_items[db_id] = QListWidgetItem()
+                    self.instances_list.addItem(item)
+                elif item.data(Qt.UserRole) == db:
+                    continue
+                else:
+                    selected_changed |= db_id == selected_id
+                item.setText(f"{db_id} ({db['DBInstanceStatus']})")
+                item.setData(Qt.UserRole, db)
+        # Selection signals were blocked; refresh the details only if they went stale
+        if selected_changed:
+            self.display_instance_details()
+
+    def _fetch_db_instances(self):
+        paginator = self.rds_client.get_paginator('describe_db_instances')
+        return paginator.paginate(PaginationConfig={'PageSize': 100}).build_full_result().get('DBInstances', [])
 
     def display_instance_details(self):
         selected = self.instances_list.selectedItems()
         if not selected:
             self.details.clear()
             self.ax.clear()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         db = selected[0].data(Qt.UserRole)
         arn = db.get('DBInstanceArn', 'N/A')
@@ -2792,8 +3975,12 @@ class RDSTab(BaseTab):
     def show_metrics(self, db_instance_id):
         metrics = ['CPUUtilization', 'FreeStorageSpace', 'DatabaseConnections']
         self.ax.clear()
-        for metric in metrics:
-            data = get_rds_metrics(db_instance_id, metric)
+        try:
+            series = get_rds_metrics_batch(db_instance_id, metrics)
+        except Exception as e:
+            self.log_message(f"Error fetching RDS metrics: {e}", error=True)
+            series = [[] for _ in metrics]
+        for metric, data in zip(metrics, series):
             if data:
                 data = sorted(data, key=lambda x: x['Timestamp'])
                 times = [d['Timestamp'] for d in data]
@@ -2801,8 +3988,7 @@ class RDSTab(BaseTab):
                 self.ax.plot(times, values, label=metric)
         self.ax.legend()
         self.ax.set_title(f"Metrics for {db_instance_id}")
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def create_instance(self):
         dialog = QDialog(self)
@@ -2963,6 +4149,8 @@ class CloudFrontTab(BaseTab):
         super().__init__()
         self.cf_client = get_client('cloudfront')
         self.setup_ui()
+
+    def initial_load(self):
         self.refresh_distributions()
 
     def setup_ui(self):
@@ -2976,7 +4164,7 @@ class CloudFrontTab(BaseTab):
         layout.addWidget(QLabel("Distribution Details:"))
         layout.addWidget(self.details)
         # Metrics chart
-        self.figure, self.ax = plt.subplots(figsize=(4, 2))
+        self.figure, self.ax = plt.subplots(figsize=(4, 2), layout='constrained')
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(QLabel("Monitoring (Requests, 4xx/5xx Errors, Bandwidth):"))
         layout.addWidget(self.canvas)
@@ -3023,7 +4211,7 @@ class CloudFrontTab(BaseTab):
         if not selected:
             self.details.clear()
             self.ax.clear()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         d = selected[0].data(Qt.UserRole)
         arn = d.get('ARN', d.get('Id', 'N/A'))
@@ -3046,8 +4234,7 @@ class CloudFrontTab(BaseTab):
                 self.ax.plot(times, values, label=metric)
         self.ax.legend()
         self.ax.set_title(f"Metrics for {dist_id}")
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def create_dist(self):
         dialog = QDialog(self)
@@ -3189,6 +4376,8 @@ class CostExplorerTab(BaseTab):
         super().__init__()
         self.setWindowTitle("Cost Explorer")
         self.setup_ui()
+
+    def initial_load(self):
         self.refresh_costs()
 
     def setup_ui(self):
@@ -3211,7 +4400,7 @@ class CostExplorerTab(BaseTab):
         controls_layout.addWidget(self.refresh_btn)
         layout.addLayout(controls_layout)
         # Chart
-        self.figure, self.ax = plt.subplots(figsize=(5, 3))
+        self.figure, self.ax = plt.subplots(figsize=(5, 3), layout='constrained')
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
         self.setLayout(layout)
@@ -3224,8 +4413,7 @@ class CostExplorerTab(BaseTab):
         if not data:
             self.ax.text(0.5, 0.5, "No data available", ha='center', va='center', fontsize=14)
             self.ax.set_title("No Data")
-            self.figure.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
         if breakdown == "service":
             labels = [d['Service'] for d in data]
@@ -3252,8 +4440,7 @@ class CostExplorerTab(BaseTab):
             else:
                 self.ax.plot(labels, values, marker='o')
             self.ax.set_title("Cost Over Time")
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
 
 # --- Add Copy ARN/ID to EC2, S3, Lambda, IAM Tabs ---
@@ -3298,6 +4485,8 @@ class IAMPolicyEditorTab(BaseTab):
         super().__init__()
         self.iam_client = get_client('iam')
         self.setup_ui()
+
+    def initial_load(self):
         self.refresh_policies()
 
     def setup_ui(self):
@@ -3375,7 +4564,6 @@ class IAMPolicyEditorTab(BaseTab):
         self.policy_editor.setPlainText(json.dumps(policy, indent=2))
 
     def simulate_policy(self):
-        from botocore.exceptions import ClientError
         try:
             policy_json = self.policy_editor.toPlainText()
             if not policy_json:
@@ -3417,11 +4605,15 @@ class IAMPolicyEditorTab(BaseTab):
             self.show_error_dialog("Error", f"Failed to list policies: {e}")
 
     def filter_policies(self):
-        text = self.search_bar.text().lower()
-        for i in range(self.policy_list.count()):
-            item = self.policy_list.item(i)
-            pol = item.data(Qt.UserRole)
-            item.setHidden(text not in pol['PolicyName'].lower() and text not in pol['Arn'].lower())
+        text = self.search_bar.text().casefold()
+        with batched_updates(self.policy_list):
+            for i in range(self.policy_list.count()):
+                item = self.policy_list.item(i)
+                if not text:
+                    item.setHidden(False)
+                    continue
+                pol = item.data(Qt.UserRole)
+                item.setHidden(text not in pol['PolicyName'].casefold() and text not in pol['Arn'].casefold())
 
     def display_policy(self):
         selected = self.policy_list.selectedItems()
@@ -3433,7 +4625,6 @@ class IAMPolicyEditorTab(BaseTab):
         try:
             v = self.iam_client.get_policy_version(PolicyArn=pol['Arn'], VersionId=pol['DefaultVersionId'])
             doc = v['PolicyVersion']['Document']
-            import json
             self.policy_editor.setPlainText(json.dumps(doc, indent=2))
             # Show attached entities
             self.attached_list.clear()
@@ -3494,13 +4685,12 @@ class IAMPolicyEditorTab(BaseTab):
             self.show_error_dialog("Error", f"Failed to detach policy: {e}")
 
     def create_policy(self):
-        from json import loads, JSONDecodeError
         name, ok = QInputDialog.getText(self, "Create Policy", "Policy Name:")
         if not ok or not name:
             return
         try:
-            doc = loads(self.policy_editor.toPlainText())
-        except JSONDecodeError as e:
+            doc = json.loads(self.policy_editor.toPlainText())
+        except json.JSONDecodeError as e:
             self.show_error_dialog("Error", f"Invalid JSON: {e}")
             return
         try:
@@ -3634,6 +4824,8 @@ class ResourceGraphTab(BaseTab):
         super().__init__()
         self.setWindowTitle("Architecture Map")
         self.setup_ui()
+
+    def initial_load(self):
         self.refresh_graph()
 
     def setup_ui(self):
@@ -3650,9 +4842,9 @@ class ResourceGraphTab(BaseTab):
         dot = Digraph(comment='AWS Resource Graph')
         # Example: Fetch resources and relationships (simplified)
         try:
-            ec2 = EC2Manager()
+            ec2 = shared_manager(EC2Manager)
             rds = get_client('rds')
-            s3 = S3Manager()
+            s3 = shared_manager(S3Manager)
             # EC2 Instances
             for inst in ec2.list_instances():
                 dot.node(inst.id, f"EC2\n{inst.id}")
@@ -3671,7 +4863,6 @@ class ResourceGraphTab(BaseTab):
             for vpc in vpcs:
                 dot.node(vpc['VpcId'], f"VPC\n{vpc['VpcId']}")
             # Render to temporary file (fix for Windows)
-            import os
             fd, tmp_path = tempfile.mkstemp(suffix='.png')
             os.close(fd)  # Close the file so Graphviz can write to it
             dot.render(tmp_path, format='png', cleanup=True)
@@ -3687,6 +4878,8 @@ class ResourceGraphTab(BaseTab):
             self.graph_label.setText(f"Error generating diagram: {e}")
 
 class AWSInfraGUIV2(QMainWindow):
+    theme_changed = pyqtSignal(str)
+
     def __init__(self):
         print("Initializing main window...")
         super().__init__()
@@ -3713,15 +4906,20 @@ class AWSInfraGUIV2(QMainWindow):
         ]
         self.status_bar = StatusBar()
         self.setStatusBar(self.status_bar)
-        for TabClass, label in tab_definitions:
+        # Only the first tab is built up front; the rest are placeholders
+        # materialized the first time they are selected
+        self._tab_factories = {}
+        for index, (TabClass, label) in enumerate(tab_definitions):
             if TabClass is SettingsTab:
-                tab = TabClass(self)
+                factory = lambda TabClass=TabClass: TabClass(self)
             else:
-                tab = TabClass()
-            # Set the status bar for tabs that support it
-            if hasattr(tab, 'set_status_bar'):
-                tab.set_status_bar(self.status_bar)
-            self.tabs.addTab(tab, label)
+                factory = TabClass
+            if index == 0:
+                self.tabs.addTab(self._create_tab(factory), label)
+            else:
+                self._tab_factories[index] = (factory, label)
+                self.tabs.addTab(QWidget(), label)
+        self.tabs.currentChanged.connect(self._materialize_tab)
         self.menu_bar = QMenuBar()
         self.setMenuBar(self.menu_bar)
         self.file_menu = QMenu("File", self)
@@ -3736,6 +4934,38 @@ class AWSInfraGUIV2(QMainWindow):
         self.help_menu.addAction(self.about_action)
         self.show()
 
+    def _create_tab(self, factory):
+        tab = factory()
+        # Set the status bar for tabs that support it
+        if hasattr(tab, 'set_status_bar'):
+            tab.set_status_bar(self.status_bar)
+        if isinstance(tab, DashboardTab):
+            self.theme_changed.connect(tab.apply_theme)
+        return tab
+
+    def _materialize_tab(self, index):
+        """Replace a placeholder with its real tab the first time it is selected."""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        factory, label = entry
+        tab = self._create_tab(factory)
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.insertTab(index, tab, label)
+            self.tabs.removeTab(index + 1)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def closeEvent(self, event):
+        """Close every tab so each can cancel its background work before exit."""
+        for index in range(self.tabs.count()):
+            self.tabs.widget(index).close()
+        super().closeEvent(event)
+
     def set_theme(self, theme):
         """Set the application theme (light or dark)."""
         if theme == 'dark':
@@ -3744,6 +4974,7 @@ class AWSInfraGUIV2(QMainWindow):
         else:
             self.setStyleSheet(LIGHT_STYLE_SHEET)
             self.current_theme = 'light'
+        self.theme_changed.emit(self.current_theme)
         if hasattr(self, 'status_bar') and self.status_bar:
             self.status_bar.log_message(f"Theme set to {theme.capitalize()}")
 
@@ -3771,26 +5002,80 @@ class Worker(QThread):
             self.exc = e
             self.error.emit(e)
 
-class AsyncWorker(QThread):
+class _WorkerRunnable(QRunnable):
+    """Pool task that runs an AsyncWorker's body.
+    
+    The pool owns and deletes it after run, which also keeps the worker
+    alive until then.
+    """
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        self.worker.run()
+
+class AsyncWorker(QObject):
+    """Run fn on the shared worker pool and emit its result.
+    
+    If fn returns a generator of lists, each list is emitted through
+    partial as it arrives and finished carries them concatenated.
+    Keeps QThread's start/isRunning/wait/cancel surface so callers can
+    treat it like one.
+    """
     finished = pyqtSignal(object)
+    partial = pyqtSignal(object)
     error = pyqtSignal(Exception)
+    _pool = None
+
     def __init__(self, fn, *args, **kwargs):
         super().__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
         self._is_cancelled = False
+        self._done = threading.Event()
+        self._done.set()
+
+    @classmethod
+    def pool(cls):
+        """Return the pool shared by every AsyncWorker, creating it on first use."""
+        if cls._pool is None:
+            cls._pool = QThreadPool()
+            cls._pool.setMaxThreadCount(WORKER_POOL_SIZE)
+        return cls._pool
+
+    def start(self):
+        self._done.clear()
+        self.pool().start(_WorkerRunnable(self))
+
+    def isRunning(self):
+        return not self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the task has finished; timeout is in milliseconds."""
+        return self._done.wait(None if timeout is None else timeout / 1000)
 
     def run(self):
         try:
             if self._is_cancelled:
                 return
             result = self.fn(*self.args, **self.kwargs)
+            if isinstance(result, GeneratorType):
+                items = []
+                for chunk in result:
+                    if self._is_cancelled:
+                        return
+                    self.partial.emit(chunk)
+                    items.extend(chunk)
+                result = items
             if not self._is_cancelled:
                 self.finished.emit(result)
         except Exception as e:
             if not self._is_cancelled:
                 self.error.emit(e)
+        finally:
+            self._done.set()
 
     def cancel(self):
         self._is_cancelled = True
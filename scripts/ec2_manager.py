@@ -5,6 +5,9 @@ from botocore.exceptions import ClientError, WaiterError
 from scripts.utils import get_client, get_resource, logger, handle_error, wait_with_progress
 from config import settings
 
+# Seconds a describe_instance result is reused before asking EC2 again
+DESCRIBE_CACHE_TTL = 5
+
 class EC2Manager:
     def __init__(self):
         self.ec2_client = get_client('ec2')
@@ -19,6 +22,10 @@ class EC2Manager:
             'attach_volume': 'EBSVolumeAttach',
             'create_snapshot': 'EBSSnapshotCreate'
         }
+        # Instance type offerings rarely change; remember each answer
+        self._instance_type_validity: Dict[str, bool] = {}
+        # Recent DescribeInstances records by instance ID, as (fetched_at, details)
+        self._describe_cache: Dict[str, tuple] = {}
         
     def _log_operation_metric(self, operation: str, success: bool, duration: float, 
                             dimensions: Optional[Dict[str, str]] = None) -> None:
@@ -78,13 +85,20 @@ class EC2Manager:
         
     def validate_instance_type(self, instance_type: str) -> bool:
         """Validate if the instance type is supported"""
+        if instance_type in self._instance_type_validity:
+            return self._instance_type_validity[instance_type]
         try:
             response = self.ec2_client.describe_instance_types(
                 InstanceTypes=[instance_type]
             )
-            return len(response['InstanceTypes']) > 0
-        except ClientError:
-            return False
+            is_valid = len(response['InstanceTypes']) > 0
+        except ClientError as e:
+            # Only an unknown type is a definitive answer; throttling etc. is retried next time
+            if e.response['Error']['Code'] != 'InvalidInstanceType':
+                return False
+            is_valid = False
+        self._instance_type_validity[instance_type] = is_valid
+        return is_valid
 
     def launch_instance(self, 
                        ami_id: str = settings.EC2_AMI_ID, 
@@ -404,6 +418,9 @@ class EC2Manager:
             logger.error(f"Unexpected error starting instance: {str(e)}")
             self._log_operation_metric(operation, False, time.time() - start_time)
             return False
+        finally:
+            # A failed or timed-out call may still have changed the state
+            self._describe_cache.pop(instance_id, None)
 
     def stop_instance(self, instance_id: str) -> bool:
         """
@@ -458,6 +475,9 @@ class EC2Manager:
             logger.error(f"Unexpected error stopping instance: {str(e)}")
             self._log_operation_metric(operation, False, time.time() - start_time)
             return False
+        finally:
+            # A failed or timed-out call may still have changed the state
+            self._describe_cache.pop(instance_id, None)
 
     def reboot_instance(self, instance_id: str) -> bool:
         """
@@ -512,9 +532,15 @@ class EC2Manager:
             logger.error(f"Unexpected error rebooting instance: {str(e)}")
             self._log_operation_metric(operation, False, time.time() - start_time)
             return False
+        finally:
+            # A failed or timed-out call may still have changed the state
+            self._describe_cache.pop(instance_id, None)
 
     def describe_instance(self, instance_id):
-        """Describe an EC2 instance"""
+        """Describe an EC2 instance, reusing a result fetched in the last DESCRIBE_CACHE_TTL seconds"""
+        cached = self._describe_cache.get(instance_id)
+        if cached is not None and time.time() - cached[0] < DESCRIBE_CACHE_TTL:
+            return cached[1]
         logger.info(f"Describing EC2 instance {instance_id}")
 
         try:
@@ -525,6 +551,7 @@ class EC2Manager:
             if response['Reservations'] and response['Reservations'][0]['Instances']:
                 instance_details = response['Reservations'][0]['Instances'][0]
                 logger.info(f"Instance {instance_id} details retrieved")
+                self._describe_cache[instance_id] = (time.time(), instance_details)
                 return instance_details
             return None
         except Exception as e:
@@ -692,6 +719,54 @@ class EC2Manager:
             handle_error(e, f"listing volumes for instance {instance_id}")
             return []
 
+    def describe_volumes_for_instances(self, instance_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the volumes attached to many instances with batched DescribeVolumes calls
+        
+        Args:
+            instance_ids: The IDs of the EC2 instances
+            
+        Returns:
+            Volume information dictionaries, shaped like list_volumes, keyed by instance ID
+            
+        Raises:
+            Exception: If a DescribeVolumes call fails, so callers do not cache
+                a partial result as "no volumes"
+        """
+        volumes_by_instance = {instance_id: [] for instance_id in instance_ids}
+        # Multi-attach volumes can come back once per matching chunk
+        seen = set()
+        try:
+            paginator = self.ec2_client.get_paginator('describe_volumes')
+            # DescribeVolumes accepts at most 200 values per filter
+            for offset in range(0, len(instance_ids), 200):
+                chunk = instance_ids[offset:offset + 200]
+                pages = paginator.paginate(
+                    Filters=[{'Name': 'attachment.instance-id', 'Values': chunk}]
+                )
+                for page in pages:
+                    for volume in page.get('Volumes', []):
+                        for attachment in volume.get('Attachments', []):
+                            if attachment['InstanceId'] not in volumes_by_instance:
+                                continue
+                            if (attachment['InstanceId'], volume['VolumeId']) in seen:
+                                continue
+                            seen.add((attachment['InstanceId'], volume['VolumeId']))
+                            volumes_by_instance[attachment['InstanceId']].append({
+                                'VolumeId': volume['VolumeId'],
+                                'State': volume['State'],
+                                'Size': volume['Size'],
+                                'VolumeType': volume['VolumeType'],
+                                'AvailabilityZone': volume['AvailabilityZone'],
+                                'Device': attachment['Device'],
+                                'DeleteOnTermination': attachment.get('DeleteOnTermination', False)
+                            })
+            return volumes_by_instance
+            
+        except Exception as e:
+            handle_error(e, "listing volumes for instances")
+            raise
+
     def describe_volume(self, volume_id: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a volume
@@ -882,6 +957,9 @@ class EC2Manager:
             logger.error(f"Unexpected error terminating instance: {str(e)}")
             self._log_operation_metric(operation, False, time.time() - start_time)
             return False
+        finally:
+            # A failed or timed-out call may still have changed the state
+            self._describe_cache.pop(instance_id, None)
 
     def delete_volume(self, volume_id: str) -> bool:
         """
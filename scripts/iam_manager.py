@@ -1,5 +1,7 @@
 print("iam_manager: top of file")
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from botocore.exceptions import ClientError
 from scripts.utils import get_client, logger, handle_error
@@ -7,6 +9,19 @@ from config import settings
 import boto3
 from botocore.config import Config
 
+# Parallel ListAttachedRolePolicies calls when the snapshot cannot use
+# GetAccountAuthorizationDetails
+POLICY_PREFETCH_WORKERS = 8
+
+# IAM role names: 1-64 alphanumerics plus +=,.@_-
+_ROLE_NAME_RE = re.compile(r'[A-Za-z0-9+=,.@_-]{1,64}')
+
+# Trusted service principals for roles created from the GUI
+_ROLE_TYPE_SERVICES = {
+    'EC2': ['ec2.amazonaws.com'],
+    'Lambda': ['lambda.amazonaws.com'],
+}
+
 class IAMManager:
     def __init__(self):
         """Initialize IAM manager with AWS IAM client and configuration."""
@@ -54,15 +69,7 @@ class IAMManager:
         Returns:
             bool: True if valid, False otherwise
         """
-        if not role_name:
-            return False
-        if len(role_name) > 64:
-            return False
-        if not role_name[0].isalpha():
-            return False
-        if not all(c.isalnum() or c in ['_', '-', '@'] for c in role_name):
-            return False
-        return True
+        return bool(role_name and _ROLE_NAME_RE.fullmatch(role_name))
 
     def create_ec2_role(self, role_name: Optional[str] = None) -> Optional[str]:
         """Create IAM role for EC2 instances with minimal required permissions.
@@ -123,11 +130,42 @@ class IAMManager:
                 handle_error(e, "creating IAM role")
                 return None
 
-    def create_instance_profile(self, profile_name: Optional[str] = None) -> Optional[str]:
+    def create_role(self, role_name: str, description: str = '', role_type: str = 'EC2') -> Optional[Dict]:
+        """Create an IAM role trusted by the service matching role_type.
+        
+        Args:
+            role_name: Name of the IAM role
+            description: Optional role description
+            role_type: Either 'EC2' or 'Lambda'
+            
+        Returns:
+            Optional[Dict]: Created role details if successful, None otherwise
+        """
+        if not self._validate_role_name(role_name):
+            logger.error(f"Invalid role name: {role_name}")
+            return None
+        if role_type not in _ROLE_TYPE_SERVICES:
+            logger.error(f"Unsupported role type: {role_type}")
+            return None
+            
+        try:
+            response = self.iam_client.create_role(
+                RoleName=role_name,
+                AssumeRolePolicyDocument=self._create_assume_role_policy(_ROLE_TYPE_SERVICES[role_type]),
+                Description=description
+            )
+            logger.info(f"Created IAM role: {role_name}")
+            return response['Role']
+        except ClientError as e:
+            handle_error(e, f"creating role {role_name}")
+            return None
+
+    def create_instance_profile(self, profile_name: Optional[str] = None, path: str = '/') -> Optional[str]:
         """Create IAM instance profile and attach role with proper error handling.
         
         Args:
             profile_name: Optional name of the instance profile. If not provided, uses self.instance_profile_name
+            path: Path for a newly created instance profile
             
         Returns:
             str: Name of the instance profile or None if creation failed
@@ -153,7 +191,8 @@ class IAMManager:
                 try:
                     # Create the instance profile
                     self.iam_client.create_instance_profile(
-                        InstanceProfileName=profile_name
+                        InstanceProfileName=profile_name,
+                        Path=path
                     )
                     logger.info(f"Instance profile {profile_name} created")
                     
@@ -318,31 +357,98 @@ class IAMManager:
             return None
 
     def list_roles(self) -> List[Dict]:
-        """List all IAM roles.
+        """List all IAM roles, following pagination.
         
         Returns:
             List[Dict]: List of IAM roles
         """
         try:
-            response = self.iam_client.list_roles()
-            return response.get('Roles', [])
+            roles = []
+            paginator = self.iam_client.get_paginator('list_roles')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
+                roles.extend(page.get('Roles', []))
+            return roles
         except ClientError as e:
             handle_error(e, "listing IAM roles")
             return []
 
+    def count_users(self) -> int:
+        """Count IAM users, following pagination.
+        
+        Returns:
+            int: Number of IAM users
+        """
+        try:
+            paginator = self.iam_client.get_paginator('list_users')
+            return sum(len(page.get('Users', []))
+                       for page in paginator.paginate(PaginationConfig={'PageSize': 1000}))
+        except ClientError as e:
+            handle_error(e, "counting IAM users")
+            return 0
+
     def list_instance_profiles(self) -> List[Dict]:
-        """List all instance profiles.
+        """List all instance profiles, following pagination.
         
         Returns:
             List[Dict]: List of instance profiles
         """
         try:
-            response = self.iam_client.list_instance_profiles()
-            return response.get('InstanceProfiles', [])
+            profiles = []
+            paginator = self.iam_client.get_paginator('list_instance_profiles')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
+                profiles.extend(page.get('InstanceProfiles', []))
+            return profiles
         except ClientError as e:
             handle_error(e, "listing instance profiles")
             return []
 
+    def snapshot(self) -> Dict[str, Dict]:
+        """Fetch every IAM role together with its policies and instance profiles.
+        
+        Role listings are merged with GetAccountAuthorizationDetails so the
+        attached policies, instance profiles and last-used data for all roles
+        arrive in a handful of paginated calls instead of one lookup per role.
+        The listing supplies Description and MaxSessionDuration, which the
+        authorization details omit. If the caller lacks
+        iam:GetAccountAuthorizationDetails, attached policies are looked up
+        per role instead.
+        
+        Returns:
+            Dict[str, Dict]: Role details keyed by role name
+            
+        Raises:
+            ClientError: If authorization details fail for a reason other than access
+        """
+        roles = {role['RoleName']: role for role in self.list_roles()}
+        
+        try:
+            paginator = self.iam_client.get_paginator('get_account_authorization_details')
+            for page in paginator.paginate(Filter=['Role']):
+                for detail in page.get('RoleDetailList', []):
+                    roles.setdefault(detail['RoleName'], {}).update(detail)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AccessDenied':
+                handle_error(e, "fetching IAM authorization details")
+                raise
+            logger.warning("Not authorized for account authorization details, "
+                           "listing attached policies per role")
+            self._prefetch_attached_policies(roles)
+            
+        return roles
+
+    def _prefetch_attached_policies(self, roles: Dict[str, Dict]) -> None:
+        """Fill in AttachedManagedPolicies for every role with parallel lookups.
+        
+        Args:
+            roles: Role details keyed by role name, updated in place
+        """
+        if not roles:
+            return
+        names = list(roles)
+        with ThreadPoolExecutor(max_workers=min(POLICY_PREFETCH_WORKERS, len(names))) as executor:
+            for name, policies in zip(names, executor.map(self.list_attached_role_policies, names)):
+                roles[name]['AttachedManagedPolicies'] = policies
+
     def add_role_to_instance_profile(self, profile_name: str, role_name: str) -> bool:
         """Add a role to an instance profile.
         
@@ -474,8 +580,11 @@ class IAMManager:
             List[Dict]: List of attached policies
         """
         try:
-            response = self.iam_client.list_attached_role_policies(RoleName=role_name)
-            return response.get('AttachedPolicies', [])
+            policies = []
+            paginator = self.iam_client.get_paginator('list_attached_role_policies')
+            for page in paginator.paginate(RoleName=role_name):
+                policies.extend(page.get('AttachedPolicies', []))
+            return policies
         except ClientError as e:
             handle_error(e, f"listing attached policies for role {role_name}")
             return []
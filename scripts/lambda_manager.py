@@ -2,14 +2,24 @@ import os
 import zipfile
 import time
 import shutil
-import boto3
+import tempfile
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Union
 from botocore.exceptions import ClientError
 from botocore.config import Config
 from scripts.utils import get_client, logger, handle_error, wait_with_progress, ensure_directory_exists
+from scripts.s3_manager import TRANSFER_CONFIG
 from config import settings
 
+# Lambda rejects inline ZipFile payloads above 50 MB; larger packages go through S3
+LAMBDA_DIRECT_UPLOAD_LIMIT = 50 * 1024 * 1024
+
+# Parallel DescribeRule calls when listing a function's event rules
+RULE_DESCRIBE_WORKERS = 16
+RULE_DESCRIBE_EXECUTOR = ThreadPoolExecutor(max_workers=RULE_DESCRIBE_WORKERS,
+                                            thread_name_prefix='rule-describe')
+
 class LambdaManager:
     """Manages AWS Lambda functions and their associated resources."""
     
@@ -71,41 +81,115 @@ class LambdaManager:
         except Exception as e:
             logger.error(f"Failed to create Lambda ZIP: {str(e)}")
             return False
+
+    def create_lambda_zip_file(self, source_file: str) -> Optional[str]:
+        """Create a Lambda deployment package in a temporary file.
+        
+        The source is streamed into the archive on disk, so memory use does
+        not grow with the handler size. The caller removes the file.
+        
+        Args:
+            source_file: Path to the source Python file
+            
+        Returns:
+            Optional[str]: Path to the ZIP archive if successful, None otherwise
+        """
+        logger.info(f"Creating temporary Lambda ZIP package from {source_file}")
+        
+        if not os.path.exists(source_file):
+            logger.error(f"Source file '{source_file}' not found")
+            return None
+            
+        tf = tempfile.NamedTemporaryFile(suffix='.zip', delete=False)
+        try:
+            with tf, zipfile.ZipFile(tf, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as z:
+                z.write(source_file, arcname='lambda_function.py')
+            return tf.name
             
-    def deploy_lambda(self, role_arn: str) -> Optional[str]:
-        """Deploy Lambda function from ZIP file.
+        except Exception as e:
+            logger.error(f"Failed to create Lambda ZIP: {str(e)}")
+            os.remove(tf.name)
+            return None
+
+    def _package_file(self, code_file: str) -> Optional[str]:
+        """Resolve a deployment package, zipping plain source files to a temporary file.
+        
+        Args:
+            code_file: Path to a .zip package or a .py handler file
+            
+        Returns:
+            Optional[str]: Path to the ZIP archive if successful, None otherwise
+        """
+        if code_file.endswith('.zip'):
+            if not os.path.isfile(code_file):
+                logger.error(f"ZIP file '{code_file}' not found")
+                return None
+            return code_file
+        return self.create_lambda_zip_file(code_file)
+
+    def _code_location(self, function_name: str, package_path: str) -> Dict[str, Union[str, bytes]]:
+        """Build the Code argument for a package, staging large ones in S3.
+        
+        Args:
+            function_name: Name of the Lambda function the package belongs to
+            package_path: Path to the ZIP archive
+            
+        Returns:
+            Dict[str, Union[str, bytes]]: Either {'ZipFile': ...} or {'S3Bucket': ..., 'S3Key': ...}
+        """
+        if os.path.getsize(package_path) <= LAMBDA_DIRECT_UPLOAD_LIMIT:
+            with open(package_path, 'rb') as f:
+                return {'ZipFile': f.read()}
+            
+        s3_key = f"lambda-packages/{function_name}.zip"
+        logger.info(f"Package exceeds inline limit, staging in s3://{settings.S3_BUCKET_NAME}/{s3_key}")
+        get_client('s3').upload_file(package_path, settings.S3_BUCKET_NAME, s3_key, Config=TRANSFER_CONFIG)
+        return {'S3Bucket': settings.S3_BUCKET_NAME, 'S3Key': s3_key}
+            
+    def deploy_lambda(self, role_arn: str, function_name: Optional[str] = None,
+                      runtime: str = 'python3.9', handler: str = 'lambda_function.lambda_handler',
+                      memory_size: Optional[int] = None, timeout: Optional[int] = None,
+                      package_path: Optional[str] = None) -> Optional[str]:
+        """Deploy Lambda function from a ZIP package.
         
         Args:
             role_arn: ARN of the IAM role for the Lambda function
+            function_name: Optional function name. If not provided, uses self.function_name
+            runtime: Lambda runtime identifier
+            handler: Handler entry point
+            memory_size: Optional memory size in MB. Defaults to settings.LAMBDA_MEMORY_SIZE
+            timeout: Optional timeout in seconds. Defaults to settings.LAMBDA_TIMEOUT
+            package_path: Optional path to the ZIP archive. If not provided, self.zip_path is used
             
         Returns:
             Optional[str]: Function ARN if successful, None otherwise
         """
-        logger.info(f"Deploying Lambda function: {self.function_name}")
+        function_name = function_name or self.function_name
+        logger.info(f"Deploying Lambda function: {function_name}")
         
-        if not self._validate_function_name(self.function_name):
-            logger.error(f"Invalid function name: {self.function_name}")
+        if not self._validate_function_name(function_name):
+            logger.error(f"Invalid function name: {function_name}")
             return None
             
-        # Check if ZIP file exists
-        if not os.path.isfile(self.zip_path) or os.path.getsize(self.zip_path) == 0:
-            logger.error(f"ZIP file '{self.zip_path}' not found or empty")
+        package_path = package_path or self.zip_path
+        if not os.path.isfile(package_path) or os.path.getsize(package_path) == 0:
+            logger.error(f"ZIP file '{package_path}' not found or empty")
+            return None
+                
+        if not role_arn:
+            logger.error("No IAM role given for Lambda deployment")
             return None
             
         try:
-            # Read ZIP package
-            with open(self.zip_path, 'rb') as f:
-                zipped_code = f.read()
-                
             # Create Lambda function
             response = self.lambda_client.create_function(
-                FunctionName=self.function_name,
-                Runtime='python3.9',
+                FunctionName=function_name,
+                Runtime=runtime,
                 Role=role_arn,
-                Handler='lambda_function.lambda_handler',
-                Code={'ZipFile': zipped_code},
-                Timeout=settings.LAMBDA_TIMEOUT,
-                MemorySize=settings.LAMBDA_MEMORY_SIZE,
+                Handler=handler,
+                Code=self._code_location(function_name, package_path),
+                Timeout=timeout or settings.LAMBDA_TIMEOUT,
+                MemorySize=memory_size or settings.LAMBDA_MEMORY_SIZE,
                 Publish=True,
                 Environment={
                     'Variables': {
@@ -114,16 +198,16 @@ class LambdaManager:
                 }
             )
             
-            logger.info(f"Lambda function '{self.function_name}' created: {response['FunctionArn']}")
+            logger.info(f"Lambda function '{function_name}' created: {response['FunctionArn']}")
             return response['FunctionArn']
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'ResourceConflictException':
-                logger.info(f"Lambda function '{self.function_name}' already exists")
+                logger.info(f"Lambda function '{function_name}' already exists")
                 
                 # Get function info
-                function = self.lambda_client.get_function(FunctionName=self.function_name)
+                function = self.lambda_client.get_function(FunctionName=function_name)
                 return function['Configuration']['FunctionArn']
             else:
                 handle_error(e, "deploying Lambda function")
@@ -143,15 +227,11 @@ class LambdaManager:
             return False
             
         try:
-            # Read ZIP package
-            with open(self.zip_path, 'rb') as f:
-                zipped_code = f.read()
-                
             # Update function code
             response = self.lambda_client.update_function_code(
                 FunctionName=self.function_name,
-                ZipFile=zipped_code,
-                Publish=True
+                Publish=True,
+                **self._code_location(self.function_name, self.zip_path)
             )
             
             logger.info(f"Lambda function '{self.function_name}' updated: {response['FunctionArn']}")
@@ -160,6 +240,41 @@ class LambdaManager:
         except Exception as e:
             handle_error(e, "updating Lambda function")
             return False
+
+    def update_function(self, function_name: str, code_file: str) -> bool:
+        """Update a Lambda function's code from a .py or .zip file.
+        
+        Args:
+            function_name: Name of the Lambda function to update
+            code_file: Path to a .zip package or a .py handler file
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        logger.info(f"Updating Lambda function: {function_name}")
+        
+        package_path = self._package_file(code_file)
+        if not package_path:
+            return False
+            
+        try:
+            location = self._code_location(function_name, package_path)
+            response = self.lambda_client.update_function_code(
+                FunctionName=function_name,
+                Publish=True,
+                **location
+            )
+            
+            logger.info(f"Lambda function '{function_name}' updated: {response['FunctionArn']}")
+            return True
+            
+        except Exception as e:
+            handle_error(e, f"updating Lambda function {function_name}")
+            return False
+            
+        finally:
+            if package_path != code_file:
+                os.remove(package_path)
             
     def create_event_rule(self, schedule_expression: str = "rate(1 day)") -> Optional[str]:
         """Create CloudWatch event rule to trigger Lambda on a schedule.
@@ -177,7 +292,7 @@ class LambdaManager:
         
         try:
             # Get AWS account ID
-            sts_client = boto3.client('sts')
+            sts_client = get_client('sts')
             account_id = sts_client.get_caller_identity()['Account']
             
             # Create rule
@@ -254,8 +369,21 @@ class LambdaManager:
             handle_error(e, f"deleting event rule {rule_name}")
             return False
 
+    def iter_function_pages(self, page_size: int = 50):
+        """Yield Lambda function names one ListFunctions page at a time.
+        
+        Args:
+            page_size: Functions requested per page (ListFunctions allows at most 50)
+            
+        Yields:
+            List[str]: The function names on each page
+        """
+        paginator = self.lambda_client.get_paginator('list_functions')
+        for page in paginator.paginate(PaginationConfig={'PageSize': page_size}):
+            yield [f['FunctionName'] for f in page.get('Functions', [])]
+
     def list_functions(self) -> List[str]:
-        """List Lambda functions.
+        """List Lambda functions, following pagination.
         
         Returns:
             List[str]: List of function names
@@ -263,10 +391,10 @@ class LambdaManager:
         logger.info("Listing Lambda functions")
         
         try:
-            response = self.lambda_client.list_functions()
-            functions = response.get('Functions', [])
+            function_names = []
+            for page in self.iter_function_pages():
+                function_names.extend(page)
             
-            function_names = [f['FunctionName'] for f in functions]
             logger.info(f"Found {len(function_names)} Lambda functions")
             return function_names
             
@@ -382,18 +510,33 @@ class LambdaManager:
             handle_error(e, f"getting event rule {rule_name}")
             return None
 
-    def list_event_rules(self, function_name: str) -> List[Dict]:
-        """List event rules for a Lambda function.
+    def list_event_rules(self, function_name: str, function_arn: Optional[str] = None) -> List[Dict]:
+        """List event rules that target a Lambda function.
+        
+        Rule names are listed by target, then described in parallel so the
+        wall clock is about one round trip rather than one per rule.
         
         Args:
             function_name: Name of the Lambda function
+            function_arn: Optional ARN of the function. If not provided, it is
+                looked up with GetFunctionConfiguration
             
         Returns:
             List[Dict]: List of event rules
         """
+        events_client = get_client('events')
         try:
-            response = self.lambda_client.list_event_rules(FunctionName=function_name)
-            return response.get('Rules', [])
+            if function_arn is None:
+                function_arn = self.lambda_client.get_function_configuration(
+                    FunctionName=function_name)['FunctionArn']
+            paginator = events_client.get_paginator('list_rule_names_by_target')
+            names = [name
+                     for page in paginator.paginate(TargetArn=function_arn)
+                     for name in page.get('RuleNames', [])]
+            if not names:
+                return []
+                
+            return list(RULE_DESCRIBE_EXECUTOR.map(lambda name: events_client.describe_rule(Name=name), names))
         except ClientError as e:
             handle_error(e, f"listing event rules for {function_name}")
             return []
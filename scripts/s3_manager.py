@@ -2,9 +2,20 @@ import os
 import json
 from typing import List, Dict, Optional, Union, Any
 from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from scripts.utils import get_client, get_resource, logger, handle_error, ensure_directory_exists
 from config import settings
 
+# Large files go multipart (ranged GETs for downloads) with parts moved in
+# parallel; max_concurrency stays below the client's max_pool_connections
+# so parts never wait on a socket
+TRANSFER_CONFIG = TransferConfig(
+    max_concurrency=10,
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=True
+)
+
 class S3Manager:
     """A class to manage S3 bucket operations with enhanced functionality."""
     
@@ -119,9 +130,19 @@ class S3Manager:
             handle_error(e, "enabling bucket encryption")
             return False
             
-    def upload_file(self, file_path=settings.LOCAL_UPLOAD_FILE, key=settings.S3_OBJECT_KEY):
-        """Upload a file to the S3 bucket"""
-        logger.info(f"Uploading file {file_path} to bucket {self.bucket_name} with key {key}")
+    def upload_file(self, file_path=settings.LOCAL_UPLOAD_FILE, key=None, bucket_name: str = None):
+        """Upload a file to the S3 bucket
+        
+        Args:
+            file_path (str): The local file to upload
+            key (str, optional): The object key. Defaults to the configured key, or the
+                file's base name when uploading to an explicitly named bucket.
+            bucket_name (str, optional): The name of the bucket. If not provided, uses the configured bucket name.
+        """
+        if key is None:
+            key = os.path.basename(file_path) if bucket_name else settings.S3_OBJECT_KEY
+        bucket_name = bucket_name or self.bucket_name
+        logger.info(f"Uploading file {file_path} to bucket {bucket_name} with key {key}")
         
         if not os.path.isfile(file_path):
             logger.error(f"Upload failed: local file '{file_path}' not found")
@@ -130,24 +151,67 @@ class S3Manager:
         try:
             self.s3_client.upload_file(
                 Filename=file_path,
-                Bucket=self.bucket_name,
+                Bucket=bucket_name,
                 Key=key,
-                ExtraArgs={'ServerSideEncryption': 'AES256'}
+                ExtraArgs={'ServerSideEncryption': 'AES256'},
+                Config=TRANSFER_CONFIG
             )
             
-            logger.info(f"Uploaded '{file_path}' to 's3://{self.bucket_name}/{key}'")
+            logger.info(f"Uploaded '{file_path}' to 's3://{bucket_name}/{key}'")
             return True
             
         except Exception as e:
             handle_error(e, "uploading file to S3")
             return False
             
-    def download_file(self, key=settings.S3_OBJECT_KEY, download_path=None):
-        """Download a file from the S3 bucket"""
+    def upload_files(self, file_paths: List[str], bucket_name: str = None) -> List[str]:
+        """Upload many files concurrently, each keyed by its base name
+        
+        Args:
+            file_paths (List[str]): The local files to upload
+            bucket_name (str, optional): The name of the bucket. If not provided, uses the configured bucket name.
+            
+        Returns:
+            List[str]: The paths that failed to upload
+        """
+        bucket_name = bucket_name or self.bucket_name
+        logger.info(f"Uploading {len(file_paths)} files to bucket {bucket_name}")
+        
+        failed = [path for path in file_paths if not os.path.isfile(path)]
+        for path in failed:
+            logger.error(f"Upload failed: local file '{path}' not found")
+            
+        with create_transfer_manager(self.s3_client, TRANSFER_CONFIG) as transfer_manager:
+            futures = [
+                (path, transfer_manager.upload(
+                    path, bucket_name, os.path.basename(path),
+                    extra_args={'ServerSideEncryption': 'AES256'}
+                ))
+                for path in file_paths if path not in failed
+            ]
+            for path, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    handle_error(e, f"uploading '{path}' to S3")
+                    failed.append(path)
+                    
+        logger.info(f"Uploaded {len(file_paths) - len(failed)} files to bucket {bucket_name}")
+        return failed
+            
+    def download_file(self, key=settings.S3_OBJECT_KEY, download_path=None, bucket_name: str = None):
+        """Download a file from the S3 bucket, streaming it to disk in parallel ranged parts
+        
+        Args:
+            key (str): The key of the object to download
+            download_path (str, optional): Where to write the file. Defaults to the download directory.
+            bucket_name (str, optional): The name of the bucket. If not provided, uses the configured bucket name.
+        """
+        bucket_name = bucket_name or self.bucket_name
         if download_path is None:
             download_path = os.path.join(settings.LOCAL_DOWNLOAD_DIR, os.path.basename(key))
             
-        logger.info(f"Downloading s3://{self.bucket_name}/{key} to {download_path}")
+        logger.info(f"Downloading s3://{bucket_name}/{key} to {download_path}")
         
         # Ensure the target directory exists
         target_dir = os.path.dirname(download_path)
@@ -155,12 +219,13 @@ class S3Manager:
         
         try:
             self.s3_client.download_file(
-                Bucket=self.bucket_name,
+                Bucket=bucket_name,
                 Key=key,
-                Filename=download_path
+                Filename=download_path,
+                Config=TRANSFER_CONFIG
             )
             
-            logger.info(f"Downloaded 's3://{self.bucket_name}/{key}' to '{download_path}'")
+            logger.info(f"Downloaded 's3://{bucket_name}/{key}' to '{download_path}'")
             return True
             
         except Exception as e:
@@ -236,6 +301,39 @@ class S3Manager:
             handle_error(e, f"deleting object '{key}' from S3")
             return False
             
+    def delete_objects(self, keys: List[str], bucket_name: str = None) -> bool:
+        """Delete many objects from the S3 bucket with batched DeleteObjects calls
+        
+        Args:
+            keys (List[str]): The keys of the objects to delete
+            bucket_name (str, optional): The name of the bucket. If not provided, uses the configured bucket name.
+            
+        Returns:
+            bool: True if every object was deleted, False otherwise
+        """
+        bucket_name = bucket_name or self.bucket_name
+        logger.info(f"Deleting {len(keys)} objects from bucket '{bucket_name}'")
+        
+        try:
+            failed = []
+            # DeleteObjects accepts at most 1000 keys per request
+            for offset in range(0, len(keys), 1000):
+                chunk = keys[offset:offset + 1000]
+                response = self.s3_client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True}
+                )
+                failed.extend(response.get('Errors', []))
+                
+            for error in failed:
+                logger.error(f"Failed to delete 's3://{bucket_name}/{error['Key']}': {error['Code']} - {error['Message']}")
+            logger.info(f"Deleted {len(keys) - len(failed)} objects from bucket '{bucket_name}'")
+            return not failed
+            
+        except Exception as e:
+            handle_error(e, f"deleting objects from S3 bucket '{bucket_name}'")
+            return False
+            
     def list_objects(self, prefix=None):
         """List objects in the S3 bucket with optional prefix"""
         logger.info(f"Listing objects in bucket {self.bucket_name}")
@@ -2,6 +2,8 @@ import boto3
 import logging
 import os
 import time
+import threading
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import sys
 import json
@@ -53,6 +55,21 @@ def setup_logging() -> logging.Logger:
 
 logger = setup_logging()
 
+# Shared by every client so concurrent workers reuse pooled connections.
+# The pool covers the fan-out executor, S3 transfer threads and tab workers
+# at once; read_timeout keeps botocore's default so synchronous Lambda
+# invocations are not cut short.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    connect_timeout=5,
+    tcp_keepalive=True,
+    retries={'max_attempts': 5, 'mode': 'adaptive'}
+)
+
+# Clients are thread-safe once built; building them from a session is not
+_clients = {}
+_clients_lock = threading.Lock()
+
 @lru_cache(maxsize=32)
 def create_session(region: str = settings.AWS_REGION) -> boto3.Session:
     """
@@ -79,7 +96,10 @@ def create_session(region: str = settings.AWS_REGION) -> boto3.Session:
 
 def get_client(service: str, region: str = settings.AWS_REGION) -> Any:
     """
-    Get a boto3 client for the specified service.
+    Get a cached boto3 client for the specified service.
+    
+    Clients are created once per (service, region) with the shared
+    CLIENT_CONFIG and reused across managers, tabs and worker threads.
     
     Args:
         service (str): AWS service name (e.g., 'ec2', 's3')
@@ -95,8 +115,15 @@ def get_client(service: str, region: str = settings.AWS_REGION) -> Any:
     try:
         if not service:
             raise ValueError("Service name cannot be empty")
-        session = create_session(region)
-        return session.client(service)
+        key = (service, region)
+        client = _clients.get(key)
+        if client is None:
+            with _clients_lock:
+                client = _clients.get(key)
+                if client is None:
+                    client = create_session(region).client(service, config=CLIENT_CONFIG)
+                    _clients[key] = client
+        return client
     except Exception as e:
         logger.error(f"Failed to create {service} client: {str(e)}")
         raise
@@ -120,7 +147,7 @@ def get_resource(service: str, region: str = settings.AWS_REGION) -> Any:
         if not service:
             raise ValueError("Service name cannot be empty")
         session = create_session(region)
-        return session.resource(service)
+        return session.resource(service, config=CLIENT_CONFIG)
     except Exception as e:
         logger.error(f"Failed to create {service} resource: {str(e)}")
         raise
@@ -260,6 +287,83 @@ def get_custom_cloudwatch_metric(namespace, metric_name, dimensions, period=300,
         logger.error(f"Error fetching custom metric {namespace}/{metric_name}: {e}")
         return []
 
+# GetMetricData accepts at most 500 queries per request
+METRIC_DATA_BATCH_SIZE = 500
+
+def _metric_dimensions(dimensions):
+    """Normalise dimensions given as {'Name': ..., 'Value': ...} dicts or {name: value} maps."""
+    result = []
+    for d in dimensions:
+        if set(d) == {'Name', 'Value'}:
+            result.append({'Name': d['Name'], 'Value': d['Value']})
+        else:
+            result.extend({'Name': k, 'Value': v} for k, v in d.items())
+    return result
+
+def get_custom_cloudwatch_metrics_batch(queries, start_time=None, end_time=None):
+    """Fetch several CloudWatch metrics with as few GetMetricData calls as possible.
+    
+    Each query is a dict with namespace, metric_name, dimensions, period and
+    stat keys. Results come back in query order, each as a list of
+    {'Timestamp': ..., <stat>: value} datapoints like get_metric_statistics.
+    Errors are logged and re-raised.
+    """
+    cloudwatch = get_client('cloudwatch')
+    if not end_time:
+        end_time = datetime.utcnow()
+    if not start_time:
+        start_time = end_time - timedelta(hours=1)
+    results = [[] for _ in queries]
+    try:
+        for offset in range(0, len(queries), METRIC_DATA_BATCH_SIZE):
+            chunk = queries[offset:offset + METRIC_DATA_BATCH_SIZE]
+            metric_queries = [{
+                'Id': f"q{offset + i}",
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': q['namespace'],
+                        'MetricName': q['metric_name'],
+                        'Dimensions': _metric_dimensions(q['dimensions'])
+                    },
+                    'Period': q['period'],
+                    'Stat': q['stat']
+                },
+                'ReturnData': True
+            } for i, q in enumerate(chunk)]
+            kwargs = {'MetricDataQueries': metric_queries, 'StartTime': start_time, 'EndTime': end_time}
+            while True:
+                resp = cloudwatch.get_metric_data(**kwargs)
+                for result in resp.get('MetricDataResults', []):
+                    index = int(result['Id'][1:])
+                    stat = queries[index]['stat']
+                    results[index].extend(
+                        {'Timestamp': ts, stat: value}
+                        for ts, value in zip(result.get('Timestamps', []), result.get('Values', []))
+                    )
+                if not resp.get('NextToken'):
+                    break
+                kwargs['NextToken'] = resp['NextToken']
+    except Exception as e:
+        # Propagate so callers do not cache a blank batch as a success
+        logger.error(f"Error fetching custom metrics batch: {e}")
+        raise
+    return results
+
+def get_rds_metrics_batch(db_instance_id, metric_names, period=300, start_time=None, end_time=None):
+    """Fetch several CloudWatch metrics for an RDS instance in one GetMetricData call.
+    
+    Returns a list of datapoint lists in metric_names order, shaped like
+    get_rds_metrics results.
+    """
+    queries = [{
+        'namespace': 'AWS/RDS',
+        'metric_name': metric_name,
+        'dimensions': [{'Name': 'DBInstanceIdentifier', 'Value': db_instance_id}],
+        'period': period,
+        'stat': 'Average'
+    } for metric_name in metric_names]
+    return get_custom_cloudwatch_metrics_batch(queries, start_time, end_time)
+
 def get_cost_explorer_data(breakdown, time_range):
     """Fetch cost data from AWS Cost Explorer API."""
     ce = get_client('ce')